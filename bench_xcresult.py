@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark parse_xcresult.py against synthetic fixture bundles.
+
+Generates directory-of-JSON fixture bundles (see FixtureSource in
+parse_xcresult.py) and measures, for each parsing mode, wall time, the
+number of xcresulttool lookups (i.e. subprocesses the xcrun backend would
+spawn) and peak RSS. Every measurement runs in a fresh interpreter so RSS
+figures are not polluted by earlier runs. Runs on Linux without Xcode.
+
+Usage:
+    python bench_xcresult.py [--sizes 10,1000,50000] [--modes default,batch,stream]
+                             [--failure-rate 0.05] [--fixtures-dir DIR] [--json OUT]
+"""
+
+import argparse
+import json
+import multiprocessing
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+MODES = {
+    'default': {},
+    'batch': {'batch': True},
+    'stream': {'stream': True},
+    'stream-batch': {'stream': True, 'batch': True},
+}
+
+# Executed in a child interpreter: parse one bundle and report counters as JSON
+_CHILD = """
+import json, os, resource, sys, time
+from contextlib import redirect_stdout
+sys.path.insert(0, {script_dir!r})
+import parse_xcresult as px
+source = px.FixtureSource({bundle!r})
+start = time.perf_counter()
+with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+    px.summarise(source, None, jobs={jobs}, **{options!r})
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform != 'darwin':
+    rss *= 1024  # Linux reports KiB, macOS bytes
+print(json.dumps({{'seconds': elapsed, 'calls': source.calls, 'peak_rss': rss}}))
+"""
+
+
+def _value(v, type_name='String') -> dict:
+    return {'_type': {'_name': type_name}, '_value': str(v)}
+
+
+def _array(items: List[dict]) -> dict:
+    return {'_type': {'_name': 'Array'}, '_values': items}
+
+
+def write_synthetic_bundle(directory: Path, tests: int, failure_rate: float = 0.05) -> Path:
+    """Write a fixture bundle with `tests` ActionTestMetadata nodes and their summaries."""
+    directory.mkdir(parents=True, exist_ok=True)
+    fail_every = int(1 / failure_rate) if failure_rate > 0 else 0
+    failed = 0
+    metadata = []
+
+    for i in range(tests):
+        ref = f"0~summary-{i:06d}"
+        is_failure = fail_every and i % fail_every == 0
+        failed += 1 if is_failure else 0
+        metadata.append({
+            '_type': {'_name': 'ActionTestMetadata'},
+            'duration': _value(f"{1 + (i % 97) / 10:.2f}", 'Double'),
+            'identifier': _value(f"RunnerTests/test_{i:06d}()"),
+            'name': _value(f"test_{i:06d}()"),
+            'summaryRef': {'_type': {'_name': 'Reference'}, 'id': _value(ref)},
+            'testStatus': _value('Failure' if is_failure else 'Success'),
+        })
+
+        activities = [{
+            '_type': {'_name': 'ActionTestActivitySummary'},
+            'title': _value('Assertion failure: expected Welcome to Ash Trail'
+                            if is_failure else f"Tap button {j}"),
+        } for j in range(3)]
+        summary = {
+            '_type': {'_name': 'ActionTestSummary'},
+            'activitySummaries': _array(activities),
+            'name': _value(f"test_{i:06d}()"),
+        }
+        if is_failure:
+            summary['failureSummaries'] = _array([{
+                '_type': {'_name': 'ActionTestFailureSummary'},
+                'fileName': _value('integration_test/gmail_multi_account_test.dart'),
+                'lineNumber': _value(100 + i % 50, 'Int'),
+                'message': _value(f"Expected: exactly one matching node (test {i})"),
+            }])
+        (directory / f"{ref}.json").write_text(json.dumps(summary), encoding='utf-8')
+
+    tests_ref = {
+        '_type': {'_name': 'ActionTestPlanRunSummaries'},
+        'summaries': _array([{
+            '_type': {'_name': 'ActionTestPlanRunSummary'},
+            'testableSummaries': _array([{
+                '_type': {'_name': 'ActionTestableSummary'},
+                'name': _value('RunnerTests'),
+                'tests': _array(metadata),
+            }]),
+        }]),
+    }
+    (directory / '0~tests-ref.json').write_text(json.dumps(tests_ref), encoding='utf-8')
+
+    root = {
+        '_type': {'_name': 'ActionsInvocationRecord'},
+        'metrics': {'testsCount': _value(tests, 'Int'), 'testsFailedCount': _value(failed, 'Int')},
+        'issues': {},
+        'actions': _array([{
+            '_type': {'_name': 'ActionRecord'},
+            'title': _value('Testing workspace Runner'),
+            'result': _value('failed' if failed else 'succeeded'),
+            'actionResult': {'testsRef': {'_type': {'_name': 'Reference'}, 'id': _value('0~tests-ref')}},
+        }]),
+    }
+    (directory / 'root.json').write_text(json.dumps(root), encoding='utf-8')
+    return directory
+
+
+def measure(bundle: Path, options: dict, jobs: int) -> Dict[str, float]:
+    """Parse `bundle` in a fresh interpreter and return its timing and counters."""
+    code = _CHILD.format(script_dir=str(SCRIPT_DIR), bundle=str(bundle), jobs=jobs, options=options)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parse_xcresult.py on synthetic bundles')
+    parser.add_argument('--sizes', default='10,1000,50000',
+                        help='Comma-separated test counts (default: 10,1000,50000)')
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help=f"Comma-separated modes (default: {','.join(MODES)})")
+    parser.add_argument('--jobs', type=int, default=8, help='Worker count for batch modes')
+    parser.add_argument('--failure-rate', type=float, default=0.05,
+                        help='Fraction of synthetic tests that fail (default: 0.05)')
+    parser.add_argument('--fixtures-dir', type=Path, default=None,
+                        help='Keep generated bundles here instead of a temp directory')
+    parser.add_argument('--json', type=Path, default=None, help='Also write results as JSON')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        print(f"❌ Error: Unknown mode(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    if not 0 <= args.failure_rate <= 1:
+        print(f"❌ Error: --failure-rate must be between 0 and 1, got {args.failure_rate}", file=sys.stderr)
+        return 2
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.fixtures_dir or Path(tmp)
+        print(f"{'tests':>8}  {'mode':<14}{'seconds':>10}{'calls':>10}{'peak RSS':>12}")
+        for size in sizes:
+            bundle = root / f"bundle_{size}"
+            # Generate in a child so this process stays small: Linux children
+            # inherit the parent's RSS high-water mark across fork/exec
+            generator = multiprocessing.Process(target=write_synthetic_bundle,
+                                                args=(bundle, size, args.failure_rate))
+            generator.start()
+            generator.join()
+            if generator.exitcode != 0:
+                # The child's traceback is already on stderr; never benchmark a stale bundle
+                print(f"❌ Error: Generating {bundle} failed (exit code {generator.exitcode})", file=sys.stderr)
+                return 2
+            for mode in modes:
+                stats = measure(bundle, MODES[mode], args.jobs)
+                results.append({'tests': size, 'mode': mode, **stats})
+                print(f"{size:>8}  {mode:<14}{stats['seconds']:>10.3f}{stats['calls']:>10}"
+                      f"{stats['peak_rss'] / 2**20:>10.1f}MB")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"\n✓ Wrote {len(results)} results to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Benchmark the documentation validation engine on synthetic markdown corpora.
+
+Generates numbered plan-style documents with configurable file count, lines
+per file and heading / code-fence / table density, then measures for each
+corpus: tokenizer time, wall time of every rule on its own, full engine wall
+time and throughput (lines/s), and peak traced memory. validate_docs.py and
+validate_docs_extended.py share one engine, so every rule of both is covered.
+
+Results can be saved as a JSON baseline and later compared against it; the
+comparison exits with status 1 when any timing grows past --threshold.
+
+Usage:
+    python bench_validators.py [--files 10,100,500] [--lines 200]
+                               [--heading-density 0.05] [--fence-density 0.02]
+                               [--table-density 0.02] [--repeat 3]
+                               [--json OUT] [--baseline BASELINE.json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+from markdown_tokens import MarkdownDocument
+from terminology import TermIndex
+from validate_docs import CROSS_FILE_RULES, FILE_RULES, DocumentValidator, resolve_rules
+
+# Timings below this many seconds are too noisy to call a regression
+MIN_REGRESSION_SECONDS = 0.002
+
+WORDS = ('cache', 'session', 'Riverpod', 'riverpod', 'Hive', 'sync', 'Firestore', 'state',
+         'account', 'log', 'entry', 'widget', 'repository', 'provider', 'error', 'retry')
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _table(rng: random.Random) -> List[str]:
+    """A 2-4 column table whose separator mixes dash widths, alignment colons and cell padding."""
+    columns = rng.randint(2, 4)
+    cells = []
+    for _ in range(columns):
+        dashes = '-' * (3 if rng.random() < 0.5 else rng.randint(5, 12))
+        align = rng.random()
+        cell = f":{dashes[1:]}" if align < 0.2 else f":{dashes[2:]}:" if align < 0.3 else dashes
+        cells.append(cell)
+    padded = rng.random() < 0.3
+    separator = '|' + '|'.join(f" {c} " if padded else c for c in cells) + '|'
+    header = '| ' + ' | '.join(f"Col {i}" for i in range(columns)) + ' |'
+    rows = ['| ' + ' | '.join(rng.choice(WORDS) for _ in range(columns)) + ' |'
+            for _ in range(rng.randint(2, 6))]
+    return [header, separator] + rows + ['']
+
+
+def write_synthetic_corpus(directory: Path, files: int, lines: int, heading_density: float,
+                           fence_density: float, table_density: float, seed: int = 0) -> int:
+    """Write `files` markdown documents of about `lines` lines each; return the total line count."""
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    total = 0
+
+    for doc_num in range(1, files + 1):
+        out = [f"## {doc_num}. Synthetic Document {doc_num}", '']
+        section = subsection = 0
+        while len(out) < lines:
+            roll = rng.random()
+            if roll < heading_density:
+                if subsection or rng.random() < 0.5:
+                    section += 1
+                    subsection = 0
+                    out += [f"### {doc_num}.{section} {_sentence(rng, 3)[:-1]}", '']
+                else:
+                    subsection += 1
+                    out += [f"#### {doc_num}.{section}.{subsection} {_sentence(rng, 2)[:-1]}", '']
+            elif roll < heading_density + fence_density:
+                out += ['```dart'] + [f"final x{i} = {i};" for i in range(rng.randint(3, 12))] + ['```', '']
+            elif roll < heading_density + fence_density + table_density:
+                out += _table(rng)
+            elif roll < 0.75:
+                # Occasional trailing whitespace and long lines keep those rules busy
+                text = _sentence(rng, rng.randint(6, 30))
+                out.append(text + ('  ' if rng.random() < 0.05 else ''))
+            else:
+                out += [f"- {_sentence(rng, rng.randint(3, 10))}" for _ in range(rng.randint(2, 5))] + ['']
+        (directory / f"{doc_num}. Synthetic Document {doc_num}.md").write_text(
+            '\n'.join(out) + '\n', encoding='utf-8')
+        total += len(out)
+
+    return total
+
+
+def _best_of(repeat: int, func) -> float:
+    """Minimum wall time of `repeat` calls to func()."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(corpus: Path, rules: List[str], repeat: int) -> Dict[str, object]:
+    """Time the tokenizer, each rule alone and the whole engine on one corpus."""
+    md_files = sorted(corpus.glob('*.md'))
+    texts = [(f, f.read_text(encoding='utf-8').splitlines(keepends=True)) for f in md_files]
+    total_lines = sum(len(lines) for _, lines in texts)
+
+    docs = []
+    tokenize_seconds = _best_of(repeat, lambda: docs.__setitem__(
+        slice(None), [(f, MarkdownDocument(f.name, lines)) for f, lines in texts]))
+
+    validator = DocumentValidator(corpus)
+    rule_seconds = {}
+    for rule in rules:
+        if rule in FILE_RULES:
+            check = getattr(validator, FILE_RULES[rule])
+
+            def run_rule():
+                validator.issues = []
+                for f, doc in docs:
+                    check(f, doc)
+        elif rule in CROSS_FILE_RULES:
+            check = getattr(validator, CROSS_FILE_RULES[rule])
+
+            def run_rule():
+                # Collection from the parsed documents plus the cross-file pass itself
+                validator.issues = []
+                validator.term_index = TermIndex()
+                validator.all_headings = []
+                validator.file_names = [f.name for f, _ in docs]
+                for f, doc in docs:
+                    headings, terms = validator._collect_file_data(doc)
+                    validator.all_headings.extend(headings)
+                    validator.term_index.add_file(f.name, terms)
+                check()
+        else:
+            continue
+        rule_seconds[rule] = _best_of(repeat, run_rule)
+
+    engine = DocumentValidator(corpus)
+    engine_seconds = _best_of(repeat, lambda: engine.validate_all(rules, []))
+
+    tracemalloc.start()
+    DocumentValidator(corpus).validate_all(rules, [])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'lines': total_lines,
+        'issues': len(engine.issues),
+        'tokenize_seconds': tokenize_seconds,
+        'rule_seconds': rule_seconds,
+        'engine_seconds': engine_seconds,
+        'lines_per_second': total_lines / engine_seconds if engine_seconds else 0.0,
+        'peak_memory': peak,
+    }
+
+
+def _timings(result: dict) -> Dict[str, float]:
+    """Flatten a result's timings into name -> seconds."""
+    timings = {'tokenize': result['tokenize_seconds'], 'engine': result['engine_seconds']}
+    timings.update({f"rule:{rule}": seconds for rule, seconds in result['rule_seconds'].items()})
+    return timings
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float) -> List[str]:
+    """Describe every timing that grew more than `threshold` over the matching baseline corpus."""
+    by_corpus = {json.dumps(b['corpus'], sort_keys=True): b for b in baseline}
+    regressions = []
+    for result in results:
+        base = by_corpus.get(json.dumps(result['corpus'], sort_keys=True))
+        if base is None:
+            continue
+        base_timings = _timings(base)
+        for name, seconds in _timings(result).items():
+            before = base_timings.get(name)
+            if before is None or seconds - before < MIN_REGRESSION_SECONDS:
+                continue
+            if seconds > before * (1 + threshold):
+                regressions.append(f"{result['corpus']['files']} files: {name} "
+                                   f"{before * 1000:.1f} ms -> {seconds * 1000:.1f} ms "
+                                   f"(+{(seconds / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the documentation validators on synthetic corpora')
+    parser.add_argument('--files', default='10,100,500',
+                        help='Comma-separated corpus sizes in files (default: 10,100,500)')
+    parser.add_argument('--lines', type=int, default=200, help='Lines per file (default: 200)')
+    parser.add_argument('--heading-density', type=float, default=0.05,
+                        help='Chance a block is a heading (default: 0.05)')
+    parser.add_argument('--fence-density', type=float, default=0.02,
+                        help='Chance a block is a fenced code block (default: 0.02)')
+    parser.add_argument('--table-density', type=float, default=0.02,
+                        help='Chance a block is a table (default: 0.02)')
+    parser.add_argument('--rules', default='all', help='Rules or rule sets to time (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per timing; the best is kept (default: 3)')
+    parser.add_argument('--corpus-dir', type=Path, default=None,
+                        help='Keep generated corpora here instead of a temp directory')
+    parser.add_argument('--json', type=Path, default=None, help='Write results as a JSON baseline')
+    parser.add_argument('--baseline', type=Path, default=None, help='Compare against this JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown against the baseline before failing (default: 0.25)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.files.split(',') if s.strip()]
+    rules = resolve_rules(args.rules)
+    unknown = [r for r in rules if r not in FILE_RULES and r not in CROSS_FILE_RULES]
+    if unknown or not rules:
+        print(f"❌ Error: Unknown rule(s): {', '.join(unknown) or args.rules}", file=sys.stderr)
+        return 2
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.corpus_dir or Path(tmp)
+        print(f"{'files':>6}{'lines':>9}{'tokenize':>11}{'engine':>10}{'lines/s':>11}{'peak mem':>11}")
+        for size in sizes:
+            corpus = {
+                'files': size,
+                'lines': args.lines,
+                'heading_density': args.heading_density,
+                'fence_density': args.fence_density,
+                'table_density': args.table_density,
+            }
+            directory = root / f"corpus_{size}"
+            write_synthetic_corpus(directory, size, args.lines, args.heading_density,
+                                   args.fence_density, args.table_density)
+            stats = measure(directory, rules, args.repeat)
+            results.append({'corpus': corpus, **stats})
+            print(f"{size:>6}{stats['lines']:>9}{stats['tokenize_seconds'] * 1000:>9.1f}ms"
+                  f"{stats['engine_seconds'] * 1000:>8.0f}ms{stats['lines_per_second']:>11.0f}"
+                  f"{stats['peak_memory'] / 2**20:>9.1f}MB")
+
+    # Per-rule breakdown for the largest corpus, slowest first
+    largest = results[-1]
+    print(f"\nPer-rule time on {largest['corpus']['files']} files:")
+    for rule, seconds in sorted(largest['rule_seconds'].items(), key=lambda item: -item[1]):
+        print(f"  {rule:<26}{seconds * 1000:>9.1f} ms")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"\n✓ Wrote {len(results)} results to {args.json}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} timing(s) regressed more than {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\n✅ No timing regressed more than {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Git-diff scoping for the documentation validators (--changed-since / --staged).
+
+Asks git which markdown files directly inside the docs directory changed,
+and which lines of their new version the diff hunks cover, so the engine can
+validate only those files and report line-local issues only on changed lines.
+"""
+
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# New-side range of a zero-context hunk: "@@ -12,3 +14,5 @@" -> lines 14..18
+HUNK_PATTERN = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+class GitScopeError(Exception):
+    """git could not be run or rejected the requested comparison."""
+
+
+def _git(root: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(['git', '-C', str(root), '-c', 'core.quotepath=off', *args],
+                                capture_output=True, text=True, encoding='utf-8')
+    except OSError as e:
+        raise GitScopeError(f"Unable to run git: {e}") from e
+    if result.returncode != 0:
+        raise GitScopeError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout
+
+
+def repo_root(path: Path) -> Path:
+    """Top level of the git work tree containing `path`."""
+    return Path(_git(path, 'rev-parse', '--show-toplevel').strip())
+
+
+def _unquote(path: str) -> str:
+    # git quotes names containing '"', '\\' or control characters
+    if len(path) > 1 and path[0] == path[-1] == '"':
+        return path[1:-1].encode('latin-1', 'backslashreplace').decode('unicode_escape')
+    return path
+
+
+def parse_diff(diff: str) -> Dict[str, Set[int]]:
+    """Map each file in a `git diff --unified=0 --no-prefix` to the new-side line numbers it changes."""
+    changes: Dict[str, Set[int]] = {}
+    current: Optional[Set[int]] = None
+    in_header = False
+
+    for line in diff.splitlines():
+        if line.startswith('diff --git '):
+            in_header, current = True, None
+        elif in_header and line.startswith('+++ '):
+            in_header = False
+            path = line[4:]
+            # Names containing spaces are followed by a tab
+            path = _unquote(path[:-1] if path.endswith('\t') else path)
+            # Deleted files have no new side
+            current = None if path == '/dev/null' else changes.setdefault(path, set())
+        elif not in_header and current is not None:
+            if match := HUNK_PATTERN.match(line):
+                start = int(match.group(1))
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                current.update(range(start, start + count))
+
+    return changes
+
+
+def changed_markdown(docs_path: Path, since: Optional[str] = None,
+                     staged: bool = False) -> Dict[str, Optional[Set[int]]]:
+    """Changed *.md files directly in docs_path -> changed line numbers (None: the whole file is new).
+
+    With `staged`, compares the index against HEAD; otherwise compares the
+    working tree against `since` and also counts untracked files.
+    """
+    root = repo_root(docs_path)
+    docs_dir = Path(os.path.relpath(docs_path.resolve(), root.resolve()))
+    pathspec = (docs_dir / '*.md').as_posix()
+
+    diff_args: List[str] = ['diff', '--unified=0', '--no-color', '--no-ext-diff', '--no-prefix']
+    diff_args += ['--cached'] if staged else [since or 'HEAD']
+    changes: Dict[str, Optional[Set[int]]] = {}
+    for path, lines in parse_diff(_git(root, *diff_args, '--', pathspec)).items():
+        if Path(path).parent == docs_dir:
+            changes[Path(path).name] = lines
+
+    if not staged:
+        for path in _git(root, 'ls-files', '--others', '--exclude-standard', '--', pathspec).splitlines():
+            if Path(path).parent == docs_dir:
+                changes[Path(path).name] = None
+
+    return changes
+
+
+def unstaged_markdown(docs_path: Path) -> Set[str]:
+    """Names of *.md files in docs_path whose working-tree copy differs from the index."""
+    root = repo_root(docs_path)
+    docs_dir = Path(os.path.relpath(docs_path.resolve(), root.resolve()))
+    names = _git(root, 'diff', '--name-only', '--no-ext-diff', '--', (docs_dir / '*.md').as_posix())
+    return {Path(path).name for path in names.splitlines() if Path(path).parent == docs_dir}
+
+
+def validation_scope(docs_path: Path, since: Optional[str] = None,
+                     staged: bool = False) -> Tuple[Dict[str, Optional[Set[int]]], Set[str]]:
+    """changed_markdown() plus, with `staged`, the changed files that also have unstaged changes.
+
+    The validators read the working-tree copy, so for those files the staged
+    line numbers may not line up with what is checked; the CLIs warn about them.
+    """
+    scope = changed_markdown(docs_path, since=since, staged=staged)
+    partly_staged = unstaged_markdown(docs_path) & set(scope) if staged else set()
+    return scope, partly_staged
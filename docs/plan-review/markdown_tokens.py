@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Shared line tokenizer for the documentation validators.
+
+Every line of a document is classified exactly once (heading level and text,
+code fence open/close, table row and separator style, list marker, blank,
+trailing whitespace) so that validation rules can visit pre-classified
+tokens instead of each re-enumerating the lines and re-running their own
+regexes and code-fence state machines.
+"""
+
+from typing import List, Optional
+
+from rule_patterns import PATTERNS
+
+
+# Precompiled patterns from the shared table; the first-character guards in
+# tokenize() keep them off most lines
+HEADING_PATTERN = PATTERNS['heading'].regex
+LIST_PATTERN = PATTERNS['list-item'].regex
+TABLE_SEPARATOR_PATTERN = PATTERNS['table-separator'].regex
+TABLE_SEPARATOR_SINGLE_PATTERN = PATTERNS['table-separator-single'].regex
+
+
+class LineToken:
+    """Classification of one line of a markdown document."""
+
+    __slots__ = (
+        'number', 'raw', 'stripped', 'blank',
+        'heading_level', 'heading_text', 'raw_heading_level',
+        'fence', 'fence_role', 'in_code',
+        'has_pipe', 'table_separator', 'list_marker', 'trailing_whitespace',
+    )
+
+    def __init__(self, number: int, raw: str):
+        self.number = number
+        self.raw = raw
+        self.stripped = raw.strip()
+        self.blank = not self.stripped
+        # Level/text of a heading on the stripped line (0/'' if not a heading)
+        self.heading_level = 0
+        self.heading_text = ''
+        # Leading '#' count on the raw line when followed by whitespace
+        self.raw_heading_level = 0
+        # '```' or '~~~' when the stripped line starts with a fence marker
+        self.fence = ''
+        # 'open'/'close' for fence lines that start/end a code block
+        self.fence_role: Optional[str] = None
+        # True for lines inside a fenced code block (fence lines excluded)
+        self.in_code = False
+        self.has_pipe = False
+        # 'single' or 'multiple' for table separator rows
+        self.table_separator: Optional[str] = None
+        # '-', '*', '+' or 'numbered' for list items
+        self.list_marker: Optional[str] = None
+        self.trailing_whitespace = raw.rstrip('\n') != raw.rstrip()
+
+
+class MarkdownDocument:
+    """A document's lines plus their tokens and commonly visited token subsets."""
+
+    def __init__(self, name: str, lines: List[str]):
+        self.name = name
+        self.lines = lines
+        self.tokens = tokenize(lines)
+        self.headings = [t for t in self.tokens if t.heading_level]
+        # Lines whose raw text starts with '#', heading syntax or not
+        self.hash_lines = [t for t in self.tokens if t.raw.startswith('#')]
+        self._content: Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = ''.join(self.lines)
+        return self._content
+
+
+def tokenize(lines: List[str]) -> List[LineToken]:
+    """Classify every line once, in a single pass."""
+    tokens = []
+    open_fence = ''
+
+    for number, raw in enumerate(lines, 1):
+        token = LineToken(number, raw)
+        stripped = token.stripped
+        first = stripped[:1]
+
+        # Cheap first-character guards keep the regexes off most lines
+        if raw.startswith('#'):
+            hashes = len(raw) - len(raw.lstrip('#'))
+            if raw[hashes:hashes + 1].isspace():
+                token.raw_heading_level = hashes
+
+        if first == '#':
+            if match := HEADING_PATTERN.match(stripped):
+                token.heading_level = len(match.group(1))
+                token.heading_text = match.group(2)
+
+        if first in ('`', '~') and stripped[:3] in ('```', '~~~'):
+            token.fence = stripped[:3]
+
+        # A block opened with ``` only closes on ``` (and ~~~ on ~~~)
+        if open_fence:
+            if token.fence == open_fence:
+                token.fence_role = 'close'
+                open_fence = ''
+            else:
+                token.in_code = True
+        elif token.fence:
+            token.fence_role = 'open'
+            open_fence = token.fence
+
+        if '|' in stripped:
+            token.has_pipe = True
+            if TABLE_SEPARATOR_PATTERN.match(raw):
+                single = TABLE_SEPARATOR_SINGLE_PATTERN.match(raw)
+                token.table_separator = 'single' if single else 'multiple'
+
+        if first and (first in '-*+' or first.isdigit()):
+            if match := LIST_PATTERN.match(stripped):
+                marker = match.group(1)
+                token.list_marker = 'numbered' if marker[0].isdigit() else marker
+
+        tokens.append(token)
+
+    return tokens
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Precompiled regex table shared by the markdown tokenizer and the validation rules.
+
+Every pattern is compiled once at import instead of through re.match()
+literals in per-line loops, which go through the re module's bounded cache
+(and recompile once enough distinct patterns are in use). Each entry can
+declare a cheap guard - a required prefix and/or substring - that is checked
+with plain string operations first, so the regex only runs on lines that
+could possibly match.
+"""
+
+import re
+from typing import Dict, Optional, Tuple, Union
+
+DIGITS = tuple('0123456789')
+
+
+class RulePattern:
+    """A pattern compiled at import, plus an optional guard checked before it runs."""
+
+    __slots__ = ('regex', 'prefix', 'contains')
+
+    def __init__(self, pattern: str, flags: int = 0, prefix: Optional[Union[str, Tuple[str, ...]]] = None,
+                 contains: Optional[str] = None):
+        self.regex = re.compile(pattern, flags)
+        # Text must start with this (str.startswith also takes a tuple of options)
+        self.prefix = prefix
+        # Text must contain this substring
+        self.contains = contains
+
+    def _guard(self, text: str) -> bool:
+        if self.prefix is not None and not text.startswith(self.prefix):
+            return False
+        return self.contains is None or self.contains in text
+
+    def match(self, text: str) -> Optional[re.Match]:
+        return self.regex.match(text) if self._guard(text) else None
+
+    def search(self, text: str) -> Optional[re.Match]:
+        return self.regex.search(text) if self._guard(text) else None
+
+
+PATTERNS: Dict[str, RulePattern] = {
+    # --- Tokenizer (markdown_tokens.py guards these by first character itself) ---
+    # Heading on the stripped line: "## Title"
+    'heading': RulePattern(r'^(#{1,6})\s+(.+)$', prefix='#'),
+    # List item on the stripped line: "- item", "* item", "+ item", "1. item"
+    'list-item': RulePattern(r'^([-*+]|\d+\.)\s+'),
+    # Table separator row on the raw line, any number of cells: "|---|:---:|"
+    'table-separator': RulePattern(r'^\s*\|(\s*:?-+:?\s*\|)+\s*$', contains='|'),
+    # Separator whose first cell is at most three characters wide: "|---|"
+    'table-separator-single': RulePattern(r'^\s*\|[\s\-:]{1,3}\|', contains='|'),
+
+    # --- section-numbering ---
+    # Document number from the file name: "7. Data Persistence.md" -> 7
+    'doc-number': RulePattern(r'^(\d+)\.', prefix=DIGITS),
+    # "### 7.2 Title"; the bare-digit branch matches malformed numbering ("### 7 Title"),
+    # so one match tells numbered, badly numbered and unnumbered H3s apart
+    'h3-section': RulePattern(r'^###\s+(?:(\d+)\.(\d+)(?:\.(\d+))?\s+(.+)$|\d)', prefix='### '),
+    # "#### 7.2.1 Title"
+    'h4-section': RulePattern(r'^####\s+(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?\s+(.+)$', prefix='#### '),
+
+    # --- standard-sections (searched in the lowercased document) ---
+    'overview-section': RulePattern(r'###\s+.*overview', re.IGNORECASE, contains='###'),
+    'responsibilities-section': RulePattern(r'###\s+.*responsibilities', re.IGNORECASE, contains='###'),
+    'assumptions-section': RulePattern(r'(###|####)\s+.*(assumptions|open questions)', re.IGNORECASE,
+                                       contains='###'),
+
+    # --- heading text ---
+    # "7.2 Title" (empty-sections)
+    'numbered-section-text': RulePattern(r'\d+\.\d+', prefix=DIGITS),
+    # "7. Title" (heading-capitalization skips these)
+    'numbered-heading-text': RulePattern(r'^\d+\.', prefix=DIGITS),
+
+    # --- line-length ---
+    'url': RulePattern(r'https?://', contains='://'),
+
+    # --- emphasis-as-heading: "**Text**" or "**Text:**" alone on a line ---
+    'bold-heading': RulePattern(r'^\*\*([A-Z][^*]+)\*\*:?\s*$', prefix='**'),
+}
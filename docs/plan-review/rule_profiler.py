@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Instrumentation for the documentation validation engine (--profile).
+
+RuleProfiler accumulates wall time per rule (and per engine phase such as
+tokenizing), wall time per file, and the number of regex match/search calls
+made while each rule runs. Regex calls are counted by temporarily swapping
+the `re` module and module-level compiled patterns of the instrumented
+modules for counting proxies, so rules need no changes. One rule can also be
+captured with cProfile for a function-level breakdown.
+"""
+
+import cProfile
+import io
+import pstats
+import re
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Regex operations that scan text and are counted
+_SCANNING = frozenset({'match', 'fullmatch', 'search', 'findall', 'finditer', 'sub', 'subn', 'split'})
+
+
+class _CountingPattern:
+    """Compiled pattern proxy that counts scanning calls."""
+
+    def __init__(self, pattern: re.Pattern, count: Callable[[], None]):
+        self._pattern = pattern
+        self._count = count
+
+    def __getattr__(self, name):
+        attr = getattr(self._pattern, name)
+        if name not in _SCANNING:
+            return attr
+
+        def counted(*args, **kwargs):
+            self._count()
+            return attr(*args, **kwargs)
+        return counted
+
+
+class _CountingRe:
+    """Stand-in for the `re` module that counts scanning calls and compiles counting patterns."""
+
+    def __init__(self, count: Callable[[], None]):
+        self._count = count
+
+    def compile(self, *args, **kwargs):
+        return _CountingPattern(re.compile(*args, **kwargs), self._count)
+
+    def __getattr__(self, name):
+        attr = getattr(re, name)
+        if name not in _SCANNING:
+            return attr
+
+        def counted(*args, **kwargs):
+            self._count()
+            return attr(*args, **kwargs)
+        return counted
+
+
+class RuleProfiler:
+    """Per-rule and per-file timings and regex call counts, with an optional cProfile of one rule."""
+
+    def __init__(self, capture_rule: Optional[str] = None):
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.regex_calls: Dict[str, int] = defaultdict(int)
+        self.file_seconds: Dict[str, float] = defaultdict(float)
+        self.current: Optional[str] = None
+        self.capture_rule = capture_rule
+        self.cprofile = cProfile.Profile() if capture_rule else None
+
+    @contextmanager
+    def measure(self, name: str):
+        """Attribute the time and regex calls of the enclosed block to `name`."""
+        previous, self.current = self.current, name
+        capture = self.cprofile is not None and name == self.capture_rule
+        if capture:
+            self.cprofile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+            if capture:
+                self.cprofile.disable()
+            self.current = previous
+
+    @contextmanager
+    def measure_file(self, name: str):
+        """Add the enclosed block's time to file `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.file_seconds[name] += time.perf_counter() - start
+
+    def _count_regex(self):
+        self.regex_calls[self.current or 'other'] += 1
+
+    @contextmanager
+    def counting_regex(self, modules: List[ModuleType], factories: List[Tuple[ModuleType, str]] = ()):
+        """Count regex calls made through `modules` while the block runs.
+
+        Each module's `re` global, module-level compiled patterns and the
+        patterns of module-level pattern tables (see rule_patterns.py) are
+        replaced by counting proxies; `factories` names functions returning
+        patterns (e.g. cached compilers) whose results are wrapped too.
+        """
+        saved = []
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if value is re:
+                    replacement = _CountingRe(self._count_regex)
+                elif isinstance(value, re.Pattern):
+                    replacement = _CountingPattern(value, self._count_regex)
+                elif isinstance(value, dict):
+                    # Pattern tables: entries holding their compiled pattern in .regex
+                    for entry in value.values():
+                        regex = getattr(entry, 'regex', None)
+                        if isinstance(regex, re.Pattern):
+                            saved.append((entry, 'regex', regex))
+                            entry.regex = _CountingPattern(regex, self._count_regex)
+                    continue
+                else:
+                    continue
+                saved.append((module, name, value))
+                setattr(module, name, replacement)
+        for module, name in factories:
+            factory = getattr(module, name)
+            saved.append((module, name, factory))
+            setattr(module, name, lambda *args, _factory=factory, **kwargs:
+                    _CountingPattern(_factory(*args, **kwargs), self._count_regex))
+        try:
+            yield
+        finally:
+            for module, name, value in reversed(saved):
+                setattr(module, name, value)
+
+    def report(self, top_files: int = 10, top_functions: int = 15, profile_out: Optional[str] = None):
+        """Print the timing tables, and the captured cProfile if any."""
+        total = sum(self.seconds.values())
+        print(f"\n⏱  Profile: {total * 1000:.1f} ms in rules and engine phases, "
+              f"{len(self.file_seconds)} file(s)")
+        print(f"   {'rule / phase':<28}{'time':>10}{'share':>8}{'regex calls':>13}")
+        for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1]):
+            share = seconds / total * 100 if total else 0.0
+            print(f"   {name:<28}{seconds * 1000:>8.1f}ms{share:>7.1f}%{self.regex_calls.get(name, 0):>13}")
+
+        if self.file_seconds:
+            print("\n   Slowest files:")
+            for name, seconds in sorted(self.file_seconds.items(), key=lambda item: -item[1])[:top_files]:
+                print(f"   {seconds * 1000:>8.1f}ms  {name}")
+
+        if self.cprofile is not None:
+            if self.capture_rule not in self.seconds:
+                print(f"\n   cProfile: rule '{self.capture_rule}' did not run")
+                return
+            stream = io.StringIO()
+            stats = pstats.Stats(self.cprofile, stream=stream)
+            stats.sort_stats('cumulative').print_stats(top_functions)
+            print(f"\n   cProfile of '{self.capture_rule}':")
+            print(stream.getvalue().rstrip())
+            if profile_out:
+                stats.dump_stats(profile_out)
+                print(f"\n   ✓ Wrote cProfile stats to {profile_out}")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Indexed terminology scanning for the documentation validators.
+
+All tracked terms are compiled into one case-insensitive pattern whose
+alternation is factored into a prefix trie, so matching a line costs about
+the same for five terms as for several hundred. Scanning a document yields
+every variant (the spelling actually used, e.g. "riverpod" for "Riverpod")
+with the lines it occurs on; TermIndex merges those per-file results into an
+inverted index from variant to (file, line) with per-variant counts.
+"""
+
+import re
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Pattern, Tuple
+
+
+DEFAULT_TERMS = ['Hive', 'Isar', 'Riverpod', 'Firebase', 'Firestore']
+
+
+def load_terms(path: Path) -> List[str]:
+    """Read one term per line, ignoring blank lines and '#' comments."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for the words below a trie node, sharing common prefixes."""
+    ends_here = '' in node
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ''
+    if len(branches) == 1 and not ends_here:
+        return branches[0]
+    group = '(?:' + '|'.join(branches) + ')'
+    # Optional group is greedy, so the longest term wins where terms overlap
+    return group + '?' if ends_here else group
+
+
+@lru_cache(maxsize=None)
+def compile_terms(terms: Tuple[str, ...]) -> Pattern:
+    """Compile all terms into one case-insensitive whole-word pattern."""
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term.lower():
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    # Lookarounds instead of \b so terms may start or end with punctuation ("C++")
+    return re.compile(r'(?<!\w)(' + _trie_pattern(trie) + r')(?!\w)', re.IGNORECASE)
+
+
+def scan_lines(lines: Iterable[str], terms: Tuple[str, ...]) -> Dict[str, List[int]]:
+    """Map each variant used in `lines` to the (1-based) line numbers it occurs on."""
+    if not terms:
+        return {}
+    pattern = compile_terms(terms)
+    search = pattern.search
+    variants = defaultdict(list)
+    for line_num, line in enumerate(lines, 1):
+        if not search(line):
+            continue
+        for match in pattern.finditer(line):
+            occurrences = variants[match.group(1)]
+            if not occurrences or occurrences[-1] != line_num:
+                occurrences.append(line_num)
+    return dict(variants)
+
+
+class TermIndex:
+    """Inverted index from term variant to the (file, line) locations using it.
+
+    Files can be added again or removed, so a long-running session (see
+    DocumentValidator.watch) updates the index one file at a time.
+    """
+
+    def __init__(self):
+        self.files: Dict[str, Dict[str, List[int]]] = {}
+        # variant -> {filename: line numbers}
+        self.occurrences: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    def add_file(self, filename: str, variants: Dict[str, List[int]]):
+        """Merge one file's scan_lines() result into the index, replacing any earlier version."""
+        self.remove_file(filename)
+        self.files[filename] = variants
+        for variant, line_nums in variants.items():
+            self.occurrences[variant][filename] = line_nums
+            self.counts[variant] += len(line_nums)
+
+    def remove_file(self, filename: str):
+        """Drop everything a file contributed."""
+        for variant, line_nums in self.files.pop(filename, {}).items():
+            del self.occurrences[variant][filename]
+            self.counts[variant] -= len(line_nums)
+            if not self.occurrences[variant]:
+                del self.occurrences[variant]
+                del self.counts[variant]
+
+    def locations(self, variant: str) -> List[Tuple[str, int]]:
+        """Every (file, line) using `variant`."""
+        return [(filename, line_num)
+                for filename, line_nums in self.occurrences.get(variant, {}).items()
+                for line_num in line_nums]
+
+    def variations(self) -> Dict[str, Dict[str, int]]:
+        """Group variants by term (lowercased) with the number of lines using each."""
+        by_term: Dict[str, Dict[str, int]] = defaultdict(dict)
+        for variant, count in self.counts.items():
+            by_term[variant.lower()][variant] = count
+        return dict(by_term)
+
+    @staticmethod
+    def preferred(counts: Dict[str, int]) -> str:
+        """Most frequently used variant; ties go to the alphabetically first."""
+        return min(counts, key=lambda variant: (-counts[variant], variant))
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the documentation validation engine.
+
+Run from this directory with `python -m unittest test_validate_docs` (or
+pytest). Every test builds its own small docs directory, so the real
+docs/plan tree is never touched.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from validate_docs import DocumentValidator, ResultCache, resolve_rules
+
+SCRIPT = Path(__file__).resolve().parent / 'validate_docs.py'
+
+
+def write_docs(directory: Path, files: dict) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, text in files.items():
+        (directory / name).write_text(text, encoding='utf-8')
+    return directory
+
+
+class ResultCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.cache_file = self.root / 'cache.json'
+        self.rules = resolve_rules('base')
+
+    def _run(self, docs: Path, exclude=()):
+        validator = DocumentValidator(docs, cache=ResultCache(self.cache_file, root=self.root))
+        validator.validate_all(self.rules, list(exclude))
+        return validator
+
+    def _entries(self):
+        return set(ResultCache(self.cache_file, root=self.root).entries)
+
+    def test_same_name_in_two_directories(self):
+        a = write_docs(self.root / 'a', {'1. Doc.md': '## 1. Doc\n\n### 1.1 Overview\n'})
+        b = write_docs(self.root / 'b', {'1. Doc.md': '## 1. Doc\n\n### 2.1 Overview\n'})
+        self._run(a)
+        self._run(b)
+        self.assertEqual(self._entries(), {'a/1. Doc.md', 'b/1. Doc.md'})
+
+        # Replayed from the cache, each directory keeps its own issues
+        self.assertFalse([i for i in self._run(a).issues if i.rule == 'section-numbering'])
+        self.assertTrue([i for i in self._run(b).issues if i.rule == 'section-numbering'])
+
+    def test_narrower_run_keeps_other_entries(self):
+        docs = write_docs(self.root / 'docs', {'1. One.md': '## 1. One\n', '2. Two.md': '## 2. Two\n'})
+        self._run(docs)
+        self._run(docs, exclude=['Two'])
+        self.assertEqual(self._entries(), {'docs/1. One.md', 'docs/2. Two.md'})
+
+    def test_deleted_file_is_pruned(self):
+        docs = write_docs(self.root / 'docs', {'1. One.md': '## 1. One\n', '2. Two.md': '## 2. Two\n'})
+        self._run(docs)
+        (docs / '2. Two.md').unlink()
+        self._run(docs)
+        self.assertEqual(self._entries(), {'docs/1. One.md'})
+
+
+class FixTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.docs = Path(tmp.name)
+
+    def _fix(self, text: str, rules: str) -> tuple:
+        write_docs(self.docs, {'1. Doc.md': text})
+        validator = DocumentValidator(self.docs)
+        issues = validator.validate_all(resolve_rules(rules), [])
+        validator.apply_fixes(resolve_rules(rules), [])
+        return issues, (self.docs / '1. Doc.md').read_text(encoding='utf-8')
+
+    def test_three_column_table_separator(self):
+        text = ('## 1. Doc\n\n'
+                '| A | B | C |\n|---|:---:|---|\n| 1 | 2 | 3 |\n\n'
+                '| A | B | C |\n| ----- | :------: | ------- |\n| 1 | 2 | 3 |\n')
+        issues, fixed = self._fix(text, 'table-formatting')
+        self.assertEqual([(i.rule, i.line) for i in issues], [('table-formatting', 8)])
+        self.assertEqual(fixed.splitlines()[7], '|---|:-:|---|')
+        self.assertEqual(self._fix(fixed, 'table-formatting')[0], [])
+
+
+    def test_code_blocks_are_not_rewritten(self):
+        code = '```bash\n##### comment \necho hi   \n```\n'
+        text = '## 1. Doc\n\n##### Deep \n\n' + code
+        issues, fixed = self._fix(text, 'heading-depth,trailing-whitespace')
+        self.assertIn(('heading-depth', 6), [(i.rule, i.line) for i in issues])
+        self.assertEqual(fixed, '## 1. Doc\n\n#### Deep\n\n' + code)
+
+
+class ScopeTests(unittest.TestCase):
+
+    def test_only_line_local_rules_are_limited_to_changed_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            docs = write_docs(Path(tmp), {'1. Doc.md': (
+                '## 1. Doc\n\n'
+                'Changed line.\n\n'
+                'Unchanged line with trailing space \n\n'
+                '**Not A Heading**\n\n'
+                + 'word ' * 30 + '\n')})
+            validator = DocumentValidator(docs, scope={'1. Doc.md': {3}})
+            issues = validator.validate_all(['trailing-whitespace', 'line-length', 'emphasis-as-heading'], [])
+        self.assertEqual(sorted(i.rule for i in issues), ['emphasis-as-heading', 'line-length'])
+
+
+class SarifTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name).resolve()
+        subprocess.run(['git', 'init', '-q', str(self.repo)], check=True)
+        self.docs = write_docs(self.repo / 'docs' / 'plan', {'1. Doc.md': '## 1. Doc\n\n### 2.1 Overview \n'})
+
+    def _uris(self, cwd: Path) -> tuple:
+        out = self.repo / 'out.sarif'
+        subprocess.run([sys.executable, str(SCRIPT), '--path', str(self.docs), '--no-cache',
+                        '--format', 'sarif', '--output', str(out)], cwd=cwd, capture_output=True)
+        run = json.loads(out.read_text(encoding='utf-8'))['runs'][0]
+        locations = [r['locations'][0]['physicalLocation']['artifactLocation'] for r in run['results']]
+        return run['originalUriBaseIds'], locations
+
+    def test_uris_relative_to_repo_root_from_any_directory(self):
+        base_ids, locations = self._uris(self.repo)
+        self.assertEqual(base_ids, {'%SRCROOT%': {'uri': self.repo.as_uri() + '/'}})
+        self.assertTrue(locations)
+        for location in locations:
+            self.assertEqual(location, {'uri': 'docs/plan/1.%20Doc.md', 'uriBaseId': '%SRCROOT%'})
+        self.assertEqual(self._uris(self.docs), (base_ids, locations))
+
+
+if __name__ == '__main__':
+    unittest.main()
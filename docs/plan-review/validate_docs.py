@@ -3,14 +3,41 @@
 Documentation Validation Script for AshTrail
 Validates documentation files against defined standards.
 
+One engine runs both rule sets: the formatting rules ("base") and the content
+quality and consistency rules ("extended", also available through
+validate_docs_extended.py). Each file is read and tokenized once; every
+per-file rule and the cross-file data collection share that parsed document.
+
 Usage:
     python validate_docs.py [options]
     
 Options:
-    --fix          Attempt to auto-fix issues where possible
+    --fix          Fix heading-depth, section-numbering, table-formatting and
+                   trailing-whitespace issues in place, then report the rest
     --verbose      Show detailed output
-    --rules        Comma-separated list of rules to run (default: all)
+    --rules        Comma-separated list of rules or rule sets (base, extended,
+                   all) to run (default: all)
     --exclude      Comma-separated list of files to exclude
+    --jobs N       Validate files in N worker processes (default: 1)
+    --no-cache     Re-validate every file instead of replaying cached results
+    --cache-file   Location of the result cache (default: .validate_docs_cache.json
+                   next to this script)
+    --terms        Comma-separated terms checked by terminology-consistency
+    --terms-file   File listing one term per line (combined with --terms)
+    --format       text (default), or jsonl / sarif streamed as issues are found
+    --output, -o   Write the report to a file instead of stdout
+    --profile      Report per-rule and per-file timings and regex call counts
+    --profile-rule Also capture a cProfile of one rule (--profile-out saves it)
+    --watch        Keep running and re-validate files as they are saved; uses
+                   watchdog filesystem events if installed, else stat polling
+    --changed-since REF
+                   Only check markdown files changed since a git ref; rules
+                   that look at single lines report on changed lines only
+    --staged       The same for the changes staged for commit
+
+Results are cached per file, keyed by content hash, rule set and
+VALIDATOR_VERSION, so unchanged files are not re-read or re-checked.
+Bump VALIDATOR_VERSION whenever a rule's behaviour changes.
     
 Exit Codes:
     0 - All validations passed
@@ -20,11 +47,134 @@ Exit Codes:
 
 import re
 import sys
+import os
+import json
+import hashlib
+import shutil
+import tempfile
+import threading
+import time
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, asdict, field, replace
+from typing import Callable, Dict, Iterator, List, Set, TextIO, Tuple, Optional
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import argparse
+from contextlib import nullcontext, redirect_stdout
+from urllib.parse import quote
+
+import markdown_tokens
+import terminology
+from markdown_tokens import MarkdownDocument
+from git_scope import GitScopeError, repo_root, validation_scope
+from rule_patterns import PATTERNS
+from rule_profiler import RuleProfiler
+from terminology import DEFAULT_TERMS, TermIndex, load_terms, scan_lines
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional: --watch falls back to polling
+    FileSystemEventHandler = Observer = None
+
+
+# Bump when rule behaviour changes so cached results are invalidated
+VALIDATOR_VERSION = '5'
+
+DEFAULT_CACHE_FILE = Path(__file__).parent / '.validate_docs_cache.json'
+
+# Cache entries are keyed by path relative to this, so same-named files in
+# different --path directories do not collide
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# --watch: stat polling interval without watchdog, and settle time after an event
+POLL_INTERVAL = 0.05
+WATCH_DEBOUNCE = 0.01
+
+# Formatting rules
+BASE_RULES = [
+    'heading-depth',
+    'section-numbering',
+    'standard-sections',
+    'table-formatting',
+    'trailing-whitespace',
+]
+
+# Content quality and consistency rules
+EXTENDED_RULES = [
+    'empty-sections',
+    'code-block-syntax',
+    'line-length',
+    'list-consistency',
+    'heading-capitalization',
+    'duplicate-headings',
+    'emphasis-as-heading',
+    'orphaned-content',
+    'terminology-consistency',
+]
+
+RULE_SETS = {
+    'base': BASE_RULES,
+    'extended': EXTENDED_RULES,
+    'all': BASE_RULES + EXTENDED_RULES,
+}
+
+# Rule registry: rule name -> DocumentValidator method checking one parsed document
+FILE_RULES = {
+    'heading-depth': '_check_heading_depth',
+    'section-numbering': '_check_section_numbering',
+    'standard-sections': '_check_standard_sections',
+    'table-formatting': '_check_table_formatting',
+    'trailing-whitespace': '_check_trailing_whitespace',
+    'empty-sections': '_check_empty_sections',
+    'code-block-syntax': '_check_code_block_syntax',
+    'line-length': '_check_line_length',
+    'list-consistency': '_check_list_consistency',
+    'heading-capitalization': '_check_heading_capitalization',
+    'duplicate-headings': '_check_duplicate_headings',
+    'emphasis-as-heading': '_check_emphasis_as_heading',
+    'orphaned-content': '_check_orphaned_content',
+}
+
+# Rules whose issues come with TextEdits that --fix can apply
+FIXABLE_RULES = {'heading-depth', 'section-numbering', 'table-formatting', 'trailing-whitespace'}
+
+# Rule registry: rule name -> DocumentValidator method run once over data collected from all files
+CROSS_FILE_RULES = {
+    'terminology-consistency': '_check_terminology_consistency',
+}
+
+# Rules whose issues depend only on the line they are reported on; with
+# --changed-since / --staged they are reported on changed lines only, while
+# the other rules report anywhere in a changed file. line-length (fence and
+# table state of earlier lines) and emphasis-as-heading (neighbouring lines)
+# are not line-local.
+LINE_LOCAL_RULES = {
+    'heading-depth',
+    'section-numbering',
+    'trailing-whitespace',
+    'heading-capitalization',
+}
+
+
+def resolve_rules(spec: str, rule_sets: Dict[str, List[str]] = RULE_SETS) -> List[str]:
+    """Expand a comma-separated list of rule and rule-set names, keeping first-seen order."""
+    rules = []
+    for name in (part.strip() for part in spec.split(',')):
+        for rule in rule_sets.get(name, [name] if name else []):
+            if rule not in rules:
+                rules.append(rule)
+    return rules
+
+
+def resolve_terms(spec: Optional[str], terms_file: Optional[str]) -> List[str]:
+    """Combine --terms and --terms-file into the tracked term list (DEFAULT_TERMS if neither is given)."""
+    if spec is None and terms_file is None:
+        return list(DEFAULT_TERMS)
+    terms = [t.strip() for t in (spec or '').split(',') if t.strip()]
+    if terms_file:
+        terms.extend(load_terms(Path(terms_file)))
+    return terms
 
 
 @dataclass
@@ -38,13 +188,217 @@ class ValidationIssue:
     suggestion: Optional[str] = None
 
 
+@dataclass
+class TextEdit:
+    """Replacement of columns [start, end) of one line, proposed by a rule to fix an issue."""
+    line: int
+    start: int
+    end: int
+    replacement: str
+    rule: str
+
+
+@dataclass
+class FileResult:
+    """Everything one file contributes: its own issues plus data for the cross-file rules."""
+    issues: List[ValidationIssue] = field(default_factory=list)
+    headings: List[tuple] = field(default_factory=list)  # (file, line, level, text)
+    terms: Dict[str, List[int]] = field(default_factory=dict)  # term variant -> line numbers
+    edits: List[TextEdit] = field(default_factory=list)  # fixes; not cached
+
+
+def _stat_key(file_path: Path) -> List[int]:
+    """Modification time and size, enough to tell whether a file may have changed."""
+    st = file_path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _format_separator(row: str, style: str) -> str:
+    """Rewrite a table separator row (|---|:---:|) in the 'single' or 'multiple' dash style."""
+    cells = []
+    for cell in row.strip('|').split('|'):
+        cell = cell.strip()
+        left = cell.startswith(':')
+        right = len(cell) > 1 and cell.endswith(':')
+        width = 3 if style == 'single' else max(5, len(cell))
+        cells.append((':' if left else '') + '-' * (width - left - right) + (':' if right else ''))
+    return '|' + '|'.join(cells) + '|'
+
+
+def merge_edits(edits: List[TextEdit]) -> Tuple[List[TextEdit], List[TextEdit]]:
+    """Order a file's edits and split off those overlapping an earlier edit on the same line."""
+    accepted, conflicts = [], []
+    for edit in sorted(edits, key=lambda e: (e.line, e.start, e.end)):
+        previous = accepted[-1] if accepted else None
+        if previous is not None and previous.line == edit.line and (
+                edit.start < previous.end or (edit.start, edit.end) == (previous.start, previous.end)):
+            conflicts.append(edit)
+        else:
+            accepted.append(edit)
+    return accepted, conflicts
+
+
+def apply_edits(file_path: Path, edits: List[TextEdit]) -> Tuple[int, int]:
+    """Apply non-conflicting edits in one atomic rewrite; return (applied, conflicting) counts.
+    
+    The file is only rewritten if its content actually changes. Line endings
+    are preserved because edits never touch them.
+    """
+    accepted, conflicts = merge_edits(edits)
+    if not accepted:
+        return 0, len(conflicts)
+    
+    for encoding in ('utf-8', 'latin-1'):
+        try:
+            with open(file_path, 'r', encoding=encoding, newline='') as f:
+                lines = f.readlines()
+            break
+        except UnicodeDecodeError:
+            continue
+    
+    # Right to left within each line so earlier columns stay valid
+    for edit in reversed(accepted):
+        line = lines[edit.line - 1]
+        lines[edit.line - 1] = line[:edit.start] + edit.replacement + line[edit.end:]
+    
+    content = ''.join(lines)
+    with open(file_path, 'r', encoding=encoding, newline='') as f:
+        if f.read() == content:
+            return 0, len(conflicts)
+    
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f'.{file_path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            f.write(content)
+        shutil.copymode(file_path, tmp_name)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return len(accepted), len(conflicts)
+
+
+class ResultCache:
+    """Persistent per-file validation results keyed by content hash, rule set and validator version.
+    
+    Entries are stored under each file's resolved path relative to `root`.
+    """
+    
+    def __init__(self, path: Path, root: Path = PROJECT_ROOT):
+        self.path = path
+        self.root = root
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == VALIDATOR_VERSION:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+    
+    @staticmethod
+    def _rules_key(rules: List[str], terms: Tuple[str, ...] = ()) -> str:
+        key = ','.join(sorted(rules))
+        if terms:
+            key += '|terms:' + hashlib.sha256('\n'.join(sorted(terms)).encode('utf-8')).hexdigest()[:16]
+        return key
+    
+    def _key(self, file_path: Path) -> str:
+        return Path(os.path.relpath(file_path.resolve(), self.root)).as_posix()
+    
+    @staticmethod
+    def _digest(file_path: Path) -> str:
+        with open(file_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    
+    def lookup(self, file_path: Path, rules: List[str], terms: Tuple[str, ...] = ()) -> Optional[FileResult]:
+        """Return the cached result for an unchanged file, or None if it must be validated."""
+        entry = self.entries.get(self._key(file_path))
+        if entry is None or entry['rules'] != self._rules_key(rules, terms):
+            return None
+        
+        # Unchanged mtime and size: trust the entry without reading the file
+        stat_key = _stat_key(file_path)
+        if entry['stat'] != stat_key:
+            if entry['hash'] != self._digest(file_path):
+                return None
+            entry['stat'] = stat_key
+            self.dirty = True
+        
+        return FileResult(
+            issues=[ValidationIssue(**issue) for issue in entry['issues']],
+            headings=[tuple(heading) for heading in entry['headings']],
+            terms=entry['terms'],
+        )
+    
+    def store(self, file_path: Path, rules: List[str], result: FileResult, terms: Tuple[str, ...] = ()):
+        """Record the result of a freshly validated file."""
+        self.entries[self._key(file_path)] = {
+            'hash': self._digest(file_path),
+            'stat': _stat_key(file_path),
+            'rules': self._rules_key(rules, terms),
+            'issues': [asdict(issue) for issue in result.issues],
+            'headings': result.headings,
+            'terms': result.terms,
+        }
+        self.dirty = True
+    
+    def save(self):
+        """Write the cache back to disk, dropping entries for files that no longer exist.
+        
+        Entries for files outside the current run (other --path directories,
+        --exclude, --staged) are kept.
+        """
+        stale = [key for key in self.entries if not (self.root / key).is_file()]
+        for key in stale:
+            del self.entries[key]
+        if not (self.dirty or stale):
+            return
+        
+        tmp_path = self.path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': VALIDATOR_VERSION, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+        self.dirty = False
+
+
 class DocumentValidator:
     """Main validator class that runs all validation rules."""
     
-    def __init__(self, docs_path: Path, verbose: bool = False):
+    def __init__(self, docs_path: Path, verbose: bool = False, cache: Optional[ResultCache] = None,
+                 jobs: int = 1, terms: Optional[List[str]] = None,
+                 on_issue: Optional[Callable[[ValidationIssue], None]] = None,
+                 scope: Optional[Dict[str, Optional[Set[int]]]] = None):
         self.docs_path = docs_path
         self.verbose = verbose
+        self.cache = cache
+        self.jobs = jobs
+        # Called with each issue in report order while validate_all runs
+        self.on_issue = on_issue
+        # Terms tracked by terminology-consistency
+        self.terms: Tuple[str, ...] = tuple(DEFAULT_TERMS if terms is None else terms)
         self.issues: List[ValidationIssue] = []
+        self.edits: List[TextEdit] = []
+        # RuleProfiler collecting timings (see profile_all())
+        self.profiler: Optional[RuleProfiler] = None
+        # Set while apply_fixes() runs so cached results are not replayed for fixable issues
+        self.fixing = False
+        # Changed files -> changed line numbers (None: whole file) when only a
+        # git diff is checked (see git_scope.py); None checks everything
+        self.scope = scope
+        
+        # Cross-file data gathered while validating each file
+        self.term_index = TermIndex()
+        self.all_headings: List[tuple] = []  # (file, line, level, text)
+        self.file_names: List[str] = []
+        
+        # Per-file results and cross-file issues kept between runs (see watch())
+        self.results: Dict[Path, FileResult] = {}
+        self.cross_file_issues: List[ValidationIssue] = []
         
     def log(self, message: str):
         """Log message if verbose mode is enabled."""
@@ -55,10 +409,103 @@ class DocumentValidator:
         """Add a validation issue to the list."""
         self.issues.append(issue)
     
+    def add_edit(self, edit: TextEdit):
+        """Record a fix for an issue in the file being validated."""
+        self.edits.append(edit)
+    
     def validate_all(self, rules: List[str], exclude: List[str]) -> List[ValidationIssue]:
         """Run all validation rules on all documentation files."""
-        self.issues = []
+        md_files = self._discover_files(exclude)
+        if self.scope is not None and (not self.scope or not any(rule in CROSS_FILE_RULES for rule in rules)):
+            # Unchanged files only matter to cross-file rules (which read them from the cache)
+            md_files = [f for f in md_files if f.name in self.scope]
+        self.log(f"Found {len(md_files)} documentation files to validate")
+        
+        terms = self._cache_terms(rules)
+        self.results = {}
+        cached = {}
+        pending = []
+        for md_file in md_files:
+            result = self.cache.lookup(md_file, rules, terms) if self.cache is not None else None
+            if result is not None and self.fixing and any(i.rule in FIXABLE_RULES for i in result.issues):
+                result = None  # Edits are not cached; re-check to produce them
+            if result is not None:
+                self.log(f"Unchanged {md_file.name} (cached)")
+                cached[md_file] = result
+            else:
+                pending.append(md_file)
+        
+        # Take results in file order, each as soon as it is available, so
+        # on_issue sees the same sequence however files were scheduled
+        fresh = self._validate_files(pending, rules)
+        self.term_index = TermIndex()
+        for md_file in md_files:
+            result = cached.get(md_file)
+            if result is None:
+                result = next(fresh)
+                if self.cache is not None:
+                    self.cache.store(md_file, rules, result, terms)
+            if self.scope is not None:
+                result = replace(result,
+                                 issues=[i for i in result.issues if self._in_scope(i.file, i.line, i.rule)],
+                                 edits=[e for e in result.edits if self._in_scope(md_file.name, e.line, e.rule)])
+            self.results[md_file] = result
+            self.term_index.add_file(md_file.name, result.terms)
+            self._emit(result.issues)
+        
+        if self.cache is not None:
+            self.cache.save()
+        
+        self._merge(rules)
+        self._emit(self.cross_file_issues)
+        return self.issues
+    
+    def apply_fixes(self, rules: List[str], exclude: List[str]) -> Tuple[int, int, int]:
+        """Apply every fixable rule's edits; return (edits applied, files rewritten, conflicts skipped).
         
+        Edits for a file are merged and conflict-checked, then written in a
+        single atomic rewrite. Files without effective edits are not touched.
+        """
+        self.fixing = True
+        try:
+            self.validate_all(rules, exclude)
+        finally:
+            self.fixing = False
+        
+        applied = rewritten = conflicts = 0
+        for md_file, result in self.results.items():
+            if not result.edits:
+                continue
+            file_applied, file_conflicts = apply_edits(md_file, result.edits)
+            if file_applied:
+                self.log(f"Fixed {file_applied} issue(s) in {md_file.name}")
+                rewritten += 1
+            applied += file_applied
+            conflicts += file_conflicts
+        return applied, rewritten, conflicts
+    
+    def _timed(self, name: str):
+        """Profiler section for a rule or engine phase (no-op unless profiling)."""
+        return self.profiler.measure(name) if self.profiler is not None else nullcontext()
+    
+    def _timed_file(self, name: str):
+        """Profiler section for one file (no-op unless profiling)."""
+        return self.profiler.measure_file(name) if self.profiler is not None else nullcontext()
+    
+    def profile_all(self, rules: List[str], exclude: List[str]) -> List[ValidationIssue]:
+        """validate_all() with regex calls counted; requires self.profiler and runs in-process."""
+        modules = [sys.modules[__name__], markdown_tokens, terminology]
+        with self.profiler.counting_regex(modules, [(terminology, 'compile_terms')]):
+            return self.validate_all(rules, exclude)
+    
+    def _emit(self, issues: List[ValidationIssue]):
+        """Hand issues to the on_issue callback, if any, as they become final."""
+        if self.on_issue is not None:
+            for issue in issues:
+                self.on_issue(issue)
+    
+    def _discover_files(self, exclude: List[str]) -> List[Path]:
+        """List the markdown files to validate, in name order."""
         # Get all markdown files in the plan directory
         md_files = sorted(self.docs_path.glob("*.md"))
         
@@ -68,21 +515,177 @@ class DocumentValidator:
         
         # Filter out excluded files
         exclude_patterns = [re.compile(pattern) for pattern in all_excludes]
-        md_files = [
+        return [
             f for f in md_files 
             if not any(pattern.search(f.name) for pattern in exclude_patterns)
         ]
+    
+    def _in_scope(self, filename: str, line: int, rule: str) -> bool:
+        """Whether an issue or edit falls inside the checked git diff (always, without a scope)."""
+        if self.scope is None:
+            return True
+        if filename not in self.scope:
+            return False
+        changed = self.scope[filename]
+        return changed is None or rule not in LINE_LOCAL_RULES or line in changed
+    
+    def _cache_terms(self, rules: List[str]) -> Tuple[str, ...]:
+        """Terms that affect cached results (only results that collected terminology depend on them)."""
+        return self.terms if any(rule in CROSS_FILE_RULES for rule in rules) else ()
+    
+    def _merge(self, rules: List[str], rerun_cross_file: bool = True) -> List[ValidationIssue]:
+        """Rebuild the issue list from the per-file results, re-running cross-file rules if asked."""
+        md_files = sorted(self.results)
+        self.file_names = [f.name for f in md_files]
+        self.all_headings = []
+        self.issues = []
         
-        self.log(f"Found {len(md_files)} documentation files to validate")
-        
+        # Merge in file order so output is identical however files were scheduled
         for md_file in md_files:
-            self.log(f"Validating {md_file.name}")
-            self._validate_file(md_file, rules)
+            self.issues.extend(self.results[md_file].issues)
+            self.all_headings.extend(self.results[md_file].headings)
+        
+        # Cross-file rules run after every file has been collected
+        if rerun_cross_file:
+            per_file, self.issues = self.issues, []
+            for rule, method in CROSS_FILE_RULES.items():
+                if rule in rules:
+                    with self._timed(rule):
+                        getattr(self, method)()
+            self.cross_file_issues = [i for i in self.issues if self._in_scope(i.file, i.line, i.rule)]
+            self.issues = per_file
+        self.issues.extend(self.cross_file_issues)
         
         return self.issues
     
-    def _validate_file(self, file_path: Path, rules: List[str]):
-        """Validate a single file against all applicable rules."""
+    def watch(self, rules: List[str], exclude: List[str], report: Callable[[], None],
+              interval: float = POLL_INTERVAL):
+        """Validate everything, then re-validate files as they change until interrupted.
+        
+        Parsed results stay in memory; a change re-runs the file rules for the
+        changed files only and the cross-file rules only when a file's headings
+        or terminology changed. Uses watchdog events when installed and falls
+        back to polling file stats every `interval` seconds.
+        """
+        self.validate_all(rules, exclude)
+        report()
+        
+        snapshot = {f: _stat_key(f) for f in self.results}
+        wake = threading.Event()
+        observer = self._start_observer(wake)
+        mode = 'filesystem events' if observer is not None else f'polling every {interval * 1000:.0f} ms'
+        print(f"👀 Watching {self.docs_path} ({mode}); press Ctrl+C to stop")
+        
+        try:
+            while True:
+                if observer is not None:
+                    if not wake.wait(1.0):
+                        continue
+                    wake.clear()
+                    # Let editors finish a burst of writes for the same save
+                    time.sleep(WATCH_DEBOUNCE)
+                else:
+                    time.sleep(interval)
+                
+                current = {}
+                for md_file in self._discover_files(exclude):
+                    try:
+                        current[md_file] = _stat_key(md_file)
+                    except OSError:
+                        pass  # Deleted between listing and stat
+                changed = [f for f, key in current.items() if snapshot.get(f) != key]
+                removed = [f for f in snapshot if f not in current]
+                if not changed and not removed:
+                    continue
+                
+                start = time.perf_counter()
+                self._revalidate(changed, removed, rules)
+                snapshot = current
+                elapsed = (time.perf_counter() - start) * 1000
+                
+                print(f"\n🔄 {time.strftime('%H:%M:%S')} "
+                      f"{', '.join(f.name for f in changed + removed)}")
+                report()
+                print(f"⏱  Re-validated in {elapsed:.0f} ms")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+    
+    def _revalidate(self, changed: List[Path], removed: List[Path], rules: List[str]):
+        """Update in-memory results for changed and removed files and rebuild the issue list."""
+        terms = self._cache_terms(rules)
+        cross_file_changed = bool(removed)
+        
+        for md_file in removed:
+            self.results.pop(md_file, None)
+            self.term_index.remove_file(md_file.name)
+        
+        for md_file in changed:
+            self.log(f"Re-validating {md_file.name}")
+            result = self._validate_isolated(md_file, rules)
+            previous = self.results.get(md_file)
+            if previous is None or previous.headings != result.headings or previous.terms != result.terms:
+                cross_file_changed = True
+                self.term_index.add_file(md_file.name, result.terms)
+            self.results[md_file] = result
+            if self.cache is not None:
+                self.cache.store(md_file, rules, result, terms)
+        
+        if self.cache is not None:
+            self.cache.save()
+        
+        self._merge(rules, rerun_cross_file=cross_file_changed)
+    
+    def _start_observer(self, wake: threading.Event):
+        """Start a watchdog observer that sets `wake` on any change, or return None if unavailable."""
+        if Observer is None:
+            return None
+        
+        class _WakeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                wake.set()
+        
+        observer = Observer()
+        observer.schedule(_WakeHandler(), str(self.docs_path), recursive=False)
+        observer.start()
+        return observer
+    
+    def _validate_files(self, md_files: List[Path], rules: List[str]) -> Iterator[FileResult]:
+        """Validate files serially or across a process pool, yielding results per file in order."""
+        if self.jobs > 1 and len(md_files) > 1:
+            self.log(f"Validating {len(md_files)} files with {self.jobs} workers")
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                yield from pool.map(
+                    _validate_file_worker,
+                    [(self.docs_path, md_file, rules, self.terms) for md_file in md_files]
+                )
+            return
+        
+        for md_file in md_files:
+            self.log(f"Validating {md_file.name}")
+            yield self._validate_isolated(md_file, rules)
+    
+    def _validate_isolated(self, file_path: Path, rules: List[str]) -> FileResult:
+        """Validate one file and return only the issues and cross-file data it produced."""
+        saved, self.issues, self.edits = self.issues, [], []
+        try:
+            result = FileResult()
+            with self._timed_file(file_path.name):
+                doc = self._validate_file(file_path, rules)
+                if doc is not None and any(rule in CROSS_FILE_RULES for rule in rules):
+                    with self._timed('cross-file collection'):
+                        result.headings, result.terms = self._collect_file_data(doc)
+            result.issues = self.issues
+            result.edits = self.edits
+            return result
+        finally:
+            self.issues, self.edits = saved, []
+    
+    def _validate_file(self, file_path: Path, rules: List[str]) -> Optional[MarkdownDocument]:
+        """Validate a single file against all applicable rules, returning its parsed document."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
@@ -100,58 +703,70 @@ class DocumentValidator:
                     message=f'Unable to read file: {e}',
                     suggestion='Ensure file is saved with UTF-8 encoding'
                 ))
-                return
+                return None
         
-        # Extract document number from filename (e.g., "1. Project Overview.md" -> 1)
-        doc_num_match = re.match(r'^(\d+)\.', file_path.name)
-        doc_num = int(doc_num_match.group(1)) if doc_num_match else None
+        # Classify every line once; rules visit the shared tokens
+        with self._timed('tokenize'):
+            doc = MarkdownDocument(file_path.name, lines)
         
         # Run each requested rule
-        if 'heading-depth' in rules:
-            self._check_heading_depth(file_path, lines)
-        
-        if 'section-numbering' in rules and doc_num is not None:
-            self._check_section_numbering(file_path, lines, doc_num)
-        
-        if 'standard-sections' in rules:
-            self._check_standard_sections(file_path, lines)
-        
-        if 'table-formatting' in rules:
-            self._check_table_formatting(file_path, lines)
+        for rule, method in FILE_RULES.items():
+            if rule in rules:
+                with self._timed(rule):
+                    getattr(self, method)(file_path, doc)
         
-        if 'trailing-whitespace' in rules:
-            self._check_trailing_whitespace(file_path, lines)
+        return doc
     
-    def _check_heading_depth(self, file_path: Path, lines: List[str]):
+    def _collect_file_data(self, doc: MarkdownDocument) -> Tuple[List[tuple], Dict[str, List[int]]]:
+        """Collect headings and terminology variants from a parsed file for cross-file analysis."""
+        headings = [
+            (doc.name, token.number, token.heading_level, token.heading_text.strip())
+            for token in doc.headings
+        ]
+        return headings, scan_lines(doc.lines, self.terms)
+    
+    def _check_heading_depth(self, file_path: Path, doc: MarkdownDocument):
         """Rule: Headings should not exceed depth H4 (####)."""
-        for line_num, line in enumerate(lines, 1):
+        for token in doc.hash_lines:
             # Check for H5 or deeper (5+ #'s)
-            if match := re.match(r'^(#{5,})\s', line):
-                heading_level = len(match.group(1))
+            if token.raw_heading_level >= 5:
+                heading_level = token.raw_heading_level
                 self.add_issue(ValidationIssue(
                     file=file_path.name,
-                    line=line_num,
+                    line=token.number,
                     rule='heading-depth',
                     severity='error',
                     message=f'Heading depth H{heading_level} exceeds maximum of H4',
                     suggestion='Convert to H4 (####) or use bold text for subsections'
                 ))
+                # Never rewrite code samples (e.g. shell comments in a fence)
+                if not token.in_code:
+                    self.add_edit(TextEdit(token.number, 0, heading_level, '####', 'heading-depth'))
     
-    def _check_section_numbering(self, file_path: Path, lines: List[str], doc_num: int):
+    def _check_section_numbering(self, file_path: Path, doc: MarkdownDocument):
         """Rule: Section numbers should follow X.Y.Z format with document number prefix."""
-        # Pattern for H3 sections (### X.Y Title)
-        h3_pattern = re.compile(r'^###\s+(\d+)\.(\d+)(?:\.(\d+))?\s+(.+)$')
-        # Pattern for H4 sections (#### X.Y.Z Title)
-        h4_pattern = re.compile(r'^####\s+(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?\s+(.+)$')
+        # Extract document number from filename (e.g., "1. Project Overview.md" -> 1)
+        doc_num_match = PATTERNS['doc-number'].match(file_path.name)
+        if not doc_num_match:
+            return
+        doc_num = int(doc_num_match.group(1))
         
-        for line_num, line in enumerate(lines, 1):
+        h3_pattern = PATTERNS['h3-section']
+        h4_pattern = PATTERNS['h4-section']
+        
+        for token in doc.hash_lines:
+            line_num, line = token.number, token.raw
+            
             # Skip the document title (##)
             if line.startswith('## '):
                 continue
             
             # Check H3 sections
             if line.startswith('### '):
-                if match := h3_pattern.match(line):
+                match = h3_pattern.match(line)
+                if match is None:  # Allow non-numbered sections
+                    continue
+                if match.group(1) is not None:
                     prefix = int(match.group(1))
                     if prefix != doc_num:
                         self.add_issue(ValidationIssue(
@@ -162,10 +777,9 @@ class DocumentValidator:
                             message=f'Section number {prefix} does not match document number {doc_num}',
                             suggestion=f'Use {doc_num}.{match.group(2)} format'
                         ))
+                        self.add_edit(TextEdit(line_num, *match.span(1), str(doc_num), 'section-numbering'))
                 else:
-                    # H3 but doesn't match expected format
-                    if not re.match(r'^###\s+\d+', line):  # Allow non-numbered sections
-                        continue
+                    # Numbered H3 that doesn't match expected format
                     self.add_issue(ValidationIssue(
                         file=file_path.name,
                         line=line_num,
@@ -188,21 +802,22 @@ class DocumentValidator:
                             message=f'Section number {prefix} does not match document number {doc_num}',
                             suggestion=f'Use {doc_num}.{match.group(2)}.{match.group(3)} format'
                         ))
+                        self.add_edit(TextEdit(line_num, *match.span(1), str(doc_num), 'section-numbering'))
     
-    def _check_standard_sections(self, file_path: Path, lines: List[str]):
+    def _check_standard_sections(self, file_path: Path, doc: MarkdownDocument):
         """Rule: Documents should have standard sections where applicable."""
-        content = ''.join(lines).lower()
+        content = doc.content.lower()
         
         # Check for common standard sections
         expected_sections = {
-            'overview': r'###\s+.*overview',
-            'responsibilities': r'###\s+.*responsibilities',
-            'assumptions': r'(###|####)\s+.*(assumptions|open questions)',
+            'overview': PATTERNS['overview-section'],
+            'responsibilities': PATTERNS['responsibilities-section'],
+            'assumptions': PATTERNS['assumptions-section'],
         }
         
         missing = []
         for section_name, pattern in expected_sections.items():
-            if not re.search(pattern, content, re.IGNORECASE):
+            if not pattern.search(content):
                 missing.append(section_name)
         
         if missing:
@@ -215,19 +830,15 @@ class DocumentValidator:
                 suggestion='Consider adding these sections if applicable'
             ))
     
-    def _check_table_formatting(self, file_path: Path, lines: List[str]):
+    def _check_table_formatting(self, file_path: Path, doc: MarkdownDocument):
         """Rule: Table separators should use consistent formatting."""
-        in_table = False
         separator_style = None  # Will be 'single' or 'multiple'
         
-        for line_num, line in enumerate(lines, 1):
-            # Detect table separator line (|---|---|)
-            if re.match(r'^\s*\|[\s\-:]+\|\s*$', line):
-                # Determine style: single dash vs multiple dashes
-                if re.match(r'^\s*\|[\s\-:]{1,3}\|', line):
-                    current_style = 'single'
-                else:
-                    current_style = 'multiple'
+        for token in doc.tokens:
+            # Table separator lines (|---|---|) are classified by the tokenizer
+            current_style = token.table_separator
+            if current_style is not None:
+                line_num = token.number
                 
                 # Track first style found
                 if separator_style is None:
@@ -241,19 +852,317 @@ class DocumentValidator:
                         message='Inconsistent table separator formatting within document',
                         suggestion='Use consistent single-dash (|---|) or multi-dash (|-----|) format throughout'
                     ))
+                    if token.in_code:
+                        continue
+                    raw = token.raw
+                    start, end = len(raw) - len(raw.lstrip()), len(raw.rstrip())
+                    self.add_edit(TextEdit(line_num, start, end,
+                                           _format_separator(raw[start:end], separator_style),
+                                           'table-formatting'))
     
-    def _check_trailing_whitespace(self, file_path: Path, lines: List[str]):
+    def _check_trailing_whitespace(self, file_path: Path, doc: MarkdownDocument):
         """Rule: Lines should not have trailing whitespace."""
-        for line_num, line in enumerate(lines, 1):
-            if line.rstrip('\n') != line.rstrip():
+        for token in doc.tokens:
+            if token.trailing_whitespace:
                 self.add_issue(ValidationIssue(
                     file=file_path.name,
-                    line=line_num,
+                    line=token.number,
                     rule='trailing-whitespace',
                     severity='info',
                     message='Line has trailing whitespace',
                     suggestion='Remove trailing spaces'
                 ))
+                if not token.in_code:
+                    raw = token.raw
+                    self.add_edit(TextEdit(token.number, len(raw.rstrip()), len(raw.rstrip('\r\n')), '',
+                                           'trailing-whitespace'))
+    
+    def _check_empty_sections(self, file_path: Path, doc: MarkdownDocument):
+        """Check for sections with no content between headings."""
+        tokens = doc.tokens
+        for token in doc.headings:
+            # Numbered section
+            if 2 <= token.heading_level <= 4 and PATTERNS['numbered-section-text'].match(token.heading_text):
+                # Check if next non-empty line is another heading
+                j = token.number
+                has_content = False
+                while j < len(tokens):
+                    next_token = tokens[j]
+                    if not next_token.blank and not next_token.stripped.startswith('---'):
+                        if 2 <= next_token.heading_level <= 4:
+                            # Found another heading without content
+                            if not has_content:
+                                self.add_issue(ValidationIssue(
+                                    file=file_path.name,
+                                    line=token.number,
+                                    rule='empty-sections',
+                                    severity='warning',
+                                    message='Section appears to have no content before next heading',
+                                    suggestion='Add content or remove empty section'
+                                ))
+                        else:
+                            has_content = True
+                        break
+                    j += 1
+    
+    def _check_code_block_syntax(self, file_path: Path, doc: MarkdownDocument):
+        """Check code blocks have proper syntax markers."""
+        in_code_block = False
+        code_block_start_line = 0
+        fence_char = None
+        
+        # Pair every fence line, whatever its character, so mismatches are reported
+        for token in doc.tokens:
+            if not token.fence:
+                continue
+            stripped = token.stripped
+            i = token.number
+            
+            if not in_code_block:
+                in_code_block = True
+                code_block_start_line = i
+                fence_char = stripped[0]
+                
+                # Check if language is specified
+                if len(stripped) == 3:  # Just ``` or ~~~
+                    self.add_issue(ValidationIssue(
+                        file=file_path.name,
+                        line=i,
+                        rule='code-block-syntax',
+                        severity='info',
+                        message='Code block missing language identifier',
+                        suggestion='Add language identifier (e.g., ```dart, ```json)'
+                    ))
+            else:
+                # Code block end
+                if stripped[0] != fence_char:
+                    self.add_issue(ValidationIssue(
+                        file=file_path.name,
+                        line=i,
+                        rule='code-block-syntax',
+                        severity='warning',
+                        message=f'Code block fence mismatch (started with {fence_char}, ended with {stripped[0]})',
+                        suggestion='Use consistent fence characters'
+                    ))
+                in_code_block = False
+                fence_char = None
+        
+        # Check for unclosed code block
+        if in_code_block:
+            self.add_issue(ValidationIssue(
+                file=file_path.name,
+                line=code_block_start_line,
+                rule='code-block-syntax',
+                severity='error',
+                message='Unclosed code block',
+                suggestion='Add closing fence (``` or ~~~)'
+            ))
+    
+    def _check_line_length(self, file_path: Path, doc: MarkdownDocument):
+        """Check for overly long lines that hurt readability."""
+        max_length = 120
+        in_table = False
+        
+        for token in doc.tokens:
+            # Skip code blocks
+            if token.fence_role or token.in_code:
+                continue
+            
+            # Skip tables
+            if token.has_pipe:
+                in_table = True
+                continue
+            elif in_table and token.blank:
+                in_table = False
+            
+            if in_table:
+                continue
+            
+            # Check line length
+            length = len(token.raw.rstrip())
+            if length > max_length:
+                # Allow URLs to exceed limit
+                if not PATTERNS['url'].search(token.raw):
+                    self.add_issue(ValidationIssue(
+                        file=file_path.name,
+                        line=token.number,
+                        rule='line-length',
+                        severity='info',
+                        message=f'Line exceeds {max_length} characters ({length} chars)',
+                        suggestion='Consider breaking into multiple lines for readability'
+                    ))
+    
+    def _check_list_consistency(self, file_path: Path, doc: MarkdownDocument):
+        """Check for consistent list formatting."""
+        list_markers = []
+        in_list = False
+        list_start = 0
+        
+        for token in doc.tokens:
+            marker = token.list_marker
+            
+            if marker:
+                if not in_list:
+                    in_list = True
+                    list_start = token.number
+                    list_markers = [marker]
+                else:
+                    list_markers.append(marker)
+            elif in_list and not token.blank:
+                # End of list
+                # Check if markers are consistent
+                unique_markers = set(list_markers)
+                if len(unique_markers) > 1:
+                    self.add_issue(ValidationIssue(
+                        file=file_path.name,
+                        line=list_start,
+                        rule='list-consistency',
+                        severity='info',
+                        message=f'Inconsistent list markers in same list: {unique_markers}',
+                        suggestion='Use consistent markers (-, *, or numbered) throughout list'
+                    ))
+                in_list = False
+                list_markers = []
+    
+    def _check_heading_capitalization(self, file_path: Path, doc: MarkdownDocument):
+        """Check heading capitalization for consistency."""
+        for token in doc.headings:
+            if token.heading_level >= 2:
+                heading_text = token.heading_text
+                
+                # Skip numbered sections
+                if PATTERNS['numbered-heading-text'].match(heading_text):
+                    continue
+                
+                # Check if it's title case or sentence case
+                words = heading_text.split()
+                if len(words) > 1:
+                    # Count capitalized words (excluding articles and prepositions)
+                    skip_words = {'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'}
+                    capitalized = sum(1 for w in words[1:] if w[0].isupper() and w.lower() not in skip_words)
+                    
+                    # If mixed capitalization, suggest consistency
+                    if 0 < capitalized < len(words) - 1:
+                        self.add_issue(ValidationIssue(
+                            file=file_path.name,
+                            line=token.number,
+                            rule='heading-capitalization',
+                            severity='info',
+                            message='Heading has inconsistent capitalization',
+                            suggestion='Use either Title Case or Sentence case consistently'
+                        ))
+    
+    def _check_duplicate_headings(self, file_path: Path, doc: MarkdownDocument):
+        """Check for duplicate headings within same file."""
+        headings_seen = {}
+        
+        for token in doc.headings:
+            if token.heading_level >= 2:
+                level = token.heading_level
+                text = token.heading_text.strip().lower()
+                
+                if text in headings_seen and headings_seen[text][0] == level:
+                    self.add_issue(ValidationIssue(
+                        file=file_path.name,
+                        line=token.number,
+                        rule='duplicate-headings',
+                        severity='warning',
+                        message=f'Duplicate heading "{token.heading_text}" (first seen at line {headings_seen[text][1]})',
+                        suggestion='Use unique headings or add distinguishing context'
+                    ))
+                else:
+                    headings_seen[text] = (level, token.number)
+    
+    def _check_emphasis_as_heading(self, file_path: Path, doc: MarkdownDocument):
+        """Check for bold/italic text used as headings (MD036)."""
+        tokens = doc.tokens
+        
+        for token in tokens:
+            # Skip code blocks
+            if token.fence_role or token.in_code:
+                continue
+            i = token.number
+            
+            # Check for bold text on its own line that looks like a heading
+            # Pattern: **Text** or **Text:** at start of line, with capital letter
+            bold_heading_match = PATTERNS['bold-heading'].match(token.stripped)
+            if bold_heading_match:
+                heading_text = bold_heading_match.group(1).strip()
+                # Avoid false positives for inline emphasis (check prev/next lines)
+                is_standalone = True
+                prev_line = tokens[i-2].stripped if i > 1 else ''
+                if prev_line and not prev_line.startswith('#'):
+                    # Has content right before - might be inline emphasis
+                    if not prev_line.endswith(('.', ':', '-', '*')) and len(prev_line) > 20:
+                        is_standalone = False
+                
+                if is_standalone:
+                    self.add_issue(ValidationIssue(
+                        file=file_path.name,
+                        line=i,
+                        rule='emphasis-as-heading',
+                        severity='warning',
+                        message=f'Bold text "{heading_text}" appears to be used as a heading',
+                        suggestion='Use proper heading syntax (####) instead of bold text for section headings'
+                    ))
+    
+    def _check_orphaned_content(self, file_path: Path, doc: MarkdownDocument):
+        """Check for content before first heading."""
+        found_heading = False
+        found_content = False
+        content_line = 0
+        
+        for token in doc.tokens:
+            if token.blank or token.stripped.startswith('<!--'):
+                continue
+            
+            if token.heading_level:
+                found_heading = True
+                if found_content and not found_heading:
+                    self.add_issue(ValidationIssue(
+                        file=file_path.name,
+                        line=content_line,
+                        rule='orphaned-content',
+                        severity='info',
+                        message='Content found before first heading',
+                        suggestion='Add heading or move content under appropriate section'
+                    ))
+                break
+            elif not found_heading:
+                if not found_content:
+                    found_content = True
+                    content_line = token.number
+    
+    def _check_terminology_consistency(self):
+        """Check for terminology consistency across all documents."""
+        heading_lines = {(file, line) for file, line, level, text in self.all_headings}
+        findings = {}
+        
+        for term_lower, counts in self.term_index.variations().items():
+            if len(counts) > 1:
+                # Multiple case variations found
+                # This is just info level since some variation may be intentional
+                most_common = TermIndex.preferred(counts)
+                variations = ', '.join(sorted(counts))
+                for var in sorted(counts):
+                    if var == most_common:
+                        continue
+                    for location in self.term_index.locations(var):
+                        # Report headings only, once per term
+                        if location in heading_lines and (location, term_lower) not in findings:
+                            findings[(location, term_lower)] = ValidationIssue(
+                                file=location[0],
+                                line=location[1],
+                                rule='terminology-consistency',
+                                severity='info',
+                                message=f'Term "{var}" has multiple case variations: {variations}',
+                                suggestion=f'Consider using consistent form: "{most_common}"'
+                            )
+        
+        # Emit in file and line order
+        file_order = {name: index for index, name in enumerate(self.file_names)}
+        for (file, line), term_lower in sorted(findings, key=lambda key: (file_order[key[0][0]], key[0][1], key[1])):
+            self.add_issue(findings[((file, line), term_lower)])
     
     def print_report(self):
         """Print validation report to console."""
@@ -294,26 +1203,136 @@ class DocumentValidator:
         print(f"\n📊 Summary: {errors} errors, {warnings} warnings, {infos} info")
 
 
-def main():
-    """Main entry point for the validation script."""
-    parser = argparse.ArgumentParser(
-        description='Validate AshTrail documentation against defined standards'
-    )
+# SARIF result level for each issue severity
+SARIF_LEVELS = {'error': 'error', 'warning': 'warning', 'info': 'note'}
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+# uriBaseId that every artifactLocation.uri is relative to: the repository root
+SARIF_SRCROOT = '%SRCROOT%'
+
+
+def _rule_description(rule: str) -> Optional[str]:
+    """First line of a registered rule's docstring, without the "Rule: " prefix."""
+    method = FILE_RULES.get(rule) or CROSS_FILE_RULES.get(rule)
+    doc = getattr(DocumentValidator, method).__doc__ if method else None
+    if not doc:
+        return None
+    summary = doc.strip().splitlines()[0]
+    return summary[len('Rule: '):] if summary.startswith('Rule: ') else summary
+
+
+class JsonLinesEmitter:
+    """One JSON object per issue, flushed as soon as it is found."""
+    
+    def __init__(self, out: TextIO, docs_path: Path, rules: List[str]):
+        self.out = out
+    
+    def issue(self, issue: ValidationIssue):
+        self.out.write(json.dumps(asdict(issue)) + '\n')
+        self.out.flush()
+    
+    def close(self):
+        pass
+
+
+class SarifEmitter:
+    """SARIF 2.1.0 log written incrementally: run header, one result per issue, then the footer."""
+    
+    def __init__(self, out: TextIO, docs_path: Path, rules: List[str]):
+        self.out = out
+        self.docs_path = docs_path.resolve()
+        self.results = 0
+        # URIs are relative to the repository root wherever the run started,
+        # so code scanning can map them onto the checkout
+        try:
+            self.root = repo_root(self.docs_path).resolve()
+        except GitScopeError:
+            self.root = PROJECT_ROOT
+        
+        descriptors = []
+        for rule in rules:
+            description = _rule_description(rule)
+            if description is not None:
+                descriptors.append({'id': rule, 'shortDescription': {'text': description}})
+        tool = {'driver': {'name': 'validate_docs', 'version': VALIDATOR_VERSION, 'rules': descriptors}}
+        base_ids = {SARIF_SRCROOT: {'uri': self.root.as_uri() + '/'}}
+        
+        self.out.write(f'{{"version": "2.1.0", "$schema": {json.dumps(SARIF_SCHEMA)}, '
+                       f'"runs": [{{"tool": {json.dumps(tool)}, '
+                       f'"originalUriBaseIds": {json.dumps(base_ids)}, "results": [\n')
+        self.out.flush()
+    
+    def _uri(self, filename: str) -> str:
+        path = Path(os.path.relpath(self.docs_path / filename, self.root))
+        return quote(path.as_posix())
+    
+    def issue(self, issue: ValidationIssue):
+        result = {
+            'ruleId': issue.rule,
+            'level': SARIF_LEVELS.get(issue.severity, 'none'),
+            'message': {'text': issue.message},
+            'locations': [{
+                'physicalLocation': {
+                    'artifactLocation': {'uri': self._uri(issue.file), 'uriBaseId': SARIF_SRCROOT},
+                    'region': {'startLine': issue.line},
+                },
+            }],
+        }
+        if issue.suggestion:
+            result['properties'] = {'suggestion': issue.suggestion}
+        self.out.write((',\n' if self.results else '') + json.dumps(result))
+        self.out.flush()
+        self.results += 1
+    
+    def close(self):
+        self.out.write('\n]}]}\n')
+        self.out.flush()
+
+
+EMITTERS = {
+    'jsonl': JsonLinesEmitter,
+    'sarif': SarifEmitter,
+}
+
+
+def _validate_file_worker(args: Tuple[Path, Path, List[str], Tuple[str, ...]]) -> FileResult:
+    """Process pool entry point: validate one file in a fresh validator."""
+    docs_path, file_path, rules, terms = args
+    return DocumentValidator(docs_path, terms=terms)._validate_isolated(file_path, rules)
+
+
+def run_cli(description: str, validator_class: type = DocumentValidator,
+            rule_sets: Dict[str, List[str]] = RULE_SETS, default_exclude: str = 'combined.md',
+            fixable: bool = True, cacheable: bool = True,
+            title: str = 'Validating documentation in') -> int:
+    """Command-line flow shared by validate_docs.py and validate_docs_extended.py.
+    
+    `rule_sets` resolves --rules (and decides what "all" means), and
+    `fixable` / `cacheable` add the --fix and --no-cache / --cache-file
+    options. The report is printed by `validator_class.print_report`.
+    """
+    parser = argparse.ArgumentParser(description=description)
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Show detailed output during validation'
     )
+    if fixable:
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help=f"Fix {', '.join(sorted(FIXABLE_RULES))} issues in place, then report what remains"
+        )
     parser.add_argument(
         '--rules',
         type=str,
         default='all',
-        help='Comma-separated list of rules to run (default: all)'
+        help=f"Comma-separated list of rules or rule sets ({', '.join(rule_sets)}) to run (default: all)"
     )
     parser.add_argument(
         '--exclude',
         type=str,
-        default='combined.md',
+        default=default_exclude,
         help='Comma-separated list of file patterns to exclude'
     )
     parser.add_argument(
@@ -322,8 +1341,86 @@ def main():
         default=None,
         help='Path to docs/plan directory (default: auto-detect)'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes for per-file validation (default: 1)'
+    )
+    if cacheable:
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Re-validate every file instead of replaying cached results'
+        )
+        parser.add_argument(
+            '--cache-file',
+            type=str,
+            default=str(DEFAULT_CACHE_FILE),
+            help='Path to the validation result cache'
+        )
+    parser.add_argument(
+        '--terms',
+        type=str,
+        default=None,
+        help=f"Comma-separated terms checked by terminology-consistency (default: {', '.join(DEFAULT_TERMS)})"
+    )
+    parser.add_argument(
+        '--terms-file',
+        type=str,
+        default=None,
+        help='File with one term per line to check (combined with --terms)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['text', *sorted(EMITTERS)],
+        default='text',
+        help='Report format; jsonl and sarif are streamed as issues are found (default: text)'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=str,
+        default=None,
+        help='Write the report here instead of stdout'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Report per-rule and per-file timings and regex call counts (runs in-process, without the cache)'
+    )
+    parser.add_argument(
+        '--profile-rule',
+        type=str,
+        default=None,
+        help='Also capture a cProfile of this rule (implies --profile)'
+    )
+    parser.add_argument(
+        '--profile-out',
+        type=str,
+        default=None,
+        help='Save the --profile-rule cProfile stats to this file (for snakeviz, pstats, ...)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and re-validate files as they are saved (uses watchdog if installed)'
+    )
+    scope_group = parser.add_mutually_exclusive_group()
+    scope_group.add_argument(
+        '--changed-since',
+        type=str,
+        default=None,
+        metavar='REF',
+        help='Only check files changed since this git ref, and line-local rules only on changed lines'
+    )
+    scope_group.add_argument(
+        '--staged',
+        action='store_true',
+        help='Like --changed-since, for the changes staged for commit (pre-commit hooks)'
+    )
     
     args = parser.parse_args()
+    fix = fixable and args.fix
     
     # Determine docs path
     if args.path:
@@ -338,33 +1435,90 @@ def main():
         return 2
     
     # Parse rules
-    if args.rules == 'all':
-        rules = [
-            'heading-depth',
-            'section-numbering',
-            'standard-sections',
-            'table-formatting',
-            'trailing-whitespace'
-        ]
-    else:
-        rules = [r.strip() for r in args.rules.split(',')]
+    rules = resolve_rules(args.rules, rule_sets)
+    try:
+        terms = resolve_terms(args.terms, args.terms_file)
+    except OSError as e:
+        print(f"❌ Error: Unable to read terms file: {e}", file=sys.stderr)
+        return 2
     
     # Parse exclude patterns
     exclude = [p.strip() for p in args.exclude.split(',') if p.strip()]
     
+    profile = args.profile or args.profile_rule is not None
+    
     # Run validation
-    validator = DocumentValidator(docs_path, verbose=args.verbose)
+    cache = ResultCache(Path(args.cache_file)) if cacheable and not args.no_cache else None
+    validator = validator_class(docs_path, verbose=args.verbose, cache=cache, jobs=args.jobs,
+                                terms=terms)
     
-    print(f"🔍 Validating documentation in: {docs_path}")
-    print(f"📋 Running rules: {', '.join(rules)}")
-    default_excludes = ['combined.md', 'hidden files (._*)']
-    all_excludes = default_excludes + exclude if exclude else default_excludes
-    print(f"🚫 Excluding: {', '.join(all_excludes)}")
-    print()
+    if args.watch and args.format != 'text':
+        print("❌ Error: --watch only supports --format text", file=sys.stderr)
+        return 2
+    if args.watch and profile:
+        print("❌ Error: --profile cannot be combined with --watch", file=sys.stderr)
+        return 2
+    if profile:
+        # Timings and regex counts are gathered in this process, for every file
+        validator.jobs = 1
+        validator.cache = None
+        validator.profiler = RuleProfiler(args.profile_rule)
+    if args.watch and fix:
+        print("❌ Error: --fix cannot be combined with --watch", file=sys.stderr)
+        return 2
+    
+    scoped = args.staged or args.changed_since is not None
+    if scoped:
+        if args.watch:
+            print("❌ Error: --changed-since / --staged cannot be combined with --watch", file=sys.stderr)
+            return 2
+        try:
+            validator.scope, partly_staged = validation_scope(docs_path, since=args.changed_since,
+                                                              staged=args.staged)
+        except GitScopeError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return 2
+        for name in sorted(partly_staged):
+            print(f"⚠️  {name} has unstaged changes; checking the working-tree copy", file=sys.stderr)
     
     try:
-        validator.validate_all(rules, exclude)
-        validator.print_report()
+        with open(args.output, 'w', encoding='utf-8') if args.output else nullcontext(sys.stdout) as out:
+            # Structured formats own the output; progress text goes to stderr
+            emitter = EMITTERS[args.format](out, docs_path, rules) if args.format in EMITTERS else None
+            with redirect_stdout(out if emitter is None else sys.stderr):
+                print(f"🔍 {title}: {docs_path}")
+                print(f"📋 Running rules: {', '.join(rules)}")
+                default_excludes = ['combined.md', 'hidden files (._*)']
+                all_excludes = default_excludes + exclude if exclude else default_excludes
+                print(f"🚫 Excluding: {', '.join(all_excludes)}")
+                if scoped:
+                    changes = 'staged changes' if args.staged else f"changes since {args.changed_since}"
+                    print(f"🔀 Checking {changes}: {len(validator.scope)} file(s)")
+                print()
+                
+                if fix:
+                    applied, rewritten, conflicts = validator.apply_fixes(rules, exclude)
+                    print(f"🔧 Applied {applied} fix(es) in {rewritten} file(s)")
+                    if conflicts:
+                        print(f"⚠️  Skipped {conflicts} overlapping fix(es); run --fix again to apply them")
+                    print()
+                
+                if args.watch:
+                    validator.watch(rules, exclude, validator.print_report)
+                    return 0
+                
+                if emitter is not None:
+                    validator.on_issue = emitter.issue
+                if profile:
+                    validator.profile_all(rules, exclude)
+                else:
+                    validator.validate_all(rules, exclude)
+                if emitter is not None:
+                    emitter.close()
+                else:
+                    validator.print_report()
+                if profile:
+                    validator.profiler.report(profile_out=args.profile_out)
         
         # Return appropriate exit code
         has_errors = any(i.severity == 'error' for i in validator.issues)
@@ -378,5 +1532,10 @@ def main():
         return 2
 
 
+def main():
+    """Main entry point for the validation script."""
+    return run_cli('Validate AshTrail documentation against defined standards')
+
+
 if __name__ == '__main__':
     sys.exit(main())
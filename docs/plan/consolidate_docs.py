@@ -5,9 +5,23 @@ Markdown Documentation Consolidator
 This script can combine multiple numbered markdown files into a single
 consolidated document, or split a consolidated document back into individual files.
 
+combine also writes sidecars next to the output:
+    OUTPUT.manifest.json  each section's filename, anchor, byte offset, byte
+                          length and content hash (used by `get` to read one
+                          section without the rest), plus the source hashes
+                          and link rewrites used by --incremental and split
+    OUTPUT.anchors.json   the heading-anchor index of the whole document
+
+With --volume-size, the sections go to OUTPUT.vol01.md, OUTPUT.vol02.md, ...
+(each with its own manifest), and OUTPUT becomes a master index whose
+manifest lists the volumes; split and get follow it to every volume.
+
 Usage:
-    python consolidate_docs.py combine [--output OUTPUT] [--input-dir INPUT_DIR]
+    python consolidate_docs.py combine [--output OUTPUT] [--input-dir INPUT_DIR] [--incremental]
+                                       [--volume-size SIZE] [--search-index]
     python consolidate_docs.py split [--input INPUT] [--output-dir OUTPUT_DIR]
+    python consolidate_docs.py get NAME [--input INPUT] [--raw]
+    python consolidate_docs.py search QUERY [--index INDEX_DIR] [--limit N]
 
 Examples:
     # Combine all markdown files in current directory
@@ -16,15 +30,343 @@ Examples:
     # Combine files from specific directory
     python consolidate_docs.py combine --input-dir ./docs/plan --output combined.md
 
+    # Only regenerate the sections of files changed since the last combine
+    python consolidate_docs.py combine --output combined.md --incremental
+
+    # Write volumes of at most ~100 KB (combined.vol01.md, ...) and a master index
+    python consolidate_docs.py combine --output combined.md --volume-size 100K
+
+    # Print one file from the consolidated document without reading the rest
+    python consolidate_docs.py get "7. Data Persistence" --input combined.md
+
+    # Also write a sharded search index to combined.search/, then query it
+    python consolidate_docs.py combine --output combined.md --search-index
+    python consolidate_docs.py search "offline sync" --index combined.search
+
     # Split consolidated file back into individual files
     python consolidate_docs.py split --input combined.md --output-dir ./output
 """
 
 import argparse
+import hashlib
+import io
+import json
+import mmap
 import os
 import re
+import shutil
+import sys
+import tempfile
+from collections import defaultdict
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Iterator, List, Set, Tuple, Optional
+from urllib.parse import unquote
+
+
+class AnchorIndex:
+    """
+    Unique anchors for every document and heading of a consolidated document.
+
+    Heading anchors follow GitHub's scheme (lowercase, punctuation dropped,
+    spaces to hyphens, "-1", "-2", ... appended on collisions) applied to
+    the whole consolidated document in order, so they match the ids the
+    renderer generates. Links are resolved with dictionary lookups by
+    document title, heading text, or the anchor a heading had in its own file.
+
+    When the output is split into volumes, each volume is a separate page
+    (see new_page()) with its own collision suffixes, and links to another
+    volume point at that page.
+    """
+
+    # Leading section number of a heading: "7.1 Overview" -> "Overview"
+    SECTION_NUMBER = re.compile(r'^\d+(?:\.\d+)*\.?\s+')
+
+    def __init__(self, reserved: Tuple[str, ...] = ()):
+        # Document title ("1. Project Overview") -> file anchor
+        self.documents: Dict[str, str] = {}
+        # (title, lowercased heading text, with and without its section number) -> first anchor
+        self.headings: Dict[Tuple[str, str], str] = {}
+        # (title, anchor within the file on its own) -> anchor in the consolidated document
+        self.local: Dict[Tuple[str, str], str] = {}
+        # Anchor -> where its heading came from
+        self.entries: Dict[str, dict] = {}
+        # Filename -> its heading anchors in document order
+        self.sections: Dict[str, List[str]] = {}
+        # Document title -> page (output file name) it is on; '' when there is one page
+        self.page_of: Dict[str, str] = {}
+        self.page = ''
+        self._seen: Set[str] = set()
+        self.new_page('', reserved)
+
+    def new_page(self, page: str, reserved: Tuple[str, ...] = ()) -> None:
+        """
+        Start the next output page; later documents get anchors unique within it.
+
+        Args:
+            page: The page's file name, used in links from other pages
+            reserved: Headings outside the source files (e.g. the page title)
+        """
+        self.page = page
+        self._seen = set()
+        for text in reserved:
+            self._unique(self.slugify(text), self._seen)
+
+    def href(self, title: str, anchor: str, from_title: Optional[str] = None) -> str:
+        """Link to `anchor` in document `title`, from document `from_title` (or from another page)."""
+        page = self.page_of[title]
+        if from_title is not None and self.page_of[from_title] == page:
+            return f"#{anchor}"
+        return f"{page}#{anchor}"
+
+    @staticmethod
+    def slugify(text: str) -> str:
+        """GitHub-style anchor for heading text, before collision suffixes."""
+        return re.sub(r'[^\w\- ]', '', text.strip().lower()).replace(' ', '-')
+
+    @staticmethod
+    def _unique(slug: str, seen: Set[str]) -> str:
+        anchor, suffix = slug, 0
+        while anchor in seen:
+            suffix += 1
+            anchor = f"{slug}-{suffix}"
+        seen.add(anchor)
+        return anchor
+
+    def add_document(self, filename: str, anchor: str, headings: List[list]) -> None:
+        """
+        Index one document's file anchor and its headings, in document order.
+
+        Args:
+            filename: The source filename (e.g., "1. Project Overview.md")
+            anchor: The file anchor written before its section
+            headings: [level, text, line] for each heading in the file
+        """
+        title = filename.rsplit('.md', 1)[0]
+        self.documents[title] = anchor
+        self.page_of[title] = self.page
+        local_seen: Set[str] = set()
+        self.sections[filename] = []
+        for level, text, line in headings:
+            slug = self.slugify(text)
+            heading_anchor = self._unique(slug, self._seen)
+            self.sections[filename].append(heading_anchor)
+            self.local.setdefault((title, self._unique(slug, local_seen)), heading_anchor)
+            self.headings.setdefault((title, text.lower()), heading_anchor)
+            self.headings.setdefault((title, self.SECTION_NUMBER.sub('', text).lower()), heading_anchor)
+            self.entries[self.href(title, heading_anchor).lstrip('#')] = {
+                'file': filename, 'heading': text, 'level': level, 'line': line}
+
+    def resolve_wiki(self, target: str, title: str) -> Optional[str]:
+        """
+        Link destination for a wiki link target: "Doc", "Doc#Heading" or "#Heading".
+
+        Args:
+            target: Link target without any "|alias"
+            title: Title of the document containing the link
+        """
+        doc, _, heading = target.partition('#')
+        doc = doc.strip() or title
+        if doc not in self.documents:
+            return None
+        if not heading.strip():
+            anchor = self.documents[doc]
+        else:
+            heading = heading.strip()
+            anchor = self.headings.get((doc, heading.lower())) or self.local.get((doc, self.slugify(heading)))
+        return self.href(doc, anchor, title) if anchor else None
+
+    def resolve_url(self, url: str, title: str) -> Optional[str]:
+        """
+        Link destination for a markdown link to "#section" or another numbered document.
+
+        Args:
+            url: Link destination (e.g., "#overview" or "7.%20Data%20Persistence.md#hive")
+            title: Title of the document containing the link
+        """
+        path, _, fragment = unquote(url).partition('#')
+        if path:
+            if '://' in path or not path.endswith('.md'):
+                return None
+            doc = Path(path).name.rsplit('.md', 1)[0]
+            if doc not in self.documents:
+                return None
+            if not fragment:
+                return self.href(doc, self.documents[doc], title)
+        elif fragment:
+            doc = title
+        else:
+            return None
+        anchor = self.local.get((doc, fragment))
+        return self.href(doc, anchor, title) if anchor else None
+
+    def digest(self) -> str:
+        """Hash of everything links resolve against, to tell when rewritten links may change."""
+        state = [sorted(self.documents.items()), sorted(self.headings.items()), sorted(self.local.items()),
+                 sorted(self.page_of.items())]
+        return hashlib.sha256(json.dumps(state).encode('utf-8')).hexdigest()
+
+    def to_json(self) -> dict:
+        """The index as written to the anchors sidecar."""
+        return {
+            'documents': {f"{title}.md": self.href(title, anchor).lstrip('#')
+                          for title, anchor in self.documents.items()},
+            'anchors': self.entries,
+        }
+
+
+class SearchIndex:
+    """
+    Prebuilt full-text index over the sections of a consolidated document.
+
+    Each heading starts a section (text before a file's first heading
+    belongs to the file anchor). Terms map to postings [section id,
+    [positions]] sorted by section id, positions counting every token of the
+    section. Postings are sharded into one JSON file per term prefix, so a
+    search loads only the shards its query terms fall in. Clients must
+    tokenize and stem queries the same way; meta.json carries the settings.
+    """
+
+    VERSION = 1
+
+    TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+    MIN_TOKEN_LENGTH = 2
+    STOPWORDS = frozenset((
+        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if', 'in', 'into', 'is',
+        'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'were', 'will', 'with',
+    ))
+    # (suffix, replacement) tried in order; the first suffix found is replaced
+    SUFFIXES = (('sses', 'ss'), ('ies', 'y'), ('ss', 'ss'), ('ing', ''), ('ed', ''), ('ly', ''), ('s', ''))
+    MIN_STEM = 3
+
+    def __init__(self, prefix_length: int = 2):
+        self.prefix_length = prefix_length
+        # Section id -> [anchor, filename, heading, page ('' unless the output has volumes)]
+        self.sections: List[List[str]] = []
+        # Term -> {section id: positions}
+        self.postings: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+
+    @classmethod
+    def stem(cls, word: str) -> str:
+        """Strip a common suffix, then a trailing "e" ("caches", "cached", "cache" -> "cach")."""
+        if word.isdigit():
+            return word
+        for suffix, replacement in cls.SUFFIXES:
+            if word.endswith(suffix):
+                if len(word) - len(suffix) + len(replacement) >= cls.MIN_STEM:
+                    word = word[:-len(suffix)] + replacement
+                break
+        if word.endswith('e') and len(word) > cls.MIN_STEM:
+            word = word[:-1]
+        return word
+
+    @classmethod
+    def tokenize(cls, text: str, position: int = 0) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (position, term) for the indexed words of text.
+
+        Stopwords and very short words are not indexed but still take up a position.
+        """
+        for word in cls.TOKEN_PATTERN.findall(text.lower()):
+            if len(word) >= cls.MIN_TOKEN_LENGTH and word not in cls.STOPWORDS:
+                yield position, cls.stem(word)
+            position += 1
+
+    def add_section(self, anchor: str, filename: str, heading: str, page: str = '') -> int:
+        """Start a new section; returns its id."""
+        self.sections.append([anchor, filename, heading, page])
+        return len(self.sections) - 1
+
+    def add_text(self, section_id: int, text: str, position: int) -> int:
+        """Index text at `position` in a section; returns the position after it."""
+        for position, term in self.tokenize(text, position):
+            self.postings[term].setdefault(section_id, []).append(position)
+        return position + 1
+
+    def shard_key(self, term: str) -> str:
+        return term[:self.prefix_length]
+
+    def write(self, index_dir: Path, fingerprint: str) -> int:
+        """
+        Write meta.json and one shard per term prefix; returns the number of shards.
+
+        Shards listed by a previous meta.json that are no longer produced are removed.
+        """
+        index_dir.mkdir(parents=True, exist_ok=True)
+        shards: Dict[str, Dict[str, list]] = defaultdict(dict)
+        for term in sorted(self.postings):
+            postings = self.postings[term]
+            shards[self.shard_key(term)][term] = [[section_id, postings[section_id]]
+                                                  for section_id in sorted(postings)]
+
+        previous = self.load_meta(index_dir)
+        for key in set(previous['shards'] if previous else ()) - set(shards):
+            (index_dir / f"{key}.json").unlink(missing_ok=True)
+
+        for key, terms in shards.items():
+            with open(index_dir / f"{key}.json", 'w', encoding='utf-8') as f:
+                json.dump(terms, f, separators=(',', ':'))
+
+        meta = {
+            'version': self.VERSION,
+            'fingerprint': fingerprint,
+            'prefix_length': self.prefix_length,
+            'min_token_length': self.MIN_TOKEN_LENGTH,
+            'stopwords': sorted(self.STOPWORDS),
+            'suffixes': self.SUFFIXES,
+            'min_stem': self.MIN_STEM,
+            'sections': self.sections,
+            'shards': sorted(shards),
+        }
+        with open(index_dir / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, separators=(',', ':'), ensure_ascii=False)
+        return len(shards)
+
+    @classmethod
+    def load_meta(cls, index_dir: Path) -> Optional[dict]:
+        """The index's meta.json, or None if missing or from another index version."""
+        try:
+            with open(index_dir / 'meta.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('version') == cls.VERSION else None
+
+    @classmethod
+    def search(cls, index_dir: Path, query: str, limit: int = 10) -> List[Tuple[List[str], int]]:
+        """
+        Find sections containing every query term, loading only the shards needed.
+
+        Returns:
+            ([anchor, filename, heading, page], number of term occurrences) for the
+            best matches, most occurrences first.
+        """
+        meta = cls.load_meta(index_dir)
+        if meta is None:
+            raise FileNotFoundError(f"No search index in {index_dir}")
+        terms = {term for _, term in cls.tokenize(query)}
+        if not terms:
+            return []
+
+        shards: Dict[str, dict] = {}
+        matches: Optional[Dict[int, int]] = None
+        for term in sorted(terms):
+            key = term[:meta['prefix_length']]
+            if key not in shards:
+                shard_file = index_dir / f"{key}.json"
+                with open(shard_file, 'r', encoding='utf-8') if shard_file.exists() else nullcontext() as f:
+                    shards[key] = json.load(f) if f else {}
+            postings = {section_id: len(positions) for section_id, positions in shards[key].get(term, [])}
+            if matches is None:
+                matches = postings
+            else:
+                matches = {section_id: count + postings[section_id]
+                           for section_id, count in matches.items() if section_id in postings}
+            if not matches:
+                return []
+
+        ranked = sorted(matches.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(meta['sections'][section_id], count) for section_id, count in ranked]
 
 
 class MarkdownConsolidator:
@@ -34,6 +376,29 @@ class MarkdownConsolidator:
     FILE_SEPARATOR = "\n---\n\n"
     FILE_HEADER = "<!-- FILE: {} -->\n\n"
 
+    # Line patterns used by split: a file marker (confirmed by the blank line
+    # after it) and the navigation anchor written right after it
+    MARKER_LINE = re.compile(r'^<!-- FILE: (.+?) -->\n$')
+    ANCHOR_LINE = re.compile(r'^<a id="[^"]+"></a>\n$')
+
+    # Buffer size for copying source files into the consolidated document
+    COPY_CHUNK_SIZE = 64 * 1024
+
+    # Bump when the section layout or link rendering changes so old manifests are not reused
+    MANIFEST_VERSION = 5
+
+    DOCUMENT_TITLE = "AshTrail - Consolidated Documentation"
+
+    # ATX heading on a stripped line, without closing #s; fence openers
+    HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)(?:\s+#+)?$')
+    FENCES = ('```', '~~~')
+
+    # `code span` (matched first so links inside it are left alone), [[wiki link]]
+    # or [text](destination), not images
+    LINK_PATTERN = re.compile(r'(?P<code>(`+).+?(?<!`)\2(?!`))'
+                              r'|\[\[(?P<wiki>.+?)\]\]'
+                              r'|(?<!!)\[(?P<text>[^\]\n]*)\]\((?P<url>[^)\s]+)\)')
+
     def __init__(self):
         self.file_pattern = re.compile(r'^(\d+)\.\s+(.+)\.md$')
 
@@ -72,41 +437,474 @@ class MarkdownConsolidator:
         anchor = name.lower().replace(' ', '-').replace('.', '')
         return anchor
 
-    def convert_toc_links(self, content: str, files: List[Tuple[int, Path]]) -> str:
+    def convert_links(self, line: str, title: str, index: AnchorIndex, rewrites: List[list]) -> str:
         """
-        Convert wiki-style links [[...]] to markdown links in table of contents.
-        
+        Point wiki-style [[...]] links and #section / document links at consolidated anchors.
+
         Args:
-            content: The content with wiki-style links
-            files: List of (number, filepath) tuples for generating anchors
-            
+            line: One line of the document being combined
+            title: The document's title (filename without .md)
+            index: Anchors of every document and heading
+            rewrites: Receives [new, original] for each rewritten link, so split can undo it
+
         Returns:
-            Content with converted links
+            The line with every resolvable link rewritten; others are left as they are.
         """
-        # Create a mapping of link text to anchors
-        link_map = {}
-        for number, filepath in files:
-            # Match patterns like "1. Project Overview"
-            link_text = filepath.name.rsplit('.md', 1)[0]
-            anchor = self.generate_anchor(filepath.name)
-            link_map[link_text] = anchor
-        
-        # Replace [[text]] with [text](#anchor)
         def replace_link(match):
-            link_text = match.group(1)
-            if link_text in link_map:
-                return f"[{link_text}](#{link_map[link_text]})"
-            return match.group(0)  # Return original if no match
-        
-        return re.sub(r'\[\[(.+?)\]\]', replace_link, content)
+            if match.group('code') is not None:
+                return match.group(0)
+            if match.group('wiki') is not None:
+                # [[target]] or [[target|text]] -> [text](#anchor)
+                target, _, alias = match.group('wiki').partition('|')
+                href = index.resolve_wiki(target, title)
+                new = f"[{alias or self.wiki_text(target)}]({href})" if href else None
+            else:
+                href = index.resolve_url(match.group('url'), title)
+                new = f"[{match.group('text')}]({href})" if href else None
+            if new is None or new == match.group(0):
+                return match.group(0)  # Return original if no match
+            rewrites.append([new, match.group(0)])
+            return new
+
+        return self.LINK_PATTERN.sub(replace_link, line)
+
+    @staticmethod
+    def wiki_text(target: str) -> str:
+        """Link text for an unaliased wiki link: "Doc", "Doc › Heading" or "Heading"."""
+        doc, _, heading = target.partition('#')
+        doc, heading = doc.strip(), heading.strip()
+        if not heading:
+            return doc
+        return f"{doc} › {heading}" if doc else heading
+
+    def restore_links(self, content: str, rewrites: List[list]) -> str:
+        """
+        Undo the link rewrites combine recorded for a section, in order.
+
+        Rewrites whose text no longer appears (e.g. after editing the
+        consolidated file) are skipped.
+        """
+        parts = []
+        pos = 0
+        for new, original in rewrites:
+            found = content.find(new, pos)
+            if found < 0:
+                continue
+            parts.append(content[pos:found])
+            parts.append(original)
+            pos = found + len(new)
+        parts.append(content[pos:])
+        return ''.join(parts)
+
+    def manifest_path(self, output_file: Path) -> Path:
+        """Sidecar manifest describing the sections of a consolidated file."""
+        return output_file.with_suffix('.manifest.json')
+
+    def anchors_path(self, output_file: Path) -> Path:
+        """Sidecar with the heading-anchor index of a consolidated file."""
+        return output_file.with_suffix('.anchors.json')
+
+    def load_manifest(self, output_file: Path, check_output: bool = True) -> Optional[dict]:
+        """
+        Load the manifest written by the last combine into output_file.
+
+        Args:
+            output_file: The consolidated file
+            check_output: Reject the manifest if the output was modified since
 
-    def combine(self, input_dir: Path, output_file: Path) -> None:
+        Returns:
+            The manifest, or None if it is missing, from another manifest
+            version or platform, or (with check_output) out of date.
+        """
+        try:
+            with open(self.manifest_path(output_file), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            stat = output_file.stat()
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get('version') != self.MANIFEST_VERSION or manifest.get('newline') != os.linesep:
+            return None
+        if check_output and manifest.get('output') != [stat.st_mtime_ns, stat.st_size]:
+            return None
+        return manifest
+
+    def write_manifest(self, output_file: Path, titles: List[str], index_digest: str,
+                       sections: List[dict], header: str, volumes: Optional[List[dict]] = None) -> None:
+        """
+        Record the source state and byte range of every section of output_file.
+
+        Args:
+            output_file: The consolidated file just written
+            titles: Source filenames in output order
+            index_digest: AnchorIndex.digest() of the index links were resolved against
+            sections: Per-section dicts (file, anchor, source state, rewrites, offset,
+                length and content_hash of the section's bytes)
+            header: Text written before the first section
+            volumes: For a master index, each volume's file and the files it holds
+        """
+        stat = output_file.stat()
+        manifest = {
+            'version': self.MANIFEST_VERSION,
+            'newline': os.linesep,
+            'output': [stat.st_mtime_ns, stat.st_size],
+            'titles': titles,
+            'index': index_digest,
+            'header': header,
+            'sections': sections,
+        }
+        if volumes is not None:
+            manifest['volumes'] = volumes
+        with open(self.manifest_path(output_file), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+            f.write('\n')
+
+    def scan_source(self, filepath: Path, previous: Optional[dict]) -> dict:
+        """
+        Hash, stat, headings and link presence of a source file, in one read.
+
+        Args:
+            filepath: Source markdown file
+            previous: The file's section entry from the last manifest, if any
+
+        Returns:
+            Dict with hash, stat, headings ([level, text, line]) and has_links;
+            taken from `previous` without reading if the stat is unchanged.
+        """
+        stat = filepath.stat()
+        stat_key = [stat.st_mtime_ns, stat.st_size]
+        if previous is not None and previous.get('stat') == stat_key:
+            return {key: previous[key] for key in ('hash', 'stat', 'headings', 'has_links')}
+
+        digest = hashlib.sha256()
+        headings = []
+        has_links = False
+        in_fence = False
+        with open(filepath, 'rb') as f:
+            for line_num, raw in enumerate(f, 1):
+                digest.update(raw)
+                line = raw.decode('utf-8').strip()
+                if line.startswith(self.FENCES):
+                    in_fence = not in_fence
+                elif not in_fence:
+                    match = self.HEADING_PATTERN.match(line)
+                    if match:
+                        headings.append([len(match.group(1)), match.group(2), line_num])
+                    has_links = has_links or '[[' in line or '](' in line
+        return {'hash': digest.hexdigest(), 'stat': stat_key, 'headings': headings, 'has_links': has_links}
+
+    def write_section(self, outfile, filepath: Path, index: AnchorIndex, has_links: bool) -> List[list]:
+        """
+        Write one source file's section: marker, navigation anchor and content.
+
+        Args:
+            outfile: Open text output file
+            filepath: Source markdown file
+            index: Anchors that links are resolved against
+            has_links: Whether the file contains links to rewrite
+
+        Returns:
+            The [new, original] link rewrites made in the section.
+        """
+        # Write file marker
+        outfile.write(self.FILE_HEADER.format(filepath.name))
+
+        # Add anchor for navigation
+        anchor = self.generate_anchor(filepath.name)
+        outfile.write(f'<a id="{anchor}"></a>\n\n')
+
+        rewrites: List[list] = []
+        with open(filepath, 'r', encoding='utf-8') as infile:
+            if not has_links:
+                # Copy file content in chunks
+                shutil.copyfileobj(infile, outfile, self.COPY_CHUNK_SIZE)
+                return rewrites
+
+            # Rewrite links line by line, outside fenced code blocks
+            title = filepath.name.rsplit('.md', 1)[0]
+            in_fence = False
+            for line in infile:
+                if line.strip().startswith(self.FENCES):
+                    in_fence = not in_fence
+                elif not in_fence and ('[[' in line or '](' in line):
+                    line = self.convert_links(line, title, index, rewrites)
+                outfile.write(line)
+
+        if rewrites:
+            print(f"  → Converted {len(rewrites)} link(s)")
+        return rewrites
+
+    def search_index_path(self, output_file: Path) -> Path:
+        """Directory holding the sharded search index of a consolidated file."""
+        return output_file.with_suffix('.search')
+
+    def write_search_index(self, files: List[Tuple[int, Path]], index: AnchorIndex, index_dir: Path,
+                           fingerprint: str, prefix_length: int) -> None:
+        """
+        Build and write the search index, unless the one in index_dir is already current.
+
+        Args:
+            files: The files combined, in output order
+            index: Anchors of every document and heading (sections are split at headings)
+            index_dir: Directory for meta.json and the shards
+            fingerprint: Identifies the sources and anchors the index is built from
+            prefix_length: Length of the term prefix shards are keyed by
+        """
+        meta = SearchIndex.load_meta(index_dir)
+        if meta is not None and meta['fingerprint'] == fingerprint and meta['prefix_length'] == prefix_length:
+            print(f"  Search index in {index_dir} is up to date")
+            return
+
+        search = SearchIndex(prefix_length)
+        for number, filepath in files:
+            title = filepath.name.rsplit('.md', 1)[0]
+            page = index.page_of[title]
+            anchors = iter(index.sections[filepath.name])
+            section = search.add_section(self.generate_anchor(filepath.name), filepath.name, title, page)
+            position = 0
+            in_fence = False
+            with open(filepath, 'r', encoding='utf-8') as infile:
+                for line in infile:
+                    stripped = line.strip()
+                    if stripped.startswith(self.FENCES):
+                        in_fence = not in_fence
+                    elif not in_fence:
+                        # Same heading detection as scan_source, so sections line up with the anchors
+                        match = self.HEADING_PATTERN.match(stripped)
+                        if match:
+                            section = search.add_section(next(anchors), filepath.name, match.group(2), page)
+                            position = 0
+                    position = search.add_text(section, line, position)
+
+        shard_count = search.write(index_dir, fingerprint)
+        print(f"  Search index: {len(search.postings):,} terms, {len(search.sections)} sections "
+              f"in {shard_count} shards under {index_dir}")
+
+    def volume_path(self, output_file: Path, number: int) -> Path:
+        """File for volume `number` of a multi-volume combine (e.g. combined.vol02.md)."""
+        return output_file.with_name(f"{output_file.stem}.vol{number:02d}{output_file.suffix}")
+
+    def document_paths(self, input_file: Path) -> List[Path]:
+        """The files holding the sections of a consolidated output: its volumes, or the file itself."""
+        manifest = self.load_manifest(input_file, check_output=False)
+        if manifest and manifest.get('volumes'):
+            return [input_file.parent / volume['file'] for volume in manifest['volumes']]
+        return [input_file]
+
+    def pack_volumes(self, files: List[Tuple[int, Path]], sources: Dict[str, dict],
+                     volume_size: int) -> List[List[Tuple[int, Path]]]:
+        """
+        Pack files, in order, into volumes of about volume_size bytes at most.
+
+        A volume is closed before the file that would overflow it; a file
+        larger than volume_size gets a volume of its own.
+        """
+        volumes: List[List[Tuple[int, Path]]] = [[]]
+        size = 0
+        for number, filepath in files:
+            section_size = (sources[filepath.name]['stat'][1] + len(self.FILE_SEPARATOR)
+                            + len(self.FILE_HEADER.format(filepath.name)) + 2 * len(filepath.name))
+            if volumes[-1] and size + section_size > volume_size:
+                volumes.append([])
+                size = 0
+            volumes[-1].append((number, filepath))
+            size += section_size
+        return volumes
+
+    def replace_output(self, tmp_name: str, output_file: Path) -> None:
+        """Move a finished temporary file over output_file, keeping its permissions."""
+        if output_file.exists():
+            shutil.copymode(output_file, tmp_name)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, output_file)
+
+    def write_document(self, output_file: Path, files: List[Tuple[int, Path]], header: str,
+                       index: AnchorIndex, sources: Dict[str, dict], index_digest: str,
+                       incremental: bool) -> bool:
+        """
+        Write one consolidated document (the whole output, or one volume) and its manifest.
+
+        Args:
+            output_file: The document to write
+            files: The files it holds, in order
+            header: Text written before the first section
+            index: Anchors that links are resolved against
+            sources: scan_source() results by filename
+            index_digest: index.digest(), recorded to tell when links may resolve differently
+            incremental: Reuse unchanged sections of the previous document
+
+        Returns:
+            Whether the document was written (False if it was up to date).
+        """
+        titles = [filepath.name for _, filepath in files]
+        manifest = self.load_manifest(output_file) if incremental else None
+        previous = {section['file']: section for section in manifest['sections']} if manifest else {}
+        index_changed = manifest is None or manifest['index'] != index_digest
+
+        # Sections whose source is unchanged, and whose links still resolve the same, are copied as-is
+        reusable = {
+            name for name in titles
+            if name in previous and previous[name]['hash'] == sources[name]['hash']
+            and not (sources[name]['has_links'] and index_changed)
+        }
+
+        if (manifest is not None and manifest['header'] == header and manifest['titles'] == titles
+                and len(reusable) == len(files)):
+            # Only refresh stats (e.g. after a checkout touched unchanged files)
+            sections = [{**section, **sources[section['file']]} for section in manifest['sections']]
+            if sections != manifest['sections']:
+                self.write_manifest(output_file, titles, index_digest, sections, header)
+            print(f"✓ {output_file} is up to date ({len(files)} files unchanged)")
+            return False
+
+        # Write to a temporary file and swap it in, so the previous output
+        # stays readable for copying and intact if combining fails
+        fd, tmp_name = tempfile.mkstemp(dir=output_file.parent, prefix=f".{output_file.name}.", suffix='.tmp')
+        sections = []
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as outfile, \
+                    (open(output_file, 'rb') if reusable else nullcontext()) as previous_output:
+                outfile.write(header)
+
+                for idx, (number, filepath) in enumerate(files):
+                    offset = outfile.tell()
+                    if filepath.name in reusable:
+                        # Copy the section's bytes from the previous output
+                        old = previous[filepath.name]
+                        rewrites = old['rewrites']
+                        outfile.flush()
+                        previous_output.seek(old['offset'])
+                        remaining = old['length']
+                        while remaining:
+                            chunk = previous_output.read(min(remaining, self.COPY_CHUNK_SIZE))
+                            if not chunk:
+                                raise OSError(f"{output_file} is shorter than its manifest")
+                            outfile.buffer.write(chunk)
+                            remaining -= len(chunk)
+                    else:
+                        print(f"Processing: {filepath.name}")
+                        rewrites = self.write_section(outfile, filepath, index,
+                                                      sources[filepath.name]['has_links'])
+
+                    sections.append({
+                        'file': filepath.name,
+                        'anchor': self.generate_anchor(filepath.name),
+                        **sources[filepath.name],
+                        'rewrites': rewrites,
+                        'offset': offset,
+                        'length': outfile.tell() - offset,
+                    })
+
+                    # Add separator between files (except after the last file)
+                    if idx < len(files) - 1:
+                        outfile.write(self.FILE_SEPARATOR)
+
+            # Hash each section's bytes; reused sections keep their previous hash
+            with open(tmp_name, 'rb') as written:
+                for section in sections:
+                    if section['file'] in reusable:
+                        section['content_hash'] = previous[section['file']]['content_hash']
+                        continue
+                    written.seek(section['offset'])
+                    digest = hashlib.sha256()
+                    remaining = section['length']
+                    while remaining:
+                        chunk = written.read(min(remaining, self.COPY_CHUNK_SIZE))
+                        digest.update(chunk)
+                        remaining -= len(chunk)
+                    section['content_hash'] = digest.hexdigest()
+
+            self.replace_output(tmp_name, output_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        self.write_manifest(output_file, titles, index_digest, sections, header)
+        if reusable:
+            print(f"  Reused {len(reusable)} unchanged section(s)")
+        print(f"✓ Wrote {len(files)} files to {output_file} ({output_file.stat().st_size:,} bytes)")
+        return True
+
+    def write_master_index(self, output_file: Path, volumes: List[List[Tuple[int, Path]]],
+                           volume_paths: List[Path], index: AnchorIndex, index_digest: str,
+                           volume_size: int) -> None:
+        """
+        Write the master index linking to every file across the volumes, and its manifest.
+
+        The manifest lists the volumes so that split and get find the sections.
+        """
+        total = sum(len(volume) for volume in volumes)
+        lines = [
+            f"# {self.DOCUMENT_TITLE}\n\n",
+            f"*This document was automatically generated by consolidating {total} individual "
+            f"markdown files into {len(volumes)} volumes of about {volume_size:,} bytes at most.*\n\n",
+            "---\n\n",
+        ]
+        for number, (volume, path) in enumerate(zip(volumes, volume_paths), 1):
+            lines.append(f"## Volume {number}\n\n")
+            for _, filepath in volume:
+                title = filepath.name.rsplit('.md', 1)[0]
+                lines.append(f"- [{title}]({index.href(title, index.documents[title])})\n")
+            lines.append("\n")
+        content = ''.join(lines)
+
+        manifest = self.load_manifest(output_file)
+        if manifest is None or manifest.get('header') != content:
+            fd, tmp_name = tempfile.mkstemp(dir=output_file.parent, prefix=f".{output_file.name}.",
+                                            suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as outfile:
+                    outfile.write(content)
+                self.replace_output(tmp_name, output_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            print(f"✓ Wrote master index {output_file}")
+
+        titles = [filepath.name for volume in volumes for _, filepath in volume]
+        self.write_manifest(output_file, titles, index_digest, [], content, [
+            {'file': path.name, 'files': [filepath.name for _, filepath in volume]}
+            for volume, path in zip(volumes, volume_paths)
+        ])
+
+    def combine(self, input_dir: Path, output_file: Path, incremental: bool = False,
+                search_index: bool = False, search_prefix: int = 2,
+                volume_size: Optional[int] = None) -> None:
         """
         Combine all numbered markdown files into a single consolidated file.
 
+        Headings of every file are indexed while the files are scanned, and
+        all wiki-style [[...]] links, #section links and links between the
+        numbered documents are rewritten to anchors in the consolidated
+        file. The index is written to OUTPUT.anchors.json for other tools.
+
+        Every combine also records each source file's hash and the byte
+        range of its section in OUTPUT.manifest.json. With `incremental`,
+        sections whose source is unchanged are copied from the previous
+        output instead of being regenerated (sections with links only while
+        the anchors they resolve against are unchanged), and an up-to-date
+        output is left untouched.
+
+        With `volume_size`, the files are packed in order into volumes of
+        at most about that many bytes (OUTPUT.vol01.md, ...), each with its
+        own table of contents and its own anchors, and `output_file`
+        becomes a master index linking into the volumes. split and get
+        follow the master index to the volumes.
+
+        With `search_index`, a sharded full-text index of the sections is
+        written to the OUTPUT.search directory (see SearchIndex), and
+        rebuilt only when the sources or anchors change.
+
         Args:
             input_dir: Directory containing the markdown files
-            output_file: Path to the output consolidated file
+            output_file: Path to the output consolidated file (master index with volumes)
+            incremental: Reuse unchanged sections of the previous output
+            search_index: Also write the prebuilt search index
+            search_prefix: Term prefix length the search index is sharded by
+            volume_size: Split the output into volumes of about this many bytes
         """
         files = self.get_markdown_files(input_dir)
 
@@ -116,48 +914,231 @@ class MarkdownConsolidator:
 
         print(f"Found {len(files)} markdown files to combine")
 
-        # Check if first file is a table of contents
-        has_toc = files and files[0][0] == 0 and 'table of contents' in files[0][1].name.lower()
-
-        with open(output_file, 'w', encoding='utf-8') as outfile:
-            # Write a header for the consolidated document
-            outfile.write("# AshTrail - Consolidated Documentation\n\n")
-            outfile.write("*This document was automatically generated by consolidating ")
-            outfile.write(f"{len(files)} individual markdown files.*\n\n")
-            outfile.write("---\n\n")
-
-            for idx, (number, filepath) in enumerate(files):
-                print(f"Processing: {filepath.name}")
-
-                # Write file marker
-                outfile.write(self.FILE_HEADER.format(filepath.name))
-                
-                # Add anchor for navigation
-                anchor = self.generate_anchor(filepath.name)
-                outfile.write(f'<a id="{anchor}"></a>\n\n')
-
-                # Read and write file content
-                with open(filepath, 'r', encoding='utf-8') as infile:
-                    content = infile.read()
-                    
-                    # Convert wiki-style links to markdown links if this is the TOC
-                    if has_toc and idx == 0:
-                        content = self.convert_toc_links(content, files)
-                        print("  → Converted table of contents links")
-                    
-                    outfile.write(content)
+        titles = [filepath.name for _, filepath in files]
+
+        # Stats and hashes recorded by the previous combine, in whichever layout it used
+        previous_paths = self.document_paths(output_file)
+        previous = {}
+        if incremental:
+            for path in previous_paths:
+                manifest = self.load_manifest(path)
+                previous.update({section['file']: section for section in manifest['sections']} if manifest else {})
+            if not previous:
+                print("  No usable manifest for the existing output; combining everything")
+
+        # One pass over the sources: hashes for change detection plus headings for the anchor index
+        sources = {filepath.name: self.scan_source(filepath, previous.get(filepath.name))
+                   for _, filepath in files}
+
+        if volume_size:
+            volumes = self.pack_volumes(files, sources, volume_size)
+            paths = [self.volume_path(output_file, number) for number in range(1, len(volumes) + 1)]
+        else:
+            volumes, paths = [files], [output_file]
+
+        index = AnchorIndex()
+        headers = []
+        for number, (volume, path) in enumerate(zip(volumes, paths), 1):
+            title = self.DOCUMENT_TITLE
+            if volume_size:
+                title += f" (Volume {number} of {len(volumes)})"
+            index.new_page(path.name if volume_size else '', (title,))
+            for _, filepath in volume:
+                index.add_document(filepath.name, self.generate_anchor(filepath.name),
+                                   sources[filepath.name]['headings'])
+            headers.append(title)
+        index_digest = index.digest()
+        fingerprint = hashlib.sha256(json.dumps(
+            [index_digest, [sources[name]['hash'] for name in titles]]).encode('utf-8')).hexdigest()
+
+        written = False
+        for number, (volume, path, title) in enumerate(zip(volumes, paths, headers), 1):
+            # Write a header for the consolidated document (with volumes, a local table of contents)
+            header = f"# {title}\n\n"
+            if volume_size:
+                header += f"*Part of the documentation consolidated in [{output_file.name}]({output_file.name}).*\n\n"
+                for _, filepath in volume:
+                    doc_title = filepath.name.rsplit('.md', 1)[0]
+                    header += f"- [{doc_title}](#{index.documents[doc_title]})\n"
+                header += "\n---\n\n"
+            else:
+                header += ("*This document was automatically generated by consolidating "
+                           f"{len(files)} individual markdown files.*\n\n---\n\n")
+            written |= self.write_document(path, volume, header, index, sources, index_digest, incremental)
 
-                # Add separator between files (except after the last file)
-                if idx < len(files) - 1:
-                    outfile.write(self.FILE_SEPARATOR)
+        if volume_size:
+            self.write_master_index(output_file, volumes, paths, index, index_digest, volume_size)
 
-        print(f"\n✓ Successfully combined {len(files)} files into {output_file}")
-        print(f"  Total size: {output_file.stat().st_size:,} bytes")
+        # Volumes (and their sidecars) no longer produced
+        for path in sorted(set(previous_paths) - set(paths) - {output_file}):
+            for stale in (path, self.manifest_path(path)):
+                if stale.exists():
+                    stale.unlink()
+                    print(f"  Removed {stale}")
+
+        if written or not self.anchors_path(output_file).exists():
+            with open(self.anchors_path(output_file), 'w', encoding='utf-8') as f:
+                json.dump(index.to_json(), f, indent=2, ensure_ascii=False)
+                f.write('\n')
+
+        if written:
+            print(f"\n✓ Successfully combined {len(files)} files into {output_file}"
+                  + (f" and {len(volumes)} volumes" if volume_size else ""))
+            print(f"  Total size: {sum(path.stat().st_size for path in paths):,} bytes")
+            print(f"  Anchor index: {len(index.documents)} documents, {len(index.entries)} headings "
+                  f"in {self.anchors_path(output_file)}")
+        if search_index:
+            self.write_search_index(files, index, self.search_index_path(output_file),
+                                    fingerprint, search_prefix)
+
+    def iter_sections(self, infile) -> Iterator[Tuple[str, List[str], bool]]:
+        """
+        Scan a consolidated document line by line for file markers.
+
+        Args:
+            infile: Open text file positioned at the start of the document
+
+        Yields:
+            Tuples (filename, content lines, is_last) for each marked file,
+            holding only one section in memory at a time.
+        """
+        filename = None
+        lines: List[str] = []
+        # Marker line waiting for the blank line that confirms it
+        pending = None
+
+        for line in infile:
+            if pending is not None:
+                marker_line, pending = pending, None
+                if line == '\n':
+                    if filename is not None:
+                        yield filename, lines, False
+                    filename, lines = self.MARKER_LINE.match(marker_line).group(1), []
+                    continue
+                if filename is not None:
+                    lines.append(marker_line)
+
+            if self.MARKER_LINE.match(line):
+                pending = line
+            elif filename is not None:
+                lines.append(line)
+
+        if filename is not None:
+            if pending is not None:
+                lines.append(pending)
+            yield filename, lines, True
+
+    def section_content(self, lines: List[str], is_last: bool) -> str:
+        """
+        Recover a file's content from its section lines in a consolidated document.
+
+        Args:
+            lines: Lines following the file marker, up to the next marker
+            is_last: Whether this is the final section (which has no separator)
+
+        Returns:
+            The file content without the navigation anchor or trailing separator.
+        """
+        # Skip the anchor tag if present (e.g., <a id="..."></a>)
+        if len(lines) >= 2 and self.ANCHOR_LINE.match(lines[0]) and lines[1] == '\n':
+            lines = lines[2:]
+
+        file_content = ''.join(lines).rstrip()
+        # Remove trailing separator if present
+        separator = self.FILE_SEPARATOR.strip()
+        if not is_last and file_content.endswith(separator):
+            file_content = file_content[:-len(separator)].rstrip()
+        return file_content
+
+    def recover_file(self, filename: str, lines: List[str], is_last: bool, is_first: bool,
+                     rewrites: Optional[List[list]]) -> str:
+        """
+        Original content of one file from its section in a consolidated document.
+
+        Args:
+            filename: The file's name from its marker
+            lines: Section lines after the marker (see iter_sections)
+            is_last: Whether the section is the last one (not followed by a separator)
+            is_first: Whether the section is the first one
+            rewrites: Link rewrites recorded for the file by combine, if known
+        """
+        file_content = self.section_content(lines, is_last)
+
+        if rewrites is not None:
+            return self.restore_links(file_content, rewrites)
+        # Without a manifest, convert markdown links back to wiki-style for TOC
+        if is_first and 'table of contents' in filename.lower():
+            # Convert [text](#anchor) back to [[text]], and "Doc › Heading" text to [[Doc#Heading]]
+            file_content = re.sub(r'\[([^\]]+)\]\(#[^\)]+\)',
+                                  lambda m: f"[[{m.group(1).replace(' › ', '#')}]]", file_content)
+        return file_content
+
+    def get_section(self, input_file: Path, name: str, raw: bool = False) -> Optional[str]:
+        """
+        Extract one file's section from a consolidated document.
+
+        The section's byte range is looked up in the manifest and read
+        through mmap, so only that section is read. If the manifest is
+        missing or the bytes no longer match its content hash (the file
+        was edited), the document is scanned for the file marker instead.
+
+        Args:
+            input_file: Path to the consolidated markdown file
+            name: Filename, title, file anchor or number of the wanted file
+            raw: Return the section exactly as it appears, marker included,
+                 instead of the recovered file content
+
+        Returns:
+            The section, or None if no file matches `name`.
+        """
+        paths = self.document_paths(input_file)
+        if paths != [input_file]:
+            # Master index of a multi-volume output: look in each volume
+            for path in paths:
+                content = self.get_section(path, name, raw)
+                if content is not None:
+                    return content
+            return None
+
+        def matches(filename: str) -> bool:
+            match = self.file_pattern.match(filename)
+            return name in (filename, filename.rsplit('.md', 1)[0], self.generate_anchor(filename)) \
+                or (match is not None and name == match.group(1))
+
+        manifest = self.load_manifest(input_file, check_output=False)
+        sections = manifest['sections'] if manifest else []
+        for idx, section in enumerate(sections):
+            if not matches(section['file']) or not section['length']:
+                continue
+            with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = mapped[section['offset']:section['offset'] + section['length']]
+            if hashlib.sha256(data).hexdigest() != section['content_hash']:
+                break
+            # Universal newlines, as when the document is read as text
+            lines = list(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'))
+            if raw:
+                return ''.join(lines)
+            # The range ends before the separator; skip the marker and its blank line
+            return self.recover_file(section['file'], lines[2:], True, idx == 0, section['rewrites']) + '\n'
+
+        rewrites = {section['file']: section['rewrites'] for section in sections}
+        with open(input_file, 'r', encoding='utf-8') as infile:
+            for idx, (filename, lines, is_last) in enumerate(self.iter_sections(infile)):
+                if not matches(filename):
+                    continue
+                if raw:
+                    return self.FILE_HEADER.format(filename) + ''.join(lines)
+                return self.recover_file(filename, lines, is_last, idx == 0, rewrites.get(filename)) + '\n'
+        return None
 
     def split(self, input_file: Path, output_dir: Path) -> None:
         """
         Split a consolidated markdown file back into individual files.
 
+        The input is streamed: each file is written as soon as its section
+        ends, so memory use is bounded by the largest section. For the
+        master index of a multi-volume output, every volume is split.
+
         Args:
             input_file: Path to the consolidated markdown file
             output_dir: Directory where individual files will be created
@@ -169,56 +1150,31 @@ class MarkdownConsolidator:
         # Create output directory if it doesn't exist
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(input_file, 'r', encoding='utf-8') as infile:
-            content = infile.read()
+        count = 0
+        # A master index written with volumes is split through all of its volumes
+        for path in self.document_paths(input_file):
+            # Link rewrites recorded by combine, to restore the original links
+            manifest = self.load_manifest(path, check_output=False)
+            rewrites = {section['file']: section['rewrites'] for section in manifest['sections']} if manifest else {}
+
+            with open(path, 'r', encoding='utf-8') as infile:
+                for filename, lines, is_last in self.iter_sections(infile):
+                    file_content = self.recover_file(filename, lines, is_last, count == 0, rewrites.get(filename))
 
-        # Find all file markers
-        file_header_pattern = re.compile(r'<!-- FILE: (.+?) -->\n\n')
-        markers = list(file_header_pattern.finditer(content))
+                    output_path = output_dir / filename
+                    with open(output_path, 'w', encoding='utf-8') as outfile:
+                        outfile.write(file_content)
+                        outfile.write('\n')  # Ensure file ends with newline
 
-        if not markers:
+                    print(f"Created: {output_path.name}")
+                    count += 1
+
+        if not count:
             print("Warning: No file markers found in the consolidated document")
             print("The document may not have been created by the combine function")
             return
 
-        print(f"Found {len(markers)} file markers")
-
-        # Extract and save each file
-        for idx, match in enumerate(markers):
-            filename = match.group(1)
-            start_pos = match.end()
-            
-            # Skip the anchor tag if present (e.g., <a id="..."></a>)
-            anchor_pattern = r'<a id="[^"]+"></a>\n\n'
-            remaining_content = content[start_pos:]
-            anchor_match = re.match(anchor_pattern, remaining_content)
-            if anchor_match:
-                start_pos += anchor_match.end()
-
-            # Find the end position (start of next file or end of document)
-            if idx < len(markers) - 1:
-                end_pos = markers[idx + 1].start()
-                # Remove the separator
-                file_content = content[start_pos:end_pos].rstrip()
-                # Remove trailing separator if present
-                if file_content.endswith(self.FILE_SEPARATOR.strip()):
-                    file_content = file_content[:-len(self.FILE_SEPARATOR.strip())].rstrip()
-            else:
-                file_content = content[start_pos:].rstrip()
-            
-            # Convert markdown links back to wiki-style for TOC
-            if idx == 0 and 'table of contents' in filename.lower():
-                # Convert [text](#anchor) back to [[text]]
-                file_content = re.sub(r'\[([^\]]+)\]\(#[^\)]+\)', r'[[\1]]', file_content)
-
-            output_path = output_dir / filename
-            with open(output_path, 'w', encoding='utf-8') as outfile:
-                outfile.write(file_content)
-                outfile.write('\n')  # Ensure file ends with newline
-
-            print(f"Created: {output_path.name}")
-
-        print(f"\n✓ Successfully split into {len(markers)} files in {output_dir}")
+        print(f"\n✓ Successfully split into {count} files in {output_dir}")
 
     def preview_structure(self, directory: Path) -> None:
         """
@@ -245,6 +1201,20 @@ class MarkdownConsolidator:
         print(f"  Files: {len(files)}")
 
 
+def parse_size(text: str) -> int:
+    """Parse a byte count with an optional K or M suffix (e.g. "150K")."""
+    multipliers = {'K': 1024, 'M': 1024 * 1024}
+    text = text.strip().upper()
+    if text.endswith('B'):
+        text = text[:-1]
+    try:
+        if text[-1:] in multipliers:
+            return int(float(text[:-1]) * multipliers[text[-1]])
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Combine or split markdown documentation files',
@@ -271,6 +1241,30 @@ def main():
         default=Path('consolidated.md'),
         help='Output file path (default: consolidated.md)'
     )
+    combine_parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only regenerate sections whose source changed since the last combine '
+             '(tracked in OUTPUT.manifest.json)'
+    )
+    combine_parser.add_argument(
+        '--volume-size',
+        type=parse_size,
+        default=None,
+        help='Split the output into volumes of at most about this size (e.g. 100K, 1M), '
+             'making OUTPUT a master index'
+    )
+    combine_parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help='Also write a prebuilt search index, sharded by term prefix, to OUTPUT.search/'
+    )
+    combine_parser.add_argument(
+        '--search-prefix',
+        type=int,
+        default=2,
+        help='Term prefix length used to shard the search index (default: 2)'
+    )
 
     # Split command
     split_parser = subparsers.add_parser(
@@ -290,6 +1284,49 @@ def main():
         help='Output directory for split files (default: split_output)'
     )
 
+    # Get command
+    get_parser = subparsers.add_parser(
+        'get',
+        help='Print one file from a consolidated file, reading only its section'
+    )
+    get_parser.add_argument(
+        'name',
+        help='Filename, title, anchor or number of the file (e.g. "7", "7-data-persistence")'
+    )
+    get_parser.add_argument(
+        '--input',
+        type=Path,
+        default=Path('consolidated.md'),
+        help='Input consolidated file (default: consolidated.md)'
+    )
+    get_parser.add_argument(
+        '--raw',
+        action='store_true',
+        help='Print the section as it appears in the consolidated file'
+    )
+
+    # Search command
+    search_parser = subparsers.add_parser(
+        'search',
+        help='Search the prebuilt index written by combine --search-index'
+    )
+    search_parser.add_argument(
+        'query',
+        help='Words that must all occur in a section'
+    )
+    search_parser.add_argument(
+        '--index',
+        type=Path,
+        default=Path('consolidated.search'),
+        help='Search index directory (default: consolidated.search)'
+    )
+    search_parser.add_argument(
+        '--limit',
+        type=int,
+        default=10,
+        help='Maximum number of sections to list (default: 10)'
+    )
+
     # Preview command
     preview_parser = subparsers.add_parser(
         'preview',
@@ -311,9 +1348,29 @@ def main():
     consolidator = MarkdownConsolidator()
 
     if args.command == 'combine':
-        consolidator.combine(args.input_dir, args.output)
+        consolidator.combine(args.input_dir, args.output, args.incremental,
+                             args.search_index, args.search_prefix, args.volume_size)
     elif args.command == 'split':
         consolidator.split(args.input, args.output_dir)
+    elif args.command == 'get':
+        if not args.input.exists():
+            print(f"Error: Input file {args.input} does not exist")
+            return
+        content = consolidator.get_section(args.input, args.name, args.raw)
+        if content is None:
+            print(f"Error: No file matching '{args.name}' in {args.input}")
+            return
+        sys.stdout.write(content)
+    elif args.command == 'search':
+        try:
+            results = SearchIndex.search(args.index, args.query, args.limit)
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return
+        if not results:
+            print(f"No sections match: {args.query}")
+        for (anchor, filename, heading, page), count in results:
+            print(f"  {count:>4}  {page}#{anchor}  ({filename} › {heading})")
     elif args.command == 'preview':
         consolidator.preview_structure(args.input_dir)
 
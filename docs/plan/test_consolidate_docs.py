@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Regression tests for consolidate_docs.py link conversion.
+
+Run from this directory with `python -m unittest test_consolidate_docs` (or
+pytest). The real docs/plan files only use wiki links in the table of
+contents, so these tests build a small corpus that exercises section links,
+code spans and fenced blocks.
+"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from consolidate_docs import MarkdownConsolidator
+
+ALPHA = (
+    "## 1. Alpha\n\n"
+    "### 1.1 Links\n\n"
+    "See [[2. Beta#Setup]], [[#Links]] and [[2. Beta|the beta doc]].\n\n"
+    "Write `[[2. Beta]]` or ``[[2. Beta#Setup]]`` to link a section.\n\n"
+    "```markdown\n[[2. Beta]]\n```\n"
+)
+BETA = "## 2. Beta\n\n### 2.1 Setup\n\nBack to [[1. Alpha]].\n"
+
+
+class LinkTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.docs = self.root / 'docs'
+        self.docs.mkdir()
+        self.sources = {'1. Alpha.md': ALPHA, '2. Beta.md': BETA}
+        for name, text in self.sources.items():
+            (self.docs / name).write_text(text, encoding='utf-8')
+        self.combined = self.root / 'combined.md'
+        with contextlib.redirect_stdout(io.StringIO()):
+            MarkdownConsolidator().combine(self.docs, self.combined)
+        self.text = self.combined.read_text(encoding='utf-8')
+
+    def test_section_links_use_readable_text(self):
+        self.assertIn("See [2. Beta › Setup](#21-setup), [Links](#11-links) "
+                      "and [the beta doc](#2-beta).", self.text)
+        self.assertIn("Back to [1. Alpha](#1-alpha).", self.text)
+
+    def test_code_is_left_alone(self):
+        self.assertIn("Write `[[2. Beta]]` or ``[[2. Beta#Setup]]`` to link a section.", self.text)
+        self.assertIn("```markdown\n[[2. Beta]]\n```", self.text)
+
+    def test_split_restores_sources(self):
+        out = self.root / 'out'
+        with contextlib.redirect_stdout(io.StringIO()):
+            MarkdownConsolidator().split(self.combined, out)
+        for name, text in self.sources.items():
+            self.assertEqual((out / name).read_text(encoding='utf-8'), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,142 +1,792 @@
 #!/usr/bin/env python3
-import json, sys, subprocess
-
-path = "/Volumes/Jacob-SSD/Projects/ash_trail/build/ios_results_1770680852004.xcresult"
-
-# Step 1: Get top-level data
-result = subprocess.run(
-    ["xcrun", "xcresulttool", "get", "--legacy", "--format", "json", "--path", path],
-    capture_output=True, text=True
-)
-data = json.loads(result.stdout)
-
-# Metrics
-metrics = data.get('metrics', {})
-tests_count = metrics.get('testsCount', {}).get('_value', 'N/A')
-failed_count = metrics.get('testsFailedCount', {}).get('_value', 'N/A')
-print(f"Tests: {tests_count}, Failed: {failed_count}")
-
-# Issues
-issues = data.get('issues', {})
-for k, v in issues.items():
-    if k.startswith('_'):
-        continue
-    vals = v.get('_values', []) if isinstance(v, dict) else []
-    for item in vals:
-        msg = item.get('message', {}).get('_value', '')
-        print(f"  Issue [{k}]: {msg[:300]}")
-
-# Find testsRef
-actions = data.get('actions', {}).get('_values', [])
-tests_ref_id = None
-for action in actions:
-    title = action.get('title', {}).get('_value', '')
-    result_val = action.get('result', {}).get('_value', '')
-    print(f"Action: {title} | result: {result_val}")
-    ar = action.get('actionResult', {})
-    tr = ar.get('testsRef', {}).get('id', {}).get('_value', '')
-    if tr:
-        tests_ref_id = tr
-        print(f"  testsRef: {tr}")
-
-# Step 2: Get test plan details via testsRef
-if tests_ref_id:
-    result2 = subprocess.run(
-        ["xcrun", "xcresulttool", "get", "--legacy", "--format", "json",
-         "--path", path, "--id", tests_ref_id],
-        capture_output=True, text=True
-    )
-    test_data = json.loads(result2.stdout)
-
-    # Debug: show structure of test plan data
-    def show_types(obj, depth=0, max_depth=10):
-        if depth > max_depth:
+"""
+Summarise an Xcode .xcresult bundle produced by the iOS e2e runs.
+
+Usage:
+    python parse_xcresult.py [BUNDLE] [--batch] [--jobs N] [--stream] [--fixtures] [--no-cache]
+                             [--format text|jsonl|junit] [--output FILE]
+
+Options:
+    --batch        Collect every test summaryRef in one tree walk and fetch
+                   them through a bounded worker pool instead of one
+                   xcresulttool call per test
+    --jobs         Worker count for --batch (default: 8)
+    --stream       Parse the testsRef and summary payloads as events straight
+                   from the xcresulttool pipe, keeping memory flat for huge
+                   bundles (requires `pip install ijson`). The structure dump
+                   is then printed children-first
+    --fixtures     Read BUNDLE as a directory of JSON fixtures (root.json plus
+                   <id>.json per object) instead of calling xcrun, so the
+                   parser runs on Linux; see bench_xcresult.py
+    --no-cache     Bypass the local summary cache
+    --format       text (default), jsonl (one JSON object per metrics line,
+                   action, issue, test, activity and failure) or junit (JUnit
+                   XML). Structured records are written and flushed as the
+                   tree is walked, untruncated
+    --output       Write the report to a file instead of stdout
+
+Summaries fetched with `xcresulttool get --id` are cached on disk keyed by
+(bundle path, id), so parsing the same bundle again costs no subprocess
+calls. Set XCRESULT_CACHE_DIR to relocate the cache.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import BinaryIO, Callable, Deque, Dict, List, Optional, TextIO, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    import ijson
+except ImportError:  # Optional: only needed for --stream
+    ijson = None
+
+DEFAULT_BUNDLE = "/Volumes/Jacob-SSD/Projects/ash_trail/build/ios_results_1770680852004.xcresult"
+
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    'XCRESULT_CACHE_DIR',
+    Path.home() / '.cache' / 'ash_trail' / 'xcresult'
+))
+
+# Wrapper types skipped by the structure dump
+SCALAR_TYPES = {'Array', 'String', 'Int', 'Double'}
+MAX_DUMP_DEPTH = 10
+# In-flight summary fetches allowed per worker in --stream --batch mode
+STREAM_WINDOW = 4
+
+# Anything with `key`, `get(ref_id)` and `open(ref_id)`: XcrunSource or FixtureSource
+ResultSource = Union['XcrunSource', 'FixtureSource']
+
+
+class SourceError(Exception):
+    """A streamed payload could not be read completely (e.g. xcresulttool exited non-zero)."""
+
+
+class XcrunSource:
+    """Result source backed by `xcrun xcresulttool` on a real .xcresult bundle."""
+
+    def __init__(self, bundle: str):
+        self.bundle = bundle
+        self.key = os.path.abspath(bundle)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _cmd(self, ref_id: Optional[str]) -> List[str]:
+        with self._lock:
+            self.calls += 1
+        cmd = ["xcrun", "xcresulttool", "get", "--legacy", "--format", "json", "--path", self.bundle]
+        if ref_id:
+            cmd += ["--id", ref_id]
+        return cmd
+
+    def get(self, ref_id: Optional[str] = None) -> str:
+        """Run `xcresulttool get` for the bundle root or one object id; raises SourceError on a non-zero exit."""
+        result = subprocess.run(self._cmd(ref_id), capture_output=True, text=True)
+        if result.returncode != 0:
+            raise SourceError(f"xcresulttool exited with status {result.returncode}")
+        return result.stdout
+
+    @contextmanager
+    def open(self, ref_id: Optional[str] = None):
+        """Yield the xcresulttool stdout pipe for incremental reading; raises SourceError on a non-zero exit."""
+        proc = subprocess.Popen(self._cmd(ref_id), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            yield proc.stdout
+        finally:
+            proc.stdout.close()
+            proc.wait()
+        if proc.returncode != 0:
+            raise SourceError(f"xcresulttool exited with status {proc.returncode}")
+
+
+class FixtureSource:
+    """
+    Result source answering lookups from a directory of JSON fixtures.
+
+    The bundle root is read from `root.json` and `get --id <ref>` from
+    `<ref>.json`; a missing fixture behaves like empty xcresulttool output.
+    `calls` counts lookups, i.e. the subprocesses XcrunSource would spawn.
+    """
+
+    ROOT = 'root.json'
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.key = os.path.abspath(directory)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _fixture(self, ref_id: Optional[str]) -> Path:
+        with self._lock:
+            self.calls += 1
+        return self.directory / (f"{ref_id}.json" if ref_id else self.ROOT)
+
+    def get(self, ref_id: Optional[str] = None) -> str:
+        try:
+            return self._fixture(ref_id).read_text(encoding='utf-8')
+        except OSError:
+            return ''
+
+    @contextmanager
+    def open(self, ref_id: Optional[str] = None):
+        try:
+            fp = open(self._fixture(ref_id), 'rb')
+        except OSError:
+            fp = io.BytesIO(b'')
+        with fp:
+            yield fp
+
+
+class SummaryCache:
+    """On-disk cache of xcresulttool payloads keyed by (source key, id)."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def _entry(self, key: str, ref_id: str) -> Path:
+        digest = hashlib.sha1(f"{key}\0{ref_id}".encode('utf-8')).hexdigest()
+        return self.root / digest[:2] / f"{digest}.json"
+
+    # Empty entries are never written, but older versions could leave them
+    # behind; treat them as misses so they get refetched.
+    def lookup(self, key: str, ref_id: str) -> Optional[Path]:
+        entry = self._entry(key, ref_id)
+        try:
+            return entry if entry.stat().st_size else None
+        except OSError:
+            return None
+
+    def get(self, key: str, ref_id: str) -> Optional[str]:
+        try:
+            return self._entry(key, ref_id).read_text(encoding='utf-8') or None
+        except OSError:
+            return None
+
+    def put(self, key: str, ref_id: str, payload: str) -> None:
+        try:
+            with self.writer(key, ref_id) as sink:
+                sink.write(payload.encode('utf-8'))
+        except OSError:
+            pass
+
+    @contextmanager
+    def writer(self, key: str, ref_id: str):
+        """Yield a binary sink for one entry, committed only if the block completes."""
+        # Write-then-rename so concurrent workers never see a partial entry
+        entry = self._entry(key, ref_id)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, 'wb') as sink:
+                yield sink
+            os.replace(tmp, entry)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+
+@contextmanager
+def open_payload_stream(source: ResultSource, ref_id: str, cache: Optional[SummaryCache]):
+    """
+    Yield a binary stream of the JSON for one object id.
+
+    Reads the cached entry when present; otherwise streams straight from the
+    source (the xcresulttool pipe for XcrunSource), teeing into the cache as
+    it goes. Raises SourceError when the source exited non-zero or the block
+    completed without reading a non-empty stream to EOF, so a partial payload
+    is never mistaken for a complete one. Like fetch_payload, only a complete
+    payload is cached: the entry is dropped on any error.
+    """
+    entry = cache.lookup(source.key, ref_id) if cache is not None else None
+    if entry is not None:
+        with open(entry, 'rb') as fp:
+            yield fp
+        return
+
+    with cache.writer(source.key, ref_id) if cache is not None else nullcontext() as sink:
+        with source.open(ref_id) as fp:
+            reader = _TeeReader(fp, sink)
+            yield reader
+        if not (reader.eof and reader.size):
+            raise SourceError("Payload stream was empty or not read to the end")
+
+
+class _TeeReader:
+    """File-like wrapper that copies everything read from `src` into `sink` (if any), tracking size and EOF."""
+
+    def __init__(self, src: BinaryIO, sink: Optional[BinaryIO]):
+        self.src = src
+        self.sink = sink
+        self.size = 0
+        self.eof = False
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.src.read(size)
+        if chunk:
+            if self.sink is not None:
+                self.sink.write(chunk)
+            self.size += len(chunk)
+        elif size != 0:
+            self.eof = True
+        return chunk
+
+
+def fetch_payload(source: ResultSource, ref_id: str, cache: Optional[SummaryCache]) -> str:
+    """Return the raw JSON for one object id, consulting the cache first."""
+    if cache is not None:
+        cached = cache.get(source.key, ref_id)
+        if cached is not None:
+            return cached
+    payload = source.get(ref_id)
+    if cache is not None and payload:
+        cache.put(source.key, ref_id, payload)
+    return payload
+
+
+def _is_child_key(key: str) -> bool:
+    """Legacy JSON wraps arrays as {"_type": ..., "_values": [...]}; descend into those."""
+    return key == '_values' or not key.startswith('_')
+
+
+def collect_summary_refs(obj) -> List[str]:
+    """Gather every ActionTestMetadata summaryRef id in one walk, in tree order."""
+    refs: List[str] = []
+    seen = set()
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if node.get('_type', {}).get('_name', '') == 'ActionTestMetadata':
+                ref = node.get('summaryRef', {}).get('id', {}).get('_value', '')
+                if ref and ref not in seen:
+                    seen.add(ref)
+                    refs.append(ref)
+            children = [v for k, v in node.items() if _is_child_key(k)]
+            stack.extend(reversed(children))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return refs
+
+
+def load_summary(source: ResultSource, ref_id: str, cache: Optional[SummaryCache]) -> Optional[dict]:
+    try:
+        return json.loads(fetch_payload(source, ref_id, cache))
+    except (ValueError, SourceError):
+        return None
+
+
+def fetch_summaries(source: ResultSource, refs: List[str], jobs: int,
+                    cache: Optional[SummaryCache]) -> Dict[str, Optional[dict]]:
+    """Fetch and decode the summaries for `refs` through a bounded worker pool."""
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return dict(zip(refs, pool.map(lambda ref_id: load_summary(source, ref_id, cache), refs)))
+
+
+def _type_name(obj: dict) -> str:
+    return obj.get('_type', {}).get('_name', '')
+
+
+def walk_nodes(obj, visit: Callable[[dict, int], None], depth=0):
+    """Pre-order walk of a decoded payload calling visit(node, depth) for every object."""
+    if isinstance(obj, dict):
+        visit(obj, depth)
+        for k, v in obj.items():
+            if not _is_child_key(k):
+                continue
+            if isinstance(v, dict):
+                walk_nodes(v, visit, depth + 1)
+            elif isinstance(v, list):
+                for item in v:
+                    walk_nodes(item, visit, depth + 1)
+    elif isinstance(obj, list):
+        for item in obj:
+            walk_nodes(item, visit, depth)
+
+
+def stream_nodes(fp: BinaryIO, visit: Callable[[dict, int], None]):
+    """
+    Event-driven walk of a JSON byte stream calling visit(node, depth) as each object closes.
+
+    Only the objects on the current path are held in memory, and array
+    elements are dropped once visited, so memory stays flat regardless of
+    payload size. Depth matches walk_nodes, but objects are visited
+    post-order (children before their parent).
+    """
+    stack: list = []
+    keys: list = []
+    depth = 0
+    for event, value in ijson.basic_parse(fp):
+        if event == 'map_key':
+            keys[-1] = value
+            continue
+        if event == 'start_map':
+            stack.append({})
+            keys.append(None)
+            depth += 1
+            continue
+        if event == 'start_array':
+            stack.append([])
+            keys.append(None)
+            continue
+        if event == 'end_map':
+            value = stack.pop()
+            keys.pop()
+            depth -= 1
+            visit(value, depth)
+        elif event == 'end_array':
+            value = stack.pop()
+            keys.pop()
+        # Arrays and array elements are not retained by their parent
+        if stack and isinstance(stack[-1], dict) and not isinstance(value, list):
+            stack[-1][keys[-1]] = value
+
+
+def describe_node(obj: dict) -> str:
+    """Build the ' name=... status=...' suffix used by the structure dump."""
+    extra = ''
+    name = obj.get('name', {}).get('_value', '')
+    if name:
+        extra = f' name="{name}"'
+    status = obj.get('testStatus', {}).get('_value', '')
+    if status:
+        extra += f' status={status}'
+    identifier = obj.get('identifier', {}).get('_value', '')
+    if identifier:
+        extra += f' id={identifier}'
+    ref = obj.get('summaryRef', {}).get('id', {}).get('_value', '')
+    if ref:
+        extra += f' ref={ref[:30]}...'
+    dur = obj.get('duration', {}).get('_value', '')
+    if dur:
+        extra += f' dur={dur}s'
+    return extra
+
+
+def failure_event(obj: dict) -> Optional[dict]:
+    """Turn an activity or failure summary node into an event, or None if uninteresting."""
+    typ = _type_name(obj)
+    if typ == 'ActionTestActivitySummary':
+        title = obj.get('title', {}).get('_value', '')
+        if title and ('fail' in title.lower() or 'error' in title.lower()
+                      or 'exception' in title.lower() or 'assertion' in title.lower()):
+            return {'kind': 'activity', 'title': title}
+    if typ == 'ActionTestFailureSummary':
+        return {
+            'kind': 'failure',
+            'message': obj.get('message', {}).get('_value', ''),
+            'file': obj.get('fileName', {}).get('_value', ''),
+            'line': obj.get('lineNumber', {}).get('_value', ''),
+        }
+    return None
+
+
+def find_failure_messages(obj) -> List[dict]:
+    events: List[dict] = []
+
+    def visit(node: dict, depth: int):
+        event = failure_event(node)
+        if event is not None:
+            events.append(event)
+
+    walk_nodes(obj, visit)
+    return events
+
+
+def stream_failure_messages(source: ResultSource, ref_id: str, cache: Optional[SummaryCache]) -> List[dict]:
+    """Stream one summary payload, returning the failure events seen before any parse error."""
+    events: List[dict] = []
+
+    def visit(node: dict, depth: int):
+        event = failure_event(node)
+        if event is not None:
+            events.append(event)
+
+    # Catch outside open_payload_stream so invalid JSON is never cached
+    try:
+        with open_payload_stream(source, ref_id, cache) as fp:
+            stream_nodes(fp, visit)
+    except (ijson.JSONError, SourceError):
+        pass
+    return events
+
+
+class TextEmitter:
+    """Human-readable report, as printed by the original script."""
+
+    def __init__(self, out: TextIO):
+        self.out = out
+
+    def _print(self, text: str):
+        print(text, file=self.out)
+
+    def metrics(self, tests, failed):
+        self._print(f"Tests: {tests}, Failed: {failed}")
+
+    def issue(self, kind: str, message: str):
+        self._print(f"  Issue [{kind}]: {message[:300]}")
+
+    def action(self, title: str, result: str, tests_ref: str):
+        self._print(f"Action: {title} | result: {result}")
+        if tests_ref:
+            self._print(f"  testsRef: {tests_ref}")
+
+    def no_tests(self):
+        self._print("No testsRef found")
+
+    def node(self, obj: dict, typ: str, depth: int):
+        self._print(f"{'  ' * depth}[{typ}]{describe_node(obj)}")
+
+    def test(self, record: dict, events: List[dict]):
+        self._print(f"  TEST [{record['status']}]: {record['name']} "
+                    f"({record['raw_duration']}s) ref={record['ref']}")
+        for event in events:
+            if event['kind'] == 'activity':
+                self._print(f"    ACTIVITY: {event['title'][:300]}")
+            else:
+                self._print(f"    FAILURE: {event['message'][:300]}")
+                if event['file']:
+                    self._print(f"      at {event['file']}:{event['line']}")
+
+    def close(self):
+        self.out.flush()
+
+
+class JsonLinesEmitter:
+    """One JSON object per metrics line, action, issue, test and failure, flushed as produced."""
+
+    def __init__(self, out: TextIO):
+        self.out = out
+
+    def _emit(self, record: dict):
+        self.out.write(json.dumps(record) + '\n')
+        self.out.flush()
+
+    def metrics(self, tests, failed):
+        self._emit({'type': 'metrics', 'tests': tests, 'failed': failed})
+
+    def issue(self, kind: str, message: str):
+        self._emit({'type': 'issue', 'kind': kind, 'message': message})
+
+    def action(self, title: str, result: str, tests_ref: str):
+        self._emit({'type': 'action', 'title': title, 'result': result, 'tests_ref': tests_ref or None})
+
+    def no_tests(self):
+        pass
+
+    def node(self, obj: dict, typ: str, depth: int):
+        pass
+
+    def test(self, record: dict, events: List[dict]):
+        self._emit({
+            'type': 'test',
+            'name': record['name'],
+            'identifier': record['identifier'],
+            'status': record['status'],
+            'duration': record['duration'],
+            'ref': record['ref'],
+        })
+        for event in events:
+            self._emit({'type': event['kind'], 'test': record['identifier'] or record['name'],
+                        **{k: v for k, v in event.items() if k != 'kind'}})
+
+    def close(self):
+        self.out.flush()
+
+
+class JUnitEmitter:
+    """
+    JUnit XML written incrementally, one <testcase> per test as it is seen.
+
+    Suite-level counts are not known until the end, so they are omitted from
+    <testsuite>; JUnit consumers derive them from the test cases.
+    """
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self.out.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n'
+                       '  <testsuite name="xcresult">\n')
+
+    def metrics(self, tests, failed):
+        pass
+
+    def issue(self, kind: str, message: str):
+        pass
+
+    def action(self, title: str, result: str, tests_ref: str):
+        pass
+
+    def no_tests(self):
+        pass
+
+    def node(self, obj: dict, typ: str, depth: int):
+        pass
+
+    def test(self, record: dict, events: List[dict]):
+        classname, _, name = (record['identifier'] or record['name']).rpartition('/')
+        attrs = f"classname={quoteattr(classname)} name={quoteattr(name or record['name'])}"
+        if record['duration'] is not None:
+            attrs += f' time="{record["duration"]:.3f}"'
+        failures = [e for e in events if e['kind'] == 'failure']
+        body = []
+        for failure in failures:
+            location = f"{failure['file']}:{failure['line']}" if failure['file'] else ''
+            body.append(f"      <failure message={quoteattr(failure['message'])}>"
+                        f"{escape(location)}</failure>")
+        if record['status'] == 'Failure' and not failures:
+            body.append('      <failure message="Test failed"/>')
+        elif record['status'] == 'Skipped':
+            body.append('      <skipped/>')
+        activities = [e['title'] for e in events if e['kind'] == 'activity']
+        if activities:
+            body.append(f"      <system-out>{escape(chr(10).join(activities))}</system-out>")
+
+        if body:
+            self.out.write(f"    <testcase {attrs}>\n" + '\n'.join(body) + "\n    </testcase>\n")
+        else:
+            self.out.write(f"    <testcase {attrs}/>\n")
+        self.out.flush()
+
+    def close(self):
+        self.out.write('  </testsuite>\n</testsuites>\n')
+        self.out.flush()
+
+
+EMITTERS = {
+    'text': TextEmitter,
+    'jsonl': JsonLinesEmitter,
+    'junit': JUnitEmitter,
+}
+
+
+class TestReporter:
+    """
+    Emits the structure dump, tests and failures from a single walk of the testsRef tree.
+
+    Summaries come from `summaries` when prefetched, otherwise from `pool`
+    (submitted as tests are seen and emitted in order), otherwise they are
+    fetched inline, streamed when `stream` is set.
+    """
+
+    def __init__(self, source: ResultSource, cache: Optional[SummaryCache], emitter,
+                 summaries: Optional[Dict[str, Optional[dict]]] = None,
+                 pool: Optional[ThreadPoolExecutor] = None, jobs: int = 1,
+                 stream: bool = False):
+        self.source = source
+        self.cache = cache
+        self.emitter = emitter
+        self.summaries = summaries
+        self.pool = pool
+        self.stream = stream
+        self.pending: Deque[Tuple[dict, Optional[Future]]] = deque()
+        self.window = STREAM_WINDOW * max(1, jobs)
+
+    def visit(self, obj: dict, depth: int):
+        typ = _type_name(obj)
+        if not typ:
             return
-        if isinstance(obj, dict):
-            typ = obj.get('_type', {}).get('_name', '')
-            if typ and typ != 'Array' and typ != 'String' and typ != 'Int' and typ != 'Double':
-                indent = '  ' * depth
-                extra = ''
-                name = obj.get('name', {}).get('_value', '')
-                if name:
-                    extra = f' name="{name}"'
-                status = obj.get('testStatus', {}).get('_value', '')
-                if status:
-                    extra += f' status={status}'
-                identifier = obj.get('identifier', {}).get('_value', '')
-                if identifier:
-                    extra += f' id={identifier}'
-                ref = obj.get('summaryRef', {}).get('id', {}).get('_value', '')
-                if ref:
-                    extra += f' ref={ref[:30]}...'
-                dur = obj.get('duration', {}).get('_value', '')
-                if dur:
-                    extra += f' dur={dur}s'
-                print(f'{indent}[{typ}]{extra}')
-            for k, v in obj.items():
-                if k.startswith('_'):
-                    continue
-                if isinstance(v, dict):
-                    show_types(v, depth + 1, max_depth)
-                elif isinstance(v, list):
-                    for item in v:
-                        show_types(item, depth + 1, max_depth)
-        elif isinstance(obj, list):
-            for item in obj:
-                show_types(item, depth, max_depth)
-
-    show_types(test_data)
-
-    def find_test_metadata(obj, depth=0):
-        if isinstance(obj, dict):
-            typ = obj.get('_type', {}).get('_name', '')
-            if typ == 'ActionTestMetadata':
-                name = obj.get('name', {}).get('_value', '')
-                status = obj.get('testStatus', {}).get('_value', '')
-                duration = obj.get('duration', {}).get('_value', '')
-                ref = obj.get('summaryRef', {}).get('id', {}).get('_value', '')
-                print(f"  TEST [{status}]: {name} ({duration}s) ref={ref}")
-                # Get detailed summary for this test
-                if ref:
-                    result3 = subprocess.run(
-                        ["xcrun", "xcresulttool", "get", "--legacy", "--format", "json",
-                         "--path", path, "--id", ref],
-                        capture_output=True, text=True
-                    )
-                    try:
-                        summary = json.loads(result3.stdout)
-                        find_failure_messages(summary)
-                    except:
-                        pass
-            for k, v in obj.items():
-                if not k.startswith('_'):
-                    find_test_metadata(v, depth + 1)
-        elif isinstance(obj, list):
-            for item in obj:
-                find_test_metadata(item, depth)
-
-    def find_failure_messages(obj):
-        if isinstance(obj, dict):
-            typ = obj.get('_type', {}).get('_name', '')
-            if typ == 'ActionTestActivitySummary':
-                title = obj.get('title', {}).get('_value', '')
-                if title and ('fail' in title.lower() or 'error' in title.lower()
-                              or 'exception' in title.lower() or 'assertion' in title.lower()):
-                    print(f"    ACTIVITY: {title[:300]}")
-            if typ == 'ActionTestFailureSummary':
-                msg = obj.get('message', {}).get('_value', '')
-                filename = obj.get('fileName', {}).get('_value', '')
-                line = obj.get('lineNumber', {}).get('_value', '')
-                print(f"    FAILURE: {msg[:300]}")
-                if filename:
-                    print(f"      at {filename}:{line}")
-            for k, v in obj.items():
-                if not k.startswith('_'):
-                    find_failure_messages(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                find_failure_messages(item)
-
-    find_test_metadata(test_data)
-else:
-    print("No testsRef found")
+        if typ not in SCALAR_TYPES and depth <= MAX_DUMP_DEPTH:
+            self.emitter.node(obj, typ, depth)
+        if typ == 'ActionTestMetadata':
+            self._report_test(obj)
+
+    def _report_test(self, obj: dict):
+        record = test_record(obj)
+        ref = record['ref']
+
+        if self.pool is not None:
+            future = self.pool.submit(load_summary, self.source, ref, self.cache) if ref else None
+            self.pending.append((record, future))
+            while len(self.pending) > self.window:
+                self._drain_one()
+            return
+
+        # Get detailed summary for this test
+        events: List[dict] = []
+        if ref:
+            if self.summaries is not None:
+                summary = self.summaries.get(ref)
+            elif self.stream:
+                events = stream_failure_messages(self.source, ref, self.cache)
+                summary = None
+            else:
+                summary = load_summary(self.source, ref, self.cache)
+            if summary is not None:
+                events = find_failure_messages(summary)
+        self.emitter.test(record, events)
+
+    def _drain_one(self):
+        record, future = self.pending.popleft()
+        summary = future.result() if future is not None else None
+        self.emitter.test(record, find_failure_messages(summary) if summary is not None else [])
+
+    def close(self):
+        while self.pending:
+            self._drain_one()
+
+
+def find_tests_ref(data: dict) -> Optional[str]:
+    """Return the last testsRef id among the bundle root's actions."""
+    tests_ref_id = None
+    for action in data.get('actions', {}).get('_values', []):
+        tr = action.get('actionResult', {}).get('testsRef', {}).get('id', {}).get('_value', '')
+        if tr:
+            tests_ref_id = tr
+    return tests_ref_id
+
+
+def test_record(obj: dict) -> Dict[str, Optional[str]]:
+    """Flatten an ActionTestMetadata node into name/identifier/status/duration/ref."""
+    duration = obj.get('duration', {}).get('_value', '')
+    try:
+        duration = float(duration)
+    except (TypeError, ValueError):
+        duration = None
+    return {
+        'name': obj.get('name', {}).get('_value', ''),
+        'identifier': obj.get('identifier', {}).get('_value', ''),
+        'status': obj.get('testStatus', {}).get('_value', ''),
+        'duration': duration,
+        'raw_duration': obj.get('duration', {}).get('_value', ''),
+        'ref': obj.get('summaryRef', {}).get('id', {}).get('_value', ''),
+    }
+
+
+def collect_tests(source: ResultSource, cache: Optional[SummaryCache] = None,
+                  stream: bool = False) -> Tuple[dict, List[dict]]:
+    """
+    Return (run, tests) for one bundle without printing anything.
+
+    `run` holds the action start time and metric counts from the bundle root;
+    `tests` holds one test_record() per ActionTestMetadata node. Only the root
+    and testsRef payloads are read, never per-test summaries. Raises
+    SourceError or ValueError (ijson.JSONError when streaming) if either
+    payload is missing or incomplete, so callers never see a truncated run.
+    """
+    data = json.loads(source.get())
+    metrics = data.get('metrics', {})
+    actions = data.get('actions', {}).get('_values', [])
+    run = {
+        'started': actions[0].get('startedTime', {}).get('_value', '') if actions else '',
+        'tests': metrics.get('testsCount', {}).get('_value'),
+        'failed': metrics.get('testsFailedCount', {}).get('_value'),
+    }
+
+    tests: List[dict] = []
+
+    def visit(obj: dict, depth: int):
+        if _type_name(obj) == 'ActionTestMetadata':
+            tests.append(test_record(obj))
+
+    tests_ref_id = find_tests_ref(data)
+    if tests_ref_id:
+        if stream and ijson is not None:
+            with open_payload_stream(source, tests_ref_id, cache) as fp:
+                stream_nodes(fp, visit)
+        else:
+            walk_nodes(json.loads(fetch_payload(source, tests_ref_id, cache)), visit)
+    return run, tests
+
+
+def summarise(source: ResultSource, cache: Optional[SummaryCache] = None,
+              batch: bool = False, stream: bool = False, jobs: int = 8, emitter=None):
+    """Report metrics, issues, actions, the structure dump and every test for one bundle."""
+    emitter = emitter if emitter is not None else TextEmitter(sys.stdout)
+
+    # Step 1: Get top-level data
+    data = json.loads(source.get())
+
+    # Metrics
+    metrics = data.get('metrics', {})
+    tests_count = metrics.get('testsCount', {}).get('_value', 'N/A')
+    failed_count = metrics.get('testsFailedCount', {}).get('_value', 'N/A')
+    emitter.metrics(tests_count, failed_count)
+
+    # Issues
+    issues = data.get('issues', {})
+    for k, v in issues.items():
+        if k.startswith('_'):
+            continue
+        vals = v.get('_values', []) if isinstance(v, dict) else []
+        for item in vals:
+            emitter.issue(k, item.get('message', {}).get('_value', ''))
+
+    # Find testsRef
+    actions = data.get('actions', {}).get('_values', [])
+    tests_ref_id = None
+    for action in actions:
+        title = action.get('title', {}).get('_value', '')
+        result_val = action.get('result', {}).get('_value', '')
+        ar = action.get('actionResult', {})
+        tr = ar.get('testsRef', {}).get('id', {}).get('_value', '')
+        emitter.action(title, result_val, tr)
+        if tr:
+            tests_ref_id = tr
+
+    # Step 2: Get test plan details via testsRef
+    if not tests_ref_id:
+        emitter.no_tests()
+        emitter.close()
+        return
+
+    # Structure dump and test extraction share a single walk of the tree
+    if stream:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) if batch else nullcontext() as pool:
+            reporter = TestReporter(source, cache, emitter, pool=pool, jobs=jobs, stream=True)
+            with open_payload_stream(source, tests_ref_id, cache) as fp:
+                stream_nodes(fp, reporter.visit)
+            reporter.close()
+    else:
+        test_data = json.loads(fetch_payload(source, tests_ref_id, cache))
+        summaries = None
+        if batch:
+            refs = collect_summary_refs(test_data)
+            summaries = fetch_summaries(source, refs, jobs, cache)
+        reporter = TestReporter(source, cache, emitter, summaries=summaries)
+        walk_nodes(test_data, reporter.visit)
+        reporter.close()
+    emitter.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarise an .xcresult bundle')
+    parser.add_argument('bundle', nargs='?', default=DEFAULT_BUNDLE,
+                        help='Path to the .xcresult bundle')
+    parser.add_argument('--batch', action='store_true',
+                        help='Fetch all test summaries up front through a worker pool')
+    parser.add_argument('--jobs', type=int, default=8,
+                        help='Worker count for --batch (default: 8)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Parse payloads incrementally from the xcresulttool pipe (requires ijson)')
+    parser.add_argument('--fixtures', action='store_true',
+                        help='Treat BUNDLE as a directory of JSON fixtures instead of an .xcresult bundle')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the local summary cache')
+    parser.add_argument('--format', choices=sorted(EMITTERS), default='text',
+                        help='Output format (default: text)')
+    parser.add_argument('--output', type=Path, default=None,
+                        help='Write the report here instead of stdout')
+    args = parser.parse_args()
+
+    if args.stream and ijson is None:
+        print("⚠️  ijson is not installed; --stream falls back to in-memory parsing", file=sys.stderr)
+        args.stream = False
+
+    source = FixtureSource(args.bundle) if args.fixtures else XcrunSource(args.bundle)
+    cache = None if args.no_cache else SummaryCache(DEFAULT_CACHE_DIR)
+    with open(args.output, 'w', encoding='utf-8') if args.output else nullcontext(sys.stdout) as out:
+        emitter = EMITTERS[args.format](out)
+        summarise(source, cache, batch=args.batch, stream=args.stream, jobs=args.jobs, emitter=emitter)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
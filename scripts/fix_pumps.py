@@ -1,30 +1,172 @@
+"""
+Codemod for integration tests: replace pumpAndSettle with the e2e helpers.
+
+Rewrites every matching Dart file in one pass per file: all rules are
+compiled into a single alternation, so each file is scanned once instead of
+once per rule. Files are processed in parallel, and files whose output is
+unchanged are not written. Line endings are preserved: rules match LF or
+CRLF, and inserted lines use the file's own line ending.
+
+Usage:
+    python scripts/fix_pumps.py integration_test/
+    python scripts/fix_pumps.py 'integration_test/**/*_test.dart' --dry-run
+    python scripts/fix_pumps.py integration_test/gmail_multi_account_test.dart
+"""
+
+import argparse
+import difflib
+import glob
+import os
 import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# (pattern, replacement) in priority order; where two rules match at the same
+# position the earlier one wins. Replacements may use the rule's own groups;
+# their "\n" is written as the file's line ending.
+RULES = [
+    # Add import for helpers (once)
+    (re.escape("import 'package:geolocator/geolocator.dart';") + r"(?!\r?\nimport 'e2e_helpers\.dart' as helpers;)",
+     "import 'package:geolocator/geolocator.dart';\nimport 'e2e_helpers.dart' as helpers;"),
+    # Replace app.main() + pumpAndSettle with robust pumping
+    (r"app\.main\(\);\r?\n\s*await tester\.pumpAndSettle\(const Duration\(seconds: \d+\)\);",
+     "app.main();\n      await helpers.testerPumpUntilFound(tester, find.text('Welcome to Ash Trail'));"),
+    # Replace remaining pumpAndSettle calls with simple pump
+    (re.escape('await tester.pumpAndSettle(const Duration(seconds: 3));'), 'await tester.pump(const Duration(seconds: 3));'),
+    (re.escape('await tester.pumpAndSettle(const Duration(seconds: 2));'), 'await tester.pump(const Duration(seconds: 2));'),
+    (re.escape('await tester.pumpAndSettle(const Duration(seconds: 1));'), 'await tester.pump(const Duration(seconds: 1));'),
+    (re.escape('await tester.pumpAndSettle();'), 'await tester.pump(const Duration(seconds: 2));'),
+]
+
+RULE_PATTERNS = [re.compile(pattern) for pattern, _ in RULES]
+COMBINED_PATTERN = re.compile('|'.join(f'(?P<r{i}>{pattern})' for i, (pattern, _) in enumerate(RULES)))
+
+
+def rewrite(content):
+    """Apply every rule in a single scan; return (new content, number of replacements)."""
+    count = 0
+    eol = '\r\n' if '\r\n' in content else '\n'
+
+    def replace(match):
+        nonlocal count
+        count += 1
+        rule = int(match.lastgroup[1:])
+        # Re-match with the rule's own pattern so its group numbers apply
+        return RULE_PATTERNS[rule].fullmatch(match.group()).expand(RULES[rule][1].replace('\n', eol))
+
+    return COMBINED_PATTERN.sub(replace, content), count
+
+
+def expand_targets(targets, pattern):
+    """
+    Files named directly, matched by globs, or under directories (filtered by pattern).
+
+    Returns (files, missing), where missing lists non-glob targets that are
+    neither a file nor a directory.
+    """
+    files = []
+    missing = []
+    for target in targets:
+        if glob.has_magic(target):
+            matches = [Path(p) for p in glob.glob(target, recursive=True)]
+        elif Path(target).is_dir():
+            matches = Path(target).rglob(pattern)
+        elif Path(target).is_file():
+            matches = [Path(target)]
+        else:
+            missing.append(target)
+            continue
+        files.extend(p for p in matches if p.is_file())
+    return sorted(set(files)), missing
+
+
+def process_file(args):
+    """Rewrite one file; returns (path, replacements, pumpAndSettle remaining, diff or None, error or None)."""
+    path, dry_run = args
+    try:
+        return (path, *_rewrite_file(path, dry_run), None)
+    except (UnicodeDecodeError, OSError) as e:
+        return path, 0, 0, None, str(e)
+
+
+def _rewrite_file(path, dry_run):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        original = f.read()
+
+    content, count = rewrite(original)
+    remaining = content.count('pumpAndSettle')
+    if content == original:
+        return 0, remaining, None
+
+    diff = None
+    if dry_run:
+        diff = ''.join(difflib.unified_diff(
+            original.splitlines(keepends=True), content.splitlines(keepends=True),
+            fromfile=f'a/{path}', tofile=f'b/{path}'))
+    else:
+        # Atomic rewrite keeping the file's permissions
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            shutil.copymode(path, tmp_name)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    return count, remaining, diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replace pumpAndSettle in integration tests with the e2e helpers')
+    parser.add_argument('targets', nargs='+', help='Files, directories or glob patterns (quote globs)')
+    parser.add_argument('--pattern', default='*.dart',
+                        help='File pattern used inside directories (default: *.dart)')
+    parser.add_argument('--dry-run', action='store_true', help='Print unified diffs instead of writing files')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    files, missing = expand_targets(args.targets, args.pattern)
+    for target in missing:
+        print(f'Error: {target}: no such file or directory', file=sys.stderr)
+    if not files:
+        print('No matching files')
+        return 1
+
+    work = [(path, args.dry_run) for path in files]
+    if args.jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(files))) as executor:
+            results = list(executor.map(process_file, work))
+    else:
+        results = [process_file(item) for item in work]
+
+    changed = 0
+    total = 0
+    failed = 0
+    for path, count, remaining, diff, error in results:
+        if error is not None:
+            failed += 1
+            print(f'Error: {path}: {error}', file=sys.stderr)
+            continue
+        if not count:
+            continue
+        changed += 1
+        total += count
+        if diff is not None:
+            sys.stdout.write(diff)
+        else:
+            print(f'Rewrote {path}: {count} replacement(s), {remaining} pumpAndSettle remaining')
+
+    action = 'Would rewrite' if args.dry_run else 'Rewrote'
+    print(f'Done: {action} {changed} of {len(files)} file(s), {total} replacement(s)')
+    if failed:
+        print(f'{failed} file(s) could not be processed', file=sys.stderr)
+    return 1 if missing or failed else 0
+
 
-filepath = sys.argv[1]
-with open(filepath, 'r') as f:
-    c = f.read()
-
-# Add import for helpers
-c = c.replace(
-    "import 'package:geolocator/geolocator.dart';",
-    "import 'package:geolocator/geolocator.dart';\nimport 'e2e_helpers.dart' as helpers;"
-)
-
-# Replace app.main() + pumpAndSettle with robust pumping
-c = re.sub(
-    r"app\.main\(\);\n\s*await tester\.pumpAndSettle\(const Duration\(seconds: \d+\)\);",
-    "app.main();\n      await helpers.testerPumpUntilFound(tester, find.text('Welcome to Ash Trail'));",
-    c
-)
-
-# Replace remaining pumpAndSettle calls with simple pump
-c = c.replace('await tester.pumpAndSettle(const Duration(seconds: 3));', 'await tester.pump(const Duration(seconds: 3));')
-c = c.replace('await tester.pumpAndSettle(const Duration(seconds: 2));', 'await tester.pump(const Duration(seconds: 2));')
-c = c.replace('await tester.pumpAndSettle(const Duration(seconds: 1));', 'await tester.pump(const Duration(seconds: 1));')
-c = c.replace('await tester.pumpAndSettle();', 'await tester.pump(const Duration(seconds: 2));')
-
-with open(filepath, 'w') as f:
-    f.write(c)
-
-print(f"Done: {c.count('testerPumpUntilFound')} testerPumpUntilFound, {c.count('pumpAndSettle')} pumpAndSettle remaining")
+if __name__ == '__main__':
+    sys.exit(main())
@@ -25,7 +25,7 @@ done
 echo "✅ Git hooks installed successfully!"
 echo ""
 echo "Installed hooks:"
-echo "  - pre-commit: Runs flutter analyze and flutter test"
+echo "  - pre-commit: Validates staged docs, runs flutter analyze and flutter test"
 echo "  - pre-push: Runs flutter build ios (for main/mvp branches)"
 echo ""
 echo "To skip hooks temporarily, use: git commit --no-verify"
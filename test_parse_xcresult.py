@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the parse_xcresult.py summary cache.
+
+Run with `python -m unittest test_parse_xcresult` (or pytest). Uses fixture
+bundles from bench_xcresult.py, so no Xcode is needed; streaming tests are
+skipped when ijson is not installed.
+"""
+
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import bench_xcresult
+import parse_xcresult as px
+
+# Every 5th synthetic test fails, starting with test 0
+FAILING_REF = '0~summary-000000'
+
+
+def failures(bundle: Path, cache: px.SummaryCache, stream: bool) -> list:
+    out = io.StringIO()
+    px.summarise(px.FixtureSource(str(bundle)), cache, stream=stream, emitter=px.JsonLinesEmitter(out))
+    return [line for line in out.getvalue().splitlines() if '"type": "failure"' in line]
+
+
+class _FailingXcrunSource(px.XcrunSource):
+    """XcrunSource whose xcresulttool prints a fixture and then exits 1."""
+
+    def __init__(self, fixture: Path):
+        super().__init__(str(fixture.parent))
+        self.fixture = fixture
+
+    def _cmd(self, ref_id):
+        return [sys.executable, '-c',
+                f"import sys; sys.stdout.buffer.write(open({str(self.fixture)!r}, 'rb').read()); sys.exit(1)"]
+
+
+class SummaryCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.bundle = bench_xcresult.write_synthetic_bundle(Path(tmp.name) / 'bundle', 10, failure_rate=0.2)
+        self.cache = px.SummaryCache(Path(tmp.name) / 'cache')
+        self.expected = failures(self.bundle, None, stream=False)
+        self.assertTrue(self.expected)
+
+    def _check_missing_then_restored(self, stream: bool):
+        fixture = self.bundle / f"{FAILING_REF}.json"
+        saved = fixture.read_bytes()
+        fixture.unlink()
+        self.assertLess(len(failures(self.bundle, self.cache, stream=stream)), len(self.expected))
+
+        fixture.write_bytes(saved)
+        self.assertEqual(failures(self.bundle, self.cache, stream=stream), self.expected)
+        self.assertEqual(failures(self.bundle, self.cache, stream=not stream), self.expected)
+
+    def test_missing_fixture_not_cached(self):
+        self._check_missing_then_restored(stream=False)
+
+    @unittest.skipIf(px.ijson is None, 'ijson is not installed')
+    def test_missing_fixture_not_cached_when_streaming(self):
+        self._check_missing_then_restored(stream=True)
+
+    @unittest.skipIf(px.ijson is None, 'ijson is not installed')
+    def test_invalid_json_not_cached_when_streaming(self):
+        source = px.FixtureSource(str(self.bundle))
+        (self.bundle / f"{FAILING_REF}.json").write_text('{"_type": {', encoding='utf-8')
+        self.assertEqual(px.stream_failure_messages(source, FAILING_REF, self.cache), [])
+        self.assertIsNone(self.cache.lookup(source.key, FAILING_REF))
+
+    @unittest.skipIf(px.ijson is None, 'ijson is not installed')
+    def test_failed_xcresulttool_not_cached_when_streaming(self):
+        source = _FailingXcrunSource(self.bundle / f"{FAILING_REF}.json")
+        self.assertTrue(px.stream_failure_messages(source, FAILING_REF, self.cache))
+        self.assertIsNone(self.cache.lookup(source.key, FAILING_REF))
+
+    @unittest.skipIf(px.ijson is None, 'ijson is not installed')
+    def test_complete_stream_is_cached(self):
+        source = px.FixtureSource(str(self.bundle))
+        events = px.stream_failure_messages(source, FAILING_REF, self.cache)
+        self.assertTrue(events)
+        self.assertIsNotNone(self.cache.lookup(source.key, FAILING_REF))
+        self.assertEqual(px.stream_failure_messages(source, FAILING_REF, self.cache), events)
+
+    def test_empty_legacy_entry_is_a_miss(self):
+        source = px.FixtureSource(str(self.bundle))
+        entry = self.cache._entry(source.key, FAILING_REF)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        entry.write_bytes(b'')
+        self.assertIsNone(self.cache.lookup(source.key, FAILING_REF))
+        self.assertEqual(failures(self.bundle, self.cache, stream=False), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
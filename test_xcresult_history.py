@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Regression tests for xcresult_history.py ingestion.
+
+Run with `python -m unittest test_xcresult_history` (or pytest). Uses fixture
+bundles from bench_xcresult.py, so no Xcode is needed.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import bench_xcresult
+import parse_xcresult as px
+import xcresult_history as history
+
+TESTS_REF = '0~tests-ref'
+
+
+class _FailingXcrunSource(px.XcrunSource):
+    """XcrunSource whose xcresulttool prints the fixture for an id and then exits 1."""
+
+    def __init__(self, bundle: Path):
+        super().__init__(str(bundle))
+        self.fixtures = bundle
+
+    def get(self, ref_id=None):
+        # The root loads fine; only the streamed testsRef fails
+        return (self.fixtures / px.FixtureSource.ROOT).read_text(encoding='utf-8')
+
+    def _cmd(self, ref_id):
+        fixture = self.fixtures / f"{ref_id}.json"
+        return [sys.executable, '-c',
+                f"import sys; sys.stdout.buffer.write(open({str(fixture)!r}, 'rb').read()); sys.exit(1)"]
+
+
+class IngestTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.bundle = bench_xcresult.write_synthetic_bundle(Path(tmp.name) / 'bundle', 10, failure_rate=0.2)
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.executescript(history.SCHEMA)
+
+    def _counts(self):
+        return (self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0],
+                self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0])
+
+    def _check_skipped_then_retried(self, damage):
+        fixture = self.bundle / f"{TESTS_REF}.json"
+        saved = fixture.read_bytes()
+        damage(fixture, saved)
+        self.assertEqual(history.ingest(self.conn, [str(self.bundle)], fixtures=True, jobs=1), 0)
+        self.assertEqual(self._counts(), (0, 0))
+
+        # Not recorded as ingested, so the next run picks it up
+        fixture.write_bytes(saved)
+        self.assertEqual(history.ingest(self.conn, [str(self.bundle)], fixtures=True, jobs=1), 1)
+        self.assertEqual(self._counts(), (1, 10))
+
+    def test_missing_summary_is_not_ingested(self):
+        self._check_skipped_then_retried(lambda fixture, saved: fixture.unlink())
+
+    def test_truncated_summary_is_not_ingested(self):
+        self._check_skipped_then_retried(lambda fixture, saved: fixture.write_bytes(saved[:len(saved) // 2]))
+
+    def test_duplicate_paths_ingest_once(self):
+        paths = [str(self.bundle), str(self.bundle) + '/']
+        self.assertEqual(history.ingest(self.conn, paths, fixtures=True, jobs=1), 1)
+        self.assertEqual(self._counts(), (1, 10))
+
+    @unittest.skipIf(px.ijson is None, 'ijson is not installed')
+    def test_failed_xcresulttool_stream_raises(self):
+        source = _FailingXcrunSource(self.bundle)
+        for cache in (None, px.SummaryCache(Path(self.bundle.parent) / 'cache')):
+            with self.assertRaises(px.SourceError):
+                px.collect_tests(source, cache, stream=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
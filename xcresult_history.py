@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Aggregate many .xcresult bundles into a SQLite history of per-test results.
+
+Bundles are parsed in parallel with a process pool (only the root and
+testsRef payloads are read, never per-test summaries) and written as one row
+per test per run. Queries over the history then run against indexed tables
+instead of re-parsing bundles.
+
+Usage:
+    python xcresult_history.py ingest [BUNDLE ...] [--fixtures] [--jobs N] [--db DB]
+    python xcresult_history.py p95 [--runs 200] [--test SUBSTRING] [--db DB]
+    python xcresult_history.py flaky [--runs 200] [--db DB]
+    python xcresult_history.py regress [BUNDLE] [--fixtures] [--baseline-runs 20]
+                                       [--threshold 3.5] [--min-increase 0.2] [--db DB]
+
+Examples:
+    # Ingest every bundle left behind by scripts/run_all_e2e.sh
+    python xcresult_history.py ingest build/*.xcresult
+
+    # p95 duration per test over the last 200 runs
+    python xcresult_history.py p95 --runs 200
+
+    # Tests whose status flipped between pass and fail
+    python xcresult_history.py flaky
+
+    # Compare a fresh bundle against the rolling baseline (exit 1 on regressions)
+    python xcresult_history.py regress build/ios_results_1770680852004.xcresult
+
+Regression detection compares each test's duration against the median and
+MAD (median absolute deviation) of its last N ingested runs. A test regresses
+when its robust z-score (duration - median) / (1.4826 * MAD) exceeds
+--threshold and it is also at least --min-increase slower than the median,
+so tests with near-constant durations do not trip on noise.
+"""
+
+import argparse
+import glob
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import parse_xcresult as px
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+DEFAULT_DB = PROJECT_ROOT / 'build' / 'xcresult_history.sqlite'
+DEFAULT_BUNDLES = str(PROJECT_ROOT / 'build' / '*.xcresult')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    bundle TEXT NOT NULL UNIQUE,
+    started_at REAL NOT NULL,
+    tests INTEGER,
+    failed INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_results_test ON results(test, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+"""
+
+# The most recent N runs, newest first
+RECENT_RUNS = "SELECT id FROM runs ORDER BY started_at DESC LIMIT ?"
+
+# Nearest-rank p95 per test via window functions (SQLite 3.25+)
+P95_QUERY = f"""
+WITH ranked AS (
+    SELECT test, duration,
+           ROW_NUMBER() OVER (PARTITION BY test ORDER BY duration) AS rn,
+           COUNT(*) OVER (PARTITION BY test) AS n
+    FROM results
+    WHERE run_id IN ({RECENT_RUNS}) AND duration IS NOT NULL AND test LIKE ?
+)
+SELECT test, n, duration FROM ranked
+WHERE rn = MAX(1, (95 * n + 99) / 100)
+ORDER BY duration DESC
+"""
+
+# Pass/fail transitions per test in run order
+FLAKY_QUERY = f"""
+WITH seq AS (
+    SELECT r.test, r.status,
+           LAG(r.status) OVER (PARTITION BY r.test ORDER BY runs.started_at) AS prev
+    FROM results r JOIN runs ON runs.id = r.run_id
+    WHERE r.run_id IN ({RECENT_RUNS}) AND r.status IN ('Success', 'Failure')
+)
+SELECT test,
+       SUM(prev IS NOT NULL AND status != prev) AS flips,
+       COUNT(*) AS runs,
+       SUM(status = 'Failure') AS failures
+FROM seq
+GROUP BY test
+HAVING flips > 0
+ORDER BY flips DESC, failures DESC
+"""
+
+# Durations of each test over the N most recent runs started before a cutoff
+BASELINE_QUERY = """
+WITH ranked AS (
+    SELECT r.test, r.duration,
+           ROW_NUMBER() OVER (PARTITION BY r.test ORDER BY runs.started_at DESC) AS rn
+    FROM results r JOIN runs ON runs.id = r.run_id
+    WHERE runs.started_at < ? AND r.duration IS NOT NULL AND r.status = 'Success'
+)
+SELECT test, duration FROM ranked WHERE rn <= ?
+"""
+
+# Floor for the MAD-based scale, as a fraction of the median, so that a
+# perfectly stable baseline (MAD == 0) does not make every change infinite
+MIN_SCALE_FRACTION = 0.05
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _started_at(started: str, bundle: str) -> float:
+    """Parse the action start time, falling back to the bundle's mtime."""
+    if started:
+        try:
+            return datetime.fromisoformat(started.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+    return os.path.getmtime(bundle)
+
+
+def parse_bundle(bundle: str, fixtures: bool = False) -> Tuple[str, float, dict, List[tuple]]:
+    """Worker: return (bundle key, start time, run counts, result rows) for one bundle."""
+    source = px.FixtureSource(bundle) if fixtures else px.XcrunSource(bundle)
+    run, tests = px.collect_tests(source, stream=px.ijson is not None)
+    rows = [(t['identifier'] or t['name'], t['status'], t['duration']) for t in tests]
+    return source.key, _started_at(run['started'], bundle), run, rows
+
+
+def _int_or_none(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def ingest(conn: sqlite3.Connection, bundles: List[str], fixtures: bool, jobs: int) -> int:
+    """Parse bundles not yet in the history in parallel and store their results."""
+    known = {row[0] for row in conn.execute("SELECT bundle FROM runs")}
+    # Overlapping globs or `path` plus `path/` name the same bundle twice
+    unique = list(dict.fromkeys(os.path.abspath(b) for b in bundles))
+    pending = [b for b in unique if b not in known]
+    skipped = len(unique) - len(pending)
+    if skipped:
+        print(f"Skipping {skipped} already ingested bundle(s)")
+    if not pending:
+        return 0
+
+    ingested = 0
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {pool.submit(parse_bundle, b, fixtures): b for b in pending}
+        for future, bundle in futures.items():
+            try:
+                key, started_at, run, rows = future.result()
+            except Exception as e:
+                print(f"⚠️  Failed to parse {bundle}: {e}", file=sys.stderr)
+                continue
+            with conn:
+                cur = conn.execute(
+                    "INSERT OR IGNORE INTO runs (bundle, started_at, tests, failed) VALUES (?, ?, ?, ?)",
+                    (key, started_at, _int_or_none(run['tests']), _int_or_none(run['failed']))
+                )
+                if cur.rowcount == 0:
+                    print(f"⚠️  Skipping {bundle}: already ingested", file=sys.stderr)
+                    continue
+                conn.executemany(
+                    "INSERT INTO results (run_id, test, status, duration) VALUES (?, ?, ?, ?)",
+                    [(cur.lastrowid, *row) for row in rows]
+                )
+            ingested += 1
+            print(f"Ingested: {Path(bundle).name} ({len(rows)} tests)")
+    return ingested
+
+
+def find_regressions(baseline: Dict[str, List[float]], candidate: Dict[str, float],
+                     threshold: float, min_increase: float, min_samples: int) -> List[tuple]:
+    """Return (test, duration, median, mad, score) for tests slower than their baseline."""
+    regressions = []
+    for test, duration in candidate.items():
+        samples = baseline.get(test, [])
+        if len(samples) < min_samples:
+            continue
+        median = statistics.median(samples)
+        mad = statistics.median(abs(d - median) for d in samples)
+        scale = max(1.4826 * mad, median * MIN_SCALE_FRACTION, 1e-9)
+        score = (duration - median) / scale
+        if score > threshold and duration >= median * (1 + min_increase):
+            regressions.append((test, duration, median, mad, score))
+    regressions.sort(key=lambda r: r[4], reverse=True)
+    return regressions
+
+
+def load_candidate(conn: sqlite3.Connection, bundle: Optional[str],
+                   fixtures: bool) -> Tuple[str, float, Dict[str, float]]:
+    """Durations of passing tests from `bundle`, or from the latest ingested run."""
+    if bundle:
+        key, started_at, _, rows = parse_bundle(bundle, fixtures)
+    else:
+        latest = conn.execute("SELECT id, bundle, started_at FROM runs ORDER BY started_at DESC LIMIT 1").fetchone()
+        if latest is None:
+            return '', 0.0, {}
+        run_id, key, started_at = latest
+        rows = conn.execute("SELECT test, status, duration FROM results WHERE run_id = ?", (run_id,)).fetchall()
+    durations = {test: duration for test, status, duration in rows
+                 if status == 'Success' and duration is not None}
+    return key, started_at, durations
+
+
+def expand_bundles(patterns: List[str]) -> List[str]:
+    bundles = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        bundles.extend(matches if matches else [pattern])
+    return [b for b in bundles if os.path.exists(b)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Aggregate xcresult bundles into a queryable per-test history',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--db', type=Path, default=DEFAULT_DB,
+                        help=f'History database (default: {DEFAULT_DB.relative_to(PROJECT_ROOT)})')
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    ingest_parser = subparsers.add_parser('ingest', help='Parse bundles into the history database')
+    ingest_parser.add_argument('bundles', nargs='*', default=[DEFAULT_BUNDLES],
+                               help='Bundle paths or glob patterns (default: build/*.xcresult)')
+    ingest_parser.add_argument('--fixtures', action='store_true',
+                               help='Bundles are fixture directories (see parse_xcresult.py --fixtures)')
+    ingest_parser.add_argument('--jobs', type=int, default=os.cpu_count() or 4,
+                               help='Parser processes (default: CPU count)')
+
+    p95_parser = subparsers.add_parser('p95', help='p95 duration per test over recent runs')
+    p95_parser.add_argument('--runs', type=int, default=200, help='Number of recent runs (default: 200)')
+    p95_parser.add_argument('--test', default='', help='Only tests containing this substring')
+
+    flaky_parser = subparsers.add_parser('flaky', help='Tests with pass/fail flips over recent runs')
+    flaky_parser.add_argument('--runs', type=int, default=200, help='Number of recent runs (default: 200)')
+
+    regress_parser = subparsers.add_parser('regress', help='Report tests slower than their rolling baseline')
+    regress_parser.add_argument('bundle', nargs='?', default=None,
+                                help='Bundle to check (default: latest ingested run)')
+    regress_parser.add_argument('--fixtures', action='store_true',
+                                help='BUNDLE is a fixture directory')
+    regress_parser.add_argument('--baseline-runs', type=int, default=20,
+                                help='Baseline window in runs (default: 20)')
+    regress_parser.add_argument('--min-samples', type=int, default=5,
+                                help='Minimum baseline samples per test (default: 5)')
+    regress_parser.add_argument('--threshold', type=float, default=3.5,
+                                help='Robust z-score threshold (default: 3.5)')
+    regress_parser.add_argument('--min-increase', type=float, default=0.2,
+                                help='Minimum slowdown relative to the median (default: 0.2)')
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return 0
+
+    conn = connect(args.db)
+
+    if args.command == 'ingest':
+        bundles = expand_bundles(args.bundles)
+        if not bundles:
+            print(f"No bundles found matching: {', '.join(args.bundles)}")
+            return 0
+        count = ingest(conn, bundles, args.fixtures, args.jobs)
+        print(f"\n✓ Ingested {count} bundle(s) into {args.db}")
+        return 0
+
+    if args.command == 'regress':
+        key, started_at, candidate = load_candidate(conn, args.bundle, args.fixtures)
+        if not candidate:
+            print("No passing tests with durations to check")
+            return 0
+        baseline: Dict[str, List[float]] = {}
+        for test, duration in conn.execute(BASELINE_QUERY, (started_at, args.baseline_runs)):
+            baseline.setdefault(test, []).append(duration)
+        regressions = find_regressions(baseline, candidate, args.threshold,
+                                       args.min_increase, args.min_samples)
+
+        print(f"🔍 Checking {len(candidate)} test(s) from {Path(key).name} "
+              f"against the previous {args.baseline_runs} run(s)")
+        if not regressions:
+            print("✅ No duration regressions")
+            return 0
+        print(f"\n❌ {len(regressions)} test(s) regressed\n")
+        print(f"{'now (s)':>9}{'median':>9}{'MAD':>7}{'score':>8}  test")
+        for test, duration, median, mad, score in regressions:
+            print(f"{duration:>9.2f}{median:>9.2f}{mad:>7.2f}{score:>8.1f}  {test}")
+        return 1
+
+    start = time.perf_counter()
+    if args.command == 'p95':
+        rows = conn.execute(P95_QUERY, (args.runs, f"%{args.test}%")).fetchall()
+        print(f"{'p95 (s)':>10}{'samples':>9}  test")
+        for test, samples, p95 in rows:
+            print(f"{p95:>10.2f}{samples:>9}  {test}")
+    elif args.command == 'flaky':
+        rows = conn.execute(FLAKY_QUERY, (args.runs,)).fetchall()
+        print(f"{'flips':>6}{'fails':>7}{'runs':>6}  test")
+        for test, flips, runs, failures in rows:
+            print(f"{flips:>6}{failures:>7}{runs:>6}  {test}")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n{len(rows)} test(s) over the last {args.runs} run(s) in {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())